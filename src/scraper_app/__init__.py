@@ -8,7 +8,12 @@ from .exceptions import (
 from . import config
 
 # ocr_image: Extract text from images using OCR
-from .ocr import ocr_image
+# ocr_image_bytes: OCR an encoded image held in memory
+# ocr_images_batch: OCR several images with one Tesseract invocation per batch
+# ocr_images_parallel: OCR several images concurrently on a thread pool
+# Loaded on first access (see __getattr__ below): importing ocr pulls in PIL, pytesseract
+# and OpenCV, which runs that never OCR anything shouldn't pay for at import time.
+_LAZY_OCR_EXPORTS = ('ocr_image', 'ocr_image_bytes', 'ocr_images_batch', 'ocr_images_parallel')
 
 # download_image: Download images with retry logic and error handling
 # get_safe_filename: Convert URLs to safe, unique filenames
@@ -24,16 +29,27 @@ from .retry import retry_with_backoff
 from .logging_utils import configure_logging, debug, info, warning, error, critical
 
 # scrape_page: Main function to scrape a webpage and extract text/images
-from .scraper import scrape_page
+# iter_ocr_results: Read back the per-image OCR records saved for a page
+from .scraper import scrape_page, iter_ocr_results
 
 # URL processing functions
 from .url_processor import process_pending_urls_loop
 
-from typing import List
+from typing import Any, List
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_OCR_EXPORTS:
+        from . import ocr
+        return getattr(ocr, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__: List[str] = [
     'scrape_page',           # Main function to scrape a webpage and extract text/images
+    'iter_ocr_results',      # Read back the per-image OCR records saved for a page
     'ocr_image',             # Extract text from images using OCR
+    'ocr_image_bytes',       # OCR an encoded image held in memory
+    'ocr_images_batch',      # OCR several images with one Tesseract invocation per batch
+    'ocr_images_parallel',   # OCR several images concurrently on a thread pool
     'download_image',        # Download images with retry logic and error handling
     'get_safe_filename',     # Convert URLs to safe, unique filenames
     'config',                # Configuration constants and directory management
@@ -33,17 +33,83 @@ SCRAPER_SOURCE_FROM_DB: bool = os.getenv('SCRAPER_SOURCE_FROM_DB', 'False').lowe
 SCRAPER_DB_NUM_URLS: int = int(os.getenv('SCRAPER_DB_NUM_URLS', '10'))
 SCRAPER_DB_RANGE: str = os.getenv('SCRAPER_DB_RANGE', "") # e.g., "0-100"
 SCRAPER_DB_PENDING_BATCH_SIZE: int = int(os.getenv('SCRAPER_DB_PENDING_BATCH_SIZE', '10'))
+# Number of buffered page inserts / status updates to accumulate before writing them in one batch
+SCRAPER_DB_WRITE_BATCH_SIZE: int = int(os.getenv('SCRAPER_DB_WRITE_BATCH_SIZE', '500'))
+
+# Number of URLs scraped concurrently from the main URL list (1 = sequential)
+SCRAPER_MAX_WORKERS: int = int(os.getenv('SCRAPER_MAX_WORKERS', '1'))
+
+# In 'ocr'/'both' mode, wait (up to 5s) for the network to go idle after DOMContentLoaded so
+# late/lazy-loaded images are in the page; slow on ad- and tracker-heavy sites, so off by default
+WAIT_NETWORK_IDLE: bool = os.getenv('SCRAPER_WAIT_NETWORK_IDLE', 'False').lower() == 'true'
 
 # --- Original settings will follow this block ---
 # Timeout in seconds for image download requests
 IMAGE_DOWNLOAD_TIMEOUT: int = int(os.getenv('SCRAPER_IMAGE_TIMEOUT', '10'))
 
+# Connections kept open by the shared image-download HTTP client (see http_client.py)
+HTTP_MAX_CONNECTIONS: int = int(os.getenv('SCRAPER_HTTP_MAX_CONNECTIONS', '32'))
+
+# User-Agent sent with image downloads; some CDNs reject the default python-httpx agent
+HTTP_USER_AGENT: str = os.getenv(
+    'SCRAPER_HTTP_USER_AGENT',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36'
+)
+
+# Images larger than this many bytes are not downloaded (checked against Content-Length and
+# while streaming; partial files are removed). 0 disables the limit
+IMAGE_MAX_BYTES: int = int(os.getenv('SCRAPER_IMAGE_MAX_BYTES', str(20 * 1024 * 1024)))
+
 # Number of retry attempts if image download fails
 IMAGE_RETRY_COUNT: int = int(os.getenv('SCRAPER_IMAGE_RETRY_COUNT', '3'))
 
 # Delay (in seconds) between image download retries
 IMAGE_RETRY_DELAY: int = int(os.getenv('SCRAPER_IMAGE_RETRY_DELAY', '1'))
 
+# Number of a page's images downloaded concurrently
+IMAGE_DOWNLOAD_WORKERS: int = int(os.getenv('SCRAPER_IMAGE_DOWNLOAD_WORKERS', '8'))
+
+# <img> elements at most this many pixels wide or high (natural size once loaded, else the width/height
+# attributes) are not downloaded or OCR'd: tracking pixels, spacers, icons. 0 (the default) disables
+# the filter; e.g. 16 skips most such images.
+IMAGE_MIN_DIMENSION: int = int(os.getenv('SCRAPER_IMAGE_MIN_DIMENSION', '0'))
+
+# Maximum number of images passed to a single Tesseract invocation by ocr_images_batch
+OCR_BATCH_SIZE: int = int(os.getenv('SCRAPER_OCR_BATCH_SIZE', '50'))
+
+# Threads used by ocr_images_parallel to OCR a page's images (1 = batched, single process)
+OCR_MAX_WORKERS: int = int(os.getenv('SCRAPER_OCR_MAX_WORKERS', '4'))
+
+# Run ocr_images_parallel's workers as separate processes instead of threads (useful with tesserocr,
+# whose in-process engine serializes threads); each worker is recycled after OCR_WORKER_MAX_TASKS images
+OCR_USE_PROCESSES: bool = os.getenv('SCRAPER_OCR_USE_PROCESSES', 'False').lower() == 'true'
+OCR_WORKER_MAX_TASKS: int = int(os.getenv('SCRAPER_OCR_WORKER_MAX_TASKS', '50'))
+
+# Maximum number of OCR results kept in the in-process content-hash cache (0 disables it)
+OCR_CACHE_SIZE: int = int(os.getenv('SCRAPER_OCR_CACHE_SIZE', '4096'))
+
+# Binarize preprocessed images with Otsu's threshold before OCR
+OCR_USE_OTSU: bool = os.getenv('SCRAPER_OCR_USE_OTSU', 'True').lower() == 'true'
+
+# Images whose longer side exceeds this many pixels are downscaled to it before OCR, since
+# Tesseract's run time grows with pixel count (0 disables)
+OCR_MAX_DIMENSION: int = int(os.getenv('SCRAPER_OCR_MAX_DIMENSION', '2500'))
+
+# Preprocessed images larger than a 3:4 tile of this height are OCR'd tile by tile (top to
+# bottom, left to right) and the texts joined; Tesseract's layout analysis slows down and
+# degrades on screenshot-sized inputs (0 disables tiling)
+OCR_TILE_MAX_DIMENSION: int = int(os.getenv('SCRAPER_OCR_TILE_MAX_DIMENSION', '0'))
+
+# Use CLAHE (local adaptive contrast) instead of the global contrast stretch; helps on unevenly
+# lit images (needs OpenCV; ignored on the PIL-only path)
+OCR_USE_CLAHE: bool = os.getenv('SCRAPER_OCR_USE_CLAHE', 'False').lower() == 'true'
+
+# Straighten rotated text before OCR (needs OpenCV; ignored on the PIL-only path)
+OCR_DESKEW: bool = os.getenv('SCRAPER_OCR_DESKEW', 'False').lower() == 'true'
+
+# With fast_processing, images whose edge density (mean of a 0/255 edge map) is below this skip OCR
+OCR_SKIP_THRESHOLD: float = float(os.getenv('SCRAPER_OCR_SKIP_THRESHOLD', '2.0'))
+
 # Rate limiting configuration
 MAX_REQUESTS_PER_SECOND: float = float(os.getenv('SCRAPER_MAX_REQUESTS_PER_SECOND', '2.0'))
 RATE_LIMIT_BURST: int = int(os.getenv('SCRAPER_RATE_LIMIT_BURST', '5'))  # Maximum burst of requests allowed
@@ -54,6 +120,8 @@ SCRAPE_INITIAL_DELAY: float = float(os.getenv('SCRAPER_INITIAL_DELAY', '1.0'))
 SCRAPE_BACKOFF_FACTOR: float = float(os.getenv('SCRAPER_BACKOFF_FACTOR', '2.0'))
 SCRAPE_MAX_DELAY: float = float(os.getenv('SCRAPER_MAX_DELAY', '60.0'))
 SCRAPE_RETRY_JITTER: bool = os.getenv('SCRAPER_RETRY_JITTER', 'True').lower() == 'true'
+SCRAPE_TOTAL_TIMEOUT: float = float(os.getenv('SCRAPER_TOTAL_TIMEOUT', '0'))  # Seconds for all attempts of one page; 0 = no limit
+SCRAPE_RETRY_JITTER_STRATEGY: str = os.getenv('SCRAPER_RETRY_JITTER_STRATEGY', 'full')  # 'full', 'decorrelated' or 'equal'
 
 # Default file extension for images when no extension is found in URL
 DEFAULT_IMAGE_EXTENSION = ".jpg"
@@ -97,6 +165,11 @@ DB_PORT = int(os.getenv('DB_PORT', '5432'))
 DB_NAME = os.getenv('DB_NAME', 'scraper_db')
 DB_USER = os.getenv('DB_USER', 'scraper_user')
 DB_PASSWORD = os.getenv('DB_PASSWORD', 'scraper_password')
+# PostgreSQL synchronous_commit for the scraper's sessions (default 'on': fully durable).
+# Opt in to 'off' to skip waiting for the WAL flush on each of the many small log commits;
+# a server crash can then lose the last few commits (status updates included, so finished
+# URLs may be scraped again) but never corrupts them.
+DB_SYNCHRONOUS_COMMIT = os.getenv('DB_SYNCHRONOUS_COMMIT', 'on')
 def initialize_run_directory(run_name: Optional[str] = None) -> Path:
     """Initialize a new run directory with timestamp and optional name.
     
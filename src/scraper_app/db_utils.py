@@ -1,7 +1,7 @@
 import psycopg2
 import psycopg2.extras
 import logging
-from typing import Optional, List, Tuple, Any
+from typing import Optional, Dict, Iterator, List, Set, Tuple, Any
 
 from . import config
 
@@ -22,7 +22,9 @@ def get_db_connection() -> Optional[psycopg2.extensions.connection]:
             port=config.DB_PORT,
             dbname=config.DB_NAME,
             user=config.DB_USER,
-            password=config.DB_PASSWORD
+            password=config.DB_PASSWORD,
+            # Session-level commit durability; 'off' returns from COMMIT before the WAL flush
+            options=f"-c synchronous_commit={config.DB_SYNCHRONOUS_COMMIT}"
         )
         logging.info("Successfully connected to the database.")
         return conn
@@ -248,6 +250,61 @@ def fetch_pending_urls(limit: int = 10) -> List[Tuple[str, Optional[str], str]]:
             conn.close()
     return results
 
+def iter_pending_urls(limit: int = 10, batch_size: int = 50) -> Iterator[Tuple[str, Optional[str], str]]:
+    """
+    Streaming version of fetch_pending_urls: yields pending URLs batch_size at a time, so
+    callers can start work on the first URLs before the rest have been read.
+
+    Each batch is read by its own short query (keyset-paged on scraping_date, log_id) on a
+    connection that is closed again straight away, so no transaction stays open while the
+    caller works through the rows, however long that takes.
+
+    Args:
+        limit (int): The maximum number of pending URLs to fetch.
+        batch_size (int): Rows fetched per query.
+
+    Yields:
+        Tuple[str, Optional[str], str]: (log_id, client_id, url_scraped), oldest first.
+    """
+    logging.debug(f"Streaming up to {limit} pending URLs from scraping_logs.")
+    count = 0
+    last_key: Optional[Tuple[Any, Any]] = None
+    while count < limit:
+        conn = get_db_connection()
+        if not conn:
+            return
+        rows: List[Any] = []
+        try:
+            with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
+                cur.execute(
+                    """
+                    SELECT log_id, client_id, url_scraped, scraping_date
+                    FROM scraping_logs 
+                    WHERE status = 'pending'
+                      AND (%s OR (scraping_date, log_id) > (%s, %s))
+                    ORDER BY scraping_date ASC, log_id ASC -- Process older pending items first
+                    LIMIT %s;
+                    """,
+                    (
+                        last_key is None, last_key[0] if last_key else None, last_key[1] if last_key else None,
+                        min(max(1, batch_size), limit - count)
+                    )
+                )
+                rows = cur.fetchall()
+            conn.commit() # End the read transaction before handing out any rows
+        except psycopg2.Error as e:
+            logging.error(f"Database error while streaming pending URLs (after {count} rows): {e}")
+            return
+        finally:
+            conn.close()
+        if not rows:
+            break
+        last_key = (rows[-1]['scraping_date'], rows[-1]['log_id'])
+        for row in rows:
+            count += 1
+            yield str(row['log_id']), str(row['client_id']) if row['client_id'] else None, row['url_scraped']
+    logging.info(f"Streamed {count} pending URLs from scraping_logs.")
+
 def update_scraping_log_status(log_id: str, status: str, error_message: Optional[str] = None) -> bool:
     """
     Updates the status of a specific log entry in the scraping_logs table.
@@ -358,4 +415,167 @@ def insert_scraped_page_data(
     finally:
         if conn:
             conn.close()
-    return page_id_val
\ No newline at end of file
+    return page_id_val
+
+def write_scrape_results_many(
+    inserts: List[Tuple[Optional[str], str, str, Optional[str], Optional[str], Optional[str], Optional[str]]],
+    statuses: List[Tuple[str, Optional[str], str]]
+) -> bool:
+    """
+    Inserts a batch of scraped_pages records and applies a batch of scraping_logs status
+    updates in one transaction, so a URL is never marked 'completed' without its page row.
+
+    Args:
+        inserts: (client_id, url, page_type, raw_html_path, plain_text_path, summary, extraction_notes)
+            tuples, in the same order as insert_scraped_page_data's parameters.
+        statuses: (status, error_message, log_id) tuples, in the same shape as
+            update_scraping_log_status's parameters.
+
+    Returns:
+        bool: True if every row was written, False if nothing was (the transaction is rolled back).
+    """
+    if not inserts and not statuses:
+        return True
+    logging.debug(f"Writing {len(inserts)} scraped page records and {len(statuses)} status updates in one transaction.")
+    conn = get_db_connection()
+    if not conn:
+        return False
+
+    success = False
+    try:
+        with conn.cursor() as cur:
+            if inserts:
+                psycopg2.extras.execute_batch(
+                    cur,
+                    """
+                    INSERT INTO scraped_pages (
+                        page_id, client_id, url, page_type, scraped_at,
+                        raw_html_path, plain_text_path, summary, extraction_notes
+                    ) VALUES (
+                        gen_random_uuid(), %s, %s, %s, NOW(),
+                        %s, %s, %s, %s
+                    );
+                    """,
+                    inserts
+                )
+            if statuses:
+                psycopg2.extras.execute_batch(
+                    cur,
+                    """
+                    UPDATE scraping_logs
+                    SET status = %s, error_message = %s, scraping_date = NOW()
+                    WHERE log_id = %s;
+                    """,
+                    statuses
+                )
+            conn.commit()
+            success = True
+            logging.info(f"Successfully inserted {len(inserts)} records into scraped_pages and updated {len(statuses)} scraping_logs entries.")
+    except psycopg2.Error as e:
+        logging.error(f"Database error while writing {len(inserts)} scraped_pages records and {len(statuses)} scraping_logs updates: {e}")
+        if conn:
+            conn.rollback()
+    finally:
+        if conn:
+            conn.close()
+    return success
+
+def filter_already_scraped(
+    url_pairs: List[Tuple[Optional[str], str]],
+    chunk_size: int = 1000
+) -> Optional[Set[Tuple[Optional[str], str]]]:
+    """
+    Batch version of check_url_scraped: finds which (client_id, url) pairs already have a
+    'completed' entry in scraping_logs, using one query per chunk of URLs.
+
+    As in check_url_scraped, a pair without a client_id matches a completed entry for the URL
+    from any client.
+
+    Args:
+        url_pairs (List[Tuple[Optional[str], str]]): (client_id, url) tuples, as produced by the URL sources.
+        chunk_size (int): Maximum number of URLs per query.
+
+    Returns:
+        Optional[Set[Tuple[Optional[str], str]]]: The subset of url_pairs already completed,
+            or None if the lookup failed (callers should then check URLs individually).
+    """
+    if not url_pairs:
+        return set()
+    conn = get_db_connection()
+    if not conn:
+        return None
+
+    urls = list({url for _, url in url_pairs})
+    completed_clients: Dict[str, Set[Optional[str]]] = {}
+    try:
+        with conn.cursor() as cur:
+            for start in range(0, len(urls), chunk_size):
+                cur.execute(
+                    "SELECT DISTINCT url_scraped, client_id::text FROM scraping_logs WHERE url_scraped = ANY(%s) AND status = 'completed';",
+                    (urls[start:start + chunk_size],)
+                )
+                for url, client_id in cur.fetchall():
+                    completed_clients.setdefault(url, set()).add(client_id)
+    except psycopg2.Error as e:
+        logging.error(f"Database error while checking scraped status for {len(urls)} URLs: {e}")
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+    already_scraped = {
+        (client_id, url) for client_id, url in url_pairs
+        if url in completed_clients and (client_id is None or client_id in completed_clients[url])
+    }
+    logging.info(f"DB: {len(already_scraped)} of {len(url_pairs)} URLs already marked as 'completed'.")
+    return already_scraped
+
+def log_pending_scrapes_many(
+    url_pairs: List[Tuple[Optional[str], str]],
+    source: str
+) -> Optional[Dict[Tuple[Optional[str], str], str]]:
+    """
+    Batch version of log_pending_scrape: inserts a 'pending' scraping_logs row for every
+    (client_id, url) pair in one transaction.
+
+    Args:
+        url_pairs (List[Tuple[Optional[str], str]]): (client_id, url) tuples to log.
+        source (str): The source of the URLs (e.g., 'homepage', 'linkedin').
+
+    Returns:
+        Optional[Dict[Tuple[Optional[str], str], str]]: log_id for each (client_id, url) pair,
+            or None if the batch could not be written.
+    """
+    if not url_pairs:
+        return {}
+    conn = get_db_connection()
+    if not conn:
+        return None
+
+    log_ids: Dict[Tuple[Optional[str], str], str] = {}
+    try:
+        with conn.cursor() as cur:
+            rows = psycopg2.extras.execute_values(
+                cur,
+                """
+                INSERT INTO scraping_logs (log_id, client_id, source, url_scraped, status, scraping_date, error_message)
+                VALUES %s
+                RETURNING log_id, client_id::text, url_scraped;
+                """,
+                [(client_id, source, url) for client_id, url in url_pairs],
+                template="(gen_random_uuid(), %s, %s, %s, 'pending', NOW(), NULL)",
+                fetch=True
+            )
+            conn.commit()
+            for log_id, client_id, url in rows:
+                log_ids[(client_id, url)] = str(log_id)
+            logging.info(f"Logged 'pending' scrapes for {len(rows)} URLs in one batch.")
+    except psycopg2.Error as e:
+        logging.error(f"Database error while batch-logging {len(url_pairs)} 'pending' scrapes: {e}")
+        if conn:
+            conn.rollback()
+        return None
+    finally:
+        if conn:
+            conn.close()
+    return log_ids
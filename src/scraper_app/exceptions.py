@@ -43,6 +43,14 @@ class ServiceUnavailableError(ServerError):
         super().__init__(message, 503, details)
 
 class RateLimitError(ServerError):
-    """Raised when rate limiting is detected (429 Too Many Requests)."""
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(message, 429, details)
\ No newline at end of file
+    """Raised when rate limiting is detected (429 Too Many Requests).
+
+    retry_after holds the server's Retry-After value in seconds, if it sent one;
+    it is also stored in details['retry_after'].
+    """
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None, retry_after: Optional[float] = None):
+        details = details or {}
+        if retry_after is not None:
+            details['retry_after'] = retry_after
+        super().__init__(message, 429, details)
+        self.retry_after = retry_after
\ No newline at end of file
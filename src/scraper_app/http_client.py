@@ -0,0 +1,64 @@
+import atexit
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import httpx
+
+from . import config
+
+try:
+    import h2 # Optional: enables HTTP/2 (multiplexed image requests over one connection per host)
+except ImportError:
+    h2 = None
+
+# One pooled client per process: connections (and TLS sessions) are reused across images
+# and download threads instead of being opened per request. httpx.Client is thread-safe.
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+def _client_settings() -> Dict[str, Any]:
+    """Keyword arguments shared by the sync and async clients."""
+    return {
+        'http2': h2 is not None,
+        'follow_redirects': True,
+        # Accept-Encoding is left to httpx, which advertises br/zstd only when their decoders are installed
+        'headers': {
+            'User-Agent': config.HTTP_USER_AGENT,
+            'Accept': 'image/avif,image/webp,image/apng,image/*,*/*;q=0.8',
+        },
+        'timeout': config.IMAGE_DOWNLOAD_TIMEOUT,
+        'limits': httpx.Limits(
+            max_connections=config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_MAX_CONNECTIONS
+        ),
+    }
+
+def get_http_client() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is not None:
+        return _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(**_client_settings())
+            logging.debug(f"Created shared HTTP client (http2={h2 is not None})")
+        return _client
+
+def create_async_http_client() -> httpx.AsyncClient:
+    """A new AsyncClient with the shared client's settings.
+
+    Async clients are bound to the event loop they are used on, so callers create one per
+    loop (usually `async with create_async_http_client() as client:`) instead of sharing it.
+    """
+    return httpx.AsyncClient(**_client_settings())
+
+def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections, if one was created."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+atexit.register(close_http_client)
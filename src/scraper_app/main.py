@@ -1,134 +1,280 @@
+import atexit
 import logging
+from collections import Counter
+from contextlib import suppress
 import os
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Iterator, Dict, Any, Tuple
-from urllib.parse import urlparse
 import sys
 import psutil # Used in finally block for playwright cleanup
 from tqdm import tqdm # For progress bars
-import time # For placeholder log_id
+import time # For timing and placeholder log_id
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 # Local imports
 from . import config # Reads from .env
-from .scraper import scrape_page # Core scraping function
+from .scraper import scrape_page, browser_launched, close_browser, close_worker_browsers, spawned_browser_processes # Core scraping function
 from . import db_utils # For database interactions
-from . import ocr # For generate_ocr_summary (used in process_single_pending_url)
 from .url_processor import process_pending_urls_loop # For processing pending queue from DB
 from .utils import (
     validate_url, # Used in process_single_pending_url
     create_metadata, # Used in process_single_pending_url
     normalize_hostname, # Used in get_output_paths
-    get_url_specific_safe_dirname # Used in process_single_pending_url
+    ensure_dir, # Used in generate_scraping_summary, get_formatted_output_paths and main
+    dumps_json, # Used for summary logging, the session log and DB payloads
+    write_json, # Used in write_run_summary
+    get_url_specific_safe_dirname, # Used in process_single_pending_url
+    parse_url, # Memoized urlparse, used in generate_scraping_summary
+    canonical_url # Duplicate-URL key, used in process_single_pending_url
 )
 from .exceptions import ScrapingError, InvalidURLError, ConnectionError, ParsingError, OCRError
 
+# Per-page OCR counters in generate_scraping_summary's metrics, aggregated by ScrapingSession
+OCR_KEYS: Tuple[str, ...] = (
+    'ocr_attempts',  # Total images OCR was attempted on
+    'ocr_successes',  # Text successfully extracted
+    'ocr_no_text_found_count',
+    'ocr_error_unsupported_format_count',
+    'ocr_error_processing_count',
+    'ocr_error_file_not_found_count',
+    'ocr_error_tesseract_count',
+)
+
+# ocr_status value reported per image -> the OCR_KEYS counter it increments
+_OCR_STATUS_COUNTER = {
+    'success': 'ocr_successes',
+    'no_text_found': 'ocr_no_text_found_count',
+    'error_unsupported_format': 'ocr_error_unsupported_format_count',
+    'error_processing': 'ocr_error_processing_count',
+    'error_file_not_found': 'ocr_error_file_not_found_count',
+    'error_tesseract': 'ocr_error_tesseract_count',
+    'skipped_low_text_likelihood': 'ocr_no_text_found_count', # fast_processing pre-filter judged it text-free
+}
+
+def _isoformat(timestamp: float) -> str:
+    """Render an epoch timestamp the way datetime.now().isoformat() would."""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
 class ScrapingSession:
     """Tracks metrics across multiple URLs in a scraping session."""
     
     def __init__(self):
         self.total_urls = 0
         self.total_time = 0.0
-        self.total_ocr_attempts = 0
-        self.total_ocr_successes = 0
-        self.total_ocr_no_text_found = 0
-        self.total_ocr_errors_unsupported = 0
-        self.total_ocr_errors_processing = 0
-        self.total_ocr_errors_file_not_found = 0
-        self.total_ocr_errors_tesseract = 0
-        self.start_time = datetime.now()
+        self._ocr_counts: Dict[str, int] = dict.fromkeys(OCR_KEYS, 0)
+        self.start_time = time.time() # epoch seconds; formatted only for reports
         self.failed_urls: List[Tuple[str, Optional[ScrapingError]]] = []
         self.successful_urls: List[str] = []
-        self.warnings: List[Tuple[str, str, datetime]] = []
-        self.errors: List[Tuple[str, str, datetime]] = []
+        # (url, message, epoch seconds); timestamps are formatted only when reported
+        self.warnings: List[Tuple[str, str, float]] = []
+        self.errors: List[Tuple[str, str, float]] = []
+        # Buffered DB writes, flushed in batches by flush_db()
+        self._pending_inserts: List[Tuple[Optional[str], str, str, Optional[str], Optional[str], Optional[str], Optional[str]]] = []
+        self._pending_status: List[Tuple[str, Optional[str], str]] = []
+        # get_session_summary() result, reused until the session changes again
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        self._summary_dirty = True
+        # Guards the counters, buffers and summary cache when URLs run on worker threads
+        self._lock = threading.RLock()
     
     def add_url_result(self, url: str, summary: Dict[str, Any], success: bool, error: Optional[ScrapingError] = None) -> None:
-        self.total_urls += 1
-        if 'timestamp' in summary and 'duration_seconds' in summary['timestamp']:
-             self.total_time += summary['timestamp']['duration_seconds']
+        with self._lock:
+            self._summary_dirty = True
+            self.total_urls += 1
+            if 'timestamp' in summary and 'duration_seconds' in summary['timestamp']:
+                 self.total_time += summary['timestamp']['duration_seconds']
         
-        if 'extraction' in summary and 'metrics' in summary['extraction']:
-            metrics = summary['extraction']['metrics']
-            self.total_ocr_attempts += metrics.get('ocr_attempts', 0) # This is total images OCR was attempted on
-            self.total_ocr_successes += metrics.get('ocr_successes', 0) # Text successfully extracted
-            self.total_ocr_no_text_found += metrics.get('ocr_no_text_found_count', 0)
-            self.total_ocr_errors_unsupported += metrics.get('ocr_error_unsupported_format_count', 0)
-            self.total_ocr_errors_processing += metrics.get('ocr_error_processing_count', 0)
-            self.total_ocr_errors_file_not_found += metrics.get('ocr_error_file_not_found_count', 0)
-            self.total_ocr_errors_tesseract += metrics.get('ocr_error_tesseract_count', 0)
+            if 'extraction' in summary and 'metrics' in summary['extraction']:
+                metrics = summary['extraction']['metrics']
+                counts = self._ocr_counts
+                metrics_get = metrics.get
+                for key in OCR_KEYS:
+                    counts[key] += metrics_get(key, 0)
         
-        if success:
-            self.successful_urls.append(url)
-        else:
-            self.failed_urls.append((url, error))
+            if success:
+                self.successful_urls.append(url)
+            else:
+                self.failed_urls.append((url, error))
     
-    def add_warning(self, url: str, warning_message: str) -> None:
-        self.warnings.append((url, warning_message, datetime.now()))
+    def add_failure(self, url: str, error: Optional[ScrapingError], duration_seconds: float) -> None:
+        """Record a URL that produced no page data; there are no extraction metrics to fold in."""
+        with self._lock:
+            self._summary_dirty = True
+            self.total_urls += 1
+            self.total_time += duration_seconds
+            self.failed_urls.append((url, error))
+
+    @property
+    def total_ocr_attempts(self) -> int:
+        return self._ocr_counts['ocr_attempts']
+
+    @property
+    def total_ocr_successes(self) -> int:
+        return self._ocr_counts['ocr_successes']
+
+    @property
+    def total_ocr_no_text_found(self) -> int:
+        return self._ocr_counts['ocr_no_text_found_count']
+
+    @property
+    def total_ocr_errors_unsupported(self) -> int:
+        return self._ocr_counts['ocr_error_unsupported_format_count']
+
+    @property
+    def total_ocr_errors_processing(self) -> int:
+        return self._ocr_counts['ocr_error_processing_count']
+
+    @property
+    def total_ocr_errors_file_not_found(self) -> int:
+        return self._ocr_counts['ocr_error_file_not_found_count']
+
+    @property
+    def total_ocr_errors_tesseract(self) -> int:
+        return self._ocr_counts['ocr_error_tesseract_count']
+
+    def add_warning(self, url: str, warning_message: str, timestamp: Optional[float] = None) -> None:
+        with self._lock:
+            self._summary_dirty = True
+            self.warnings.append((url, warning_message, time.time() if timestamp is None else timestamp))
     
-    def add_error(self, url: str, error_message: str) -> None:
-        self.errors.append((url, error_message, datetime.now()))
+    def add_error(self, url: str, error_message: str, timestamp: Optional[float] = None) -> None:
+        with self._lock:
+            self._summary_dirty = True
+            self.errors.append((url, error_message, time.time() if timestamp is None else timestamp))
     
+    def queue_status_update(self, log_id: str, status: str, error_message: Optional[str] = None) -> None:
+        with self._lock: # flush_db swaps the list under the lock; an unlocked append could land in the drained one
+            self._pending_status.append((status, error_message, log_id))
+
+    def queue_page_insert(
+        self,
+        client_id: Optional[str],
+        url: str,
+        page_type: str,
+        raw_html_path: Optional[str],
+        plain_text_path: Optional[str],
+        summary: Optional[str],
+        extraction_notes: Optional[str] = None
+    ) -> None:
+        with self._lock:
+            self._pending_inserts.append(
+                (client_id, url, page_type, raw_html_path, plain_text_path, summary, extraction_notes)
+            )
+
+    def flush_db(self, batch_size: int = 0) -> bool:
+        """Write buffered DB rows once at least batch_size are pending (0 flushes unconditionally).
+
+        Page inserts and status updates go in one transaction. If it fails, the rows are put
+        back at the front of the buffer for the next flush. Returns False in that case.
+        """
+        with self._lock:
+            if len(self._pending_inserts) + len(self._pending_status) < max(batch_size, 1):
+                return True
+            inserts, self._pending_inserts = self._pending_inserts, []
+            statuses, self._pending_status = self._pending_status, []
+        # The DB round-trip happens outside the lock so other workers are not held up.
+        if db_utils.write_scrape_results_many(inserts, statuses):
+            return True
+        with self._lock:
+            self._pending_inserts[:0] = inserts
+            self._pending_status[:0] = statuses
+        logging.warning(f"DB: kept {len(inserts)} page inserts and {len(statuses)} status updates buffered for the next flush.")
+        return False
+
+    @property
+    def pending_db_writes(self) -> int:
+        """Buffered page inserts and status updates not yet written to the database."""
+        with self._lock:
+            return len(self._pending_inserts) + len(self._pending_status)
+
     def get_session_summary(self) -> Dict[str, Any]:
-        end_time = datetime.now()
-        total_duration = (end_time - self.start_time).total_seconds()
-        total_ocr_errors = (
-            self.total_ocr_errors_unsupported +
-            self.total_ocr_errors_processing +
-            self.total_ocr_errors_file_not_found +
-            self.total_ocr_errors_tesseract
-        )
-        # Base success rate on attempts that didn't error out before OCR could run meaningfully
-        # or on images that were processable but yielded no text.
-        # Attempts = success + no_text_found + errors
-        meaningful_attempts = self.total_ocr_successes + self.total_ocr_no_text_found
+        with self._lock:
+            if not self._summary_dirty and self._summary_cache is not None:
+                return self._summary_cache
+            end_time = time.time()
+            total_duration = end_time - self.start_time
+            total_ocr_errors = (
+                self.total_ocr_errors_unsupported +
+                self.total_ocr_errors_processing +
+                self.total_ocr_errors_file_not_found +
+                self.total_ocr_errors_tesseract
+            )
+            # Base success rate on attempts that didn't error out before OCR could run meaningfully
+            # or on images that were processable but yielded no text.
+            # Attempts = success + no_text_found + errors
+            meaningful_attempts = self.total_ocr_successes + self.total_ocr_no_text_found
         
-        avg_ocr_success_rate = 0.0
-        if meaningful_attempts > 0 : # Avoid division by zero if all attempts resulted in errors
-            avg_ocr_success_rate = (self.total_ocr_successes / meaningful_attempts) * 100
-        elif self.total_ocr_attempts > 0 and total_ocr_errors == self.total_ocr_attempts: # All attempts were errors
-             avg_ocr_success_rate = 0.0 # Or handle as undefined, but 0% is clear
-        # If total_ocr_attempts is 0, it remains 0.0
+            avg_ocr_success_rate = 0.0
+            if meaningful_attempts > 0 : # Avoid division by zero if all attempts resulted in errors
+                avg_ocr_success_rate = (self.total_ocr_successes / meaningful_attempts) * 100
+            elif self.total_ocr_attempts > 0 and total_ocr_errors == self.total_ocr_attempts: # All attempts were errors
+                 avg_ocr_success_rate = 0.0 # Or handle as undefined, but 0% is clear
+            # If total_ocr_attempts is 0, it remains 0.0
         
-        return {
-            'session_duration': {
-                'start': self.start_time.isoformat(),
-                'end': end_time.isoformat(),
-                'total_seconds': total_duration
-            },
-            'urls_processed': {
-                'total': self.total_urls,
-                'successful': len(self.successful_urls),
-                'failed': len(self.failed_urls)
-            },
-            'ocr_metrics': {
-                'total_images_ocr_attempted': self.total_ocr_attempts, # Renamed for clarity
-                'total_ocr_successful_extraction': self.total_ocr_successes, # Renamed
-                'total_ocr_no_text_found': self.total_ocr_no_text_found,
-                'total_ocr_errors_unsupported_format': self.total_ocr_errors_unsupported,
-                'total_ocr_errors_processing': self.total_ocr_errors_processing,
-                'total_ocr_errors_file_not_found': self.total_ocr_errors_file_not_found,
-                'total_ocr_errors_tesseract': self.total_ocr_errors_tesseract,
-                'total_ocr_errors_sum': total_ocr_errors,
-                'average_success_rate_on_processable': round(avg_ocr_success_rate, 2) # Clarified rate
-            },
-            'performance': {
-                'total_processing_time': round(self.total_time, 2),
-                'average_time_per_url': round(self.total_time / self.total_urls if self.total_urls > 0 else 0, 2)
-            },
-            'warnings_and_errors': {
-                'warnings': [{'url': u, 'message': m, 'timestamp': t.isoformat()} for u, m, t in self.warnings],
-                'errors': [{'url': u, 'message': m, 'timestamp': t.isoformat()} for u, m, t in self.errors]
+            self._summary_cache = {
+                'session_duration': {
+                    'start': _isoformat(self.start_time),
+                    'end': _isoformat(end_time),
+                    'total_seconds': total_duration
+                },
+                'urls_processed': {
+                    'total': self.total_urls,
+                    'successful': len(self.successful_urls),
+                    'failed': len(self.failed_urls)
+                },
+                'ocr_metrics': {
+                    'total_images_ocr_attempted': self.total_ocr_attempts, # Renamed for clarity
+                    'total_ocr_successful_extraction': self.total_ocr_successes, # Renamed
+                    'total_ocr_no_text_found': self.total_ocr_no_text_found,
+                    'total_ocr_errors_unsupported_format': self.total_ocr_errors_unsupported,
+                    'total_ocr_errors_processing': self.total_ocr_errors_processing,
+                    'total_ocr_errors_file_not_found': self.total_ocr_errors_file_not_found,
+                    'total_ocr_errors_tesseract': self.total_ocr_errors_tesseract,
+                    'total_ocr_errors_sum': total_ocr_errors,
+                    'average_success_rate_on_processable': round(avg_ocr_success_rate, 2) # Clarified rate
+                },
+                'performance': {
+                    'total_processing_time': round(self.total_time, 2),
+                    'average_time_per_url': round(self.total_time / self.total_urls if self.total_urls > 0 else 0, 2)
+                },
+                'warnings_and_errors': {
+                    'warnings': [{'url': u, 'message': m, 'timestamp': _isoformat(t)} for u, m, t in self.warnings],
+                    'errors': [{'url': u, 'message': m, 'timestamp': _isoformat(t)} for u, m, t in self.errors]
+                }
             }
-        }
+            self._summary_dirty = False
+            return self._summary_cache
+
+class SessionWarningErrorHandler(logging.Handler):
+    """Records WARNING and higher log records on a ScrapingSession."""
+
+    def __init__(self, session: ScrapingSession):
+        super().__init__(level=logging.WARNING)
+        self.session = session
+
+    def emit(self, record: logging.LogRecord) -> None:
+        url_context = getattr(record, 'url', 'N/A')
+        # record.created is already captured by logging; no second clock read needed.
+        if record.levelno == logging.WARNING:
+            self.session.add_warning(url_context, record.getMessage(), record.created)
+        elif record.levelno >= logging.ERROR:
+            self.session.add_error(url_context, record.getMessage(), record.created)
+
+# Output paths per (run_dir, hostname). Nothing is created here; writers make their own directories.
+_output_paths_cache: Dict[Tuple[Path, str], Dict[str, Path]] = {}
 
 def get_output_paths(base_dir: Path, url: str, content_type: str = 'text') -> Dict[str, Path]:
     hostname = normalize_hostname(url)
+    run_dir = config.get_run_directory()
+    cached = _output_paths_cache.get((run_dir, hostname))
+    if cached is not None:
+        return dict(cached)
     extensions = {
         'text': '.txt', 'json': '.json', 'html': '.html',
         'raw': '.raw', 'ocr': '.ocr.txt', 'ocr_summary': '.ocr.json'
     }
-    run_dir = config.get_run_directory()
     paths = {
         'page': run_dir / config.PAGES_SUBDIR / hostname / f"page{extensions['html']}",
         'text': run_dir / config.PAGES_SUBDIR / hostname / f"text{extensions['text']}",
@@ -137,53 +283,52 @@ def get_output_paths(base_dir: Path, url: str, content_type: str = 'text') -> Di
         'ocr_dir': run_dir / config.PAGES_SUBDIR / hostname / config.OCR_SUBDIR,
         'ocr_summary': run_dir / config.PAGES_SUBDIR / hostname / config.OCR_SUBDIR / f"summary{extensions['ocr_summary']}"
     }
-    for path_obj in paths.values():
-        if isinstance(path_obj, Path):
-            path_obj.parent.mkdir(parents=True, exist_ok=True)
-    return paths
-
-def generate_scraping_summary(url: str, result: Dict[str, Any], start_time: datetime) -> Dict[str, Any]:
-    end_time = datetime.now()
-    duration = (end_time - start_time).total_seconds()
-    output_paths = get_output_paths(config.DATA_DIR, url) # DATA_DIR is the base for run_dir
-    
-    output_paths['page'].parent.mkdir(parents=True, exist_ok=True)
+    _output_paths_cache[(run_dir, hostname)] = paths
+    return dict(paths)
+
+# Zero-valued shapes of the per-page stats in generate_scraping_summary; copied, never mutated.
+_IMAGE_STATS_TEMPLATE: Dict[str, Any] = {
+    'total_images_found': 0, 'by_type': None, 'total_size_bytes': 0, 'extensions': None,
+    'ocr_attempts': 0, # Total images OCR was attempted on
+    'ocr_successes': 0, # Text successfully extracted
+    'ocr_no_text_found_count': 0,
+    'ocr_error_unsupported_format_count': 0,
+    'ocr_error_processing_count': 0,
+    'ocr_error_file_not_found_count': 0,
+    'ocr_error_tesseract_count': 0,
+    'ocr_total_errors': 0,
+    'ocr_success_rate_on_processable': 0.0
+}
+_TEXT_STATS_TEMPLATE: Dict[str, Any] = {
+    'length': 0, 'word_count': 0, 'paragraph_count': 0, 'has_content': False, 'format': 'plain'
+}
+
+def generate_scraping_summary(
+    url: str,
+    result: Dict[str, Any],
+    start_time: float,
+    output_paths: Optional[Dict[str, Path]] = None
+) -> Dict[str, Any]:
+    end_time = time.time()
+    duration = end_time - start_time
+    if output_paths is None:
+        output_paths = get_output_paths(config.DATA_DIR, url) # DATA_DIR is the base for run_dir
     
-    image_stats = {
-        'total_images_found': 0, 'by_type': {}, 'total_size_bytes': 0, 'extensions': set(),
-        'ocr_attempts': 0, # Total images OCR was attempted on
-        'ocr_successes': 0, # Text successfully extracted
-        'ocr_no_text_found_count': 0,
-        'ocr_error_unsupported_format_count': 0,
-        'ocr_error_processing_count': 0,
-        'ocr_error_file_not_found_count': 0,
-        'ocr_error_tesseract_count': 0,
-        'ocr_total_errors': 0,
-        'ocr_success_rate_on_processable': 0.0
-    }
-    if 'images' in result and isinstance(result['images'], list):
+    # Start from the zero-valued templates; only by_type/extensions need fresh containers.
+    image_stats = _IMAGE_STATS_TEMPLATE.copy()
+    image_stats['by_type'] = {}
+    image_stats['extensions'] = []
+    if result.get('images') and isinstance(result['images'], list):
         image_stats['total_images_found'] = len(result['images']) # This is the number of images found on page
         image_stats['ocr_attempts'] = len(result['images']) # OCR is attempted on all found images
 
-        for img in result['images']: # result['images'] contains ocr_item dicts from scraper.py
-            img_type = img.get('image_type', 'unknown')
-            image_stats['by_type'][img_type] = image_stats['by_type'].get(img_type, 0) + 1
-            if 'extension' in img: image_stats['extensions'].add(img['extension'])
-            image_stats['total_size_bytes'] += img.get('size_bytes', 0)
-
-            ocr_status = img.get('ocr_status', 'error_processing') # Get the detailed status
-            if ocr_status == 'success':
-                image_stats['ocr_successes'] += 1
-            elif ocr_status == 'no_text_found':
-                image_stats['ocr_no_text_found_count'] += 1
-            elif ocr_status == 'error_unsupported_format':
-                image_stats['ocr_error_unsupported_format_count'] += 1
-            elif ocr_status == 'error_processing':
-                image_stats['ocr_error_processing_count'] += 1
-            elif ocr_status == 'error_file_not_found':
-                image_stats['ocr_error_file_not_found_count'] += 1
-            elif ocr_status == 'error_tesseract':
-                image_stats['ocr_error_tesseract_count'] += 1
+        images = result['images'] # result['images'] contains ocr_item dicts from scraper.py
+        status_counts = Counter(img.get('ocr_status', 'error_processing') for img in images)
+        for ocr_status, counter_key in _OCR_STATUS_COUNTER.items():
+            image_stats[counter_key] = status_counts[ocr_status]
+        image_stats['by_type'] = dict(Counter(img.get('image_type', 'unknown') for img in images))
+        image_stats['extensions'] = sorted({img['extension'] for img in images if 'extension' in img})
+        image_stats['total_size_bytes'] = sum(img.get('size_bytes', 0) for img in images)
         
         image_stats['ocr_total_errors'] = (
             image_stats['ocr_error_unsupported_format_count'] +
@@ -202,23 +347,22 @@ def generate_scraping_summary(url: str, result: Dict[str, Any], start_time: date
     ocr_summary_present = image_stats['ocr_successes'] > 0 # Keep this for deciding if OCR summary file is written
 
     if image_stats.get('total_images_found', 0) > 0: # Check if any images were found to process
-        output_paths['images_dir'].mkdir(parents=True, exist_ok=True)
+        ensure_dir(output_paths['images_dir'])
         if ocr_summary_present:
-             (output_paths['ocr_dir']).mkdir(parents=True, exist_ok=True)
+             ensure_dir(output_paths['ocr_dir'])
 
-    image_stats['extensions'] = sorted(list(image_stats['extensions']))
-    
-    text_stats = {'length': 0, 'word_count': 0, 'paragraph_count': 0, 'has_content': False, 'format': 'plain'}
+    text_stats = _TEXT_STATS_TEMPLATE.copy()
     if 'text_data' in result and isinstance(result['text_data'], dict):
-        text_stats['length'] = result['text_data'].get('text_length',0)
-        text_stats['word_count'] = result['text_data'].get('word_count',0)
-        text_stats['paragraph_count'] = result['text_data'].get('paragraph_count', 0)
+        text_data_get = result['text_data'].get
+        text_stats['length'] = text_data_get('text_length',0)
+        text_stats['word_count'] = text_data_get('word_count',0)
+        text_stats['paragraph_count'] = text_data_get('paragraph_count', 0)
         text_stats['has_content'] = bool(result.get('text',"").strip())
         text_stats['format'] = result.get('text_format', 'plain')
 
     summary = {
-        'timestamp': {'start': start_time.isoformat(), 'end': end_time.isoformat(), 'duration_seconds': duration},
-        'url': {'original': url, 'parsed': urlparse(url).geturl()},
+        'timestamp': {'start': _isoformat(start_time), 'end': _isoformat(end_time), 'duration_seconds': duration},
+        'url': {'original': url, 'parsed': parse_url(url).geturl()},
         'extraction': {
             'success': bool(result), 'text': text_stats, 'images': image_stats,
             'metrics': {
@@ -244,6 +388,16 @@ def generate_scraping_summary(url: str, result: Dict[str, Any], start_time: date
     }
     return summary
 
+class _LazyJSON:
+    """Defers JSON encoding until a log handler actually formats the record."""
+    __slots__ = ('obj',)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return dumps_json(self.obj)
+
 def log_scraping_summary(summary: Dict[str, Any]) -> None:
     logging.info("\n\n[SUMMARY] Scraping Result Summary:")
     logging.info(f"URL: {summary['url']['original']}")
@@ -277,10 +431,12 @@ def log_scraping_summary(summary: Dict[str, Any]) -> None:
     # logging.info(f"• OCR attempts: {metrics['ocr_attempts']}, OCR successes: {metrics['ocr_successes']}")
     logging.info("\n[SAVED] Output Files:")
     for key, path in summary['output_files'].items(): logging.info(f"• {key}: {path}")
-    logging.info("\n[STATS] JSON Summary:\n" + json.dumps(summary, indent=2))
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("\n[STATS] JSON Summary:\n%s", _LazyJSON(summary))
 
-def log_session_summary(session: ScrapingSession) -> None:
-    summary = session.get_session_summary()
+def log_session_summary(session: ScrapingSession, summary: Optional[Dict[str, Any]] = None) -> None:
+    if summary is None:
+        summary = session.get_session_summary()
     logging.info("\n\n[SESSION SUMMARY] Overall Scraping Session Results:")
     logging.info(f"Session Duration: {summary['session_duration']['total_seconds']:.2f} seconds")
     logging.info("\n[URLS] Processing Statistics:")
@@ -311,18 +467,22 @@ def log_session_summary(session: ScrapingSession) -> None:
         for url, error in session.failed_urls:
             error_details = f"Error Type: {error.error_type}, Msg: {str(error)}, Details: {error.details}" if error else "Unknown error"
             logging.info(f"• {url} - {error_details}")
-    logging.info("\n[STATS] Session JSON Summary:\n" + json.dumps(summary, indent=2))
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("\n[STATS] Session JSON Summary:\n%s", _LazyJSON(summary))
 
 def read_urls_from_file(file_path_str: str) -> Iterator[str]:
     file_path = Path(file_path_str)
     if not file_path.is_file():
         raise FileNotFoundError(f"URL file not found: {file_path_str}")
     with open(file_path, 'r') as f:
-        urls = [line.strip() for line in f if line.strip()]
-    if not urls:
-        raise InvalidURLError(f"No URLs found in file: {file_path_str}")
-    for url in urls:
-        yield url
+        # Stream lines instead of materialising the whole file; one lookahead
+        # is enough to report an empty file.
+        urls = (stripped for stripped in (line.strip() for line in f) if stripped)
+        first = next(urls, None)
+        if first is None:
+            raise InvalidURLError(f"No URLs found in file: {file_path_str}")
+        yield first
+        yield from urls
 
 def setup_logging() -> None: # debug_mode now comes from config
     from .logging_utils import configure_logging, info as log_info # Avoid conflict
@@ -343,30 +503,30 @@ def setup_logging() -> None: # debug_mode now comes from config
     )
     log_info(f"Logging configured with debug mode: {config.SCRAPER_DEBUG_MODE}", category='CONFIG')
 
-def write_session_log(session: ScrapingSession, run_dir: Path) -> None:
+# Buffer size for the end-of-run log/summary files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+def write_session_log(session: ScrapingSession, run_dir: Path, summary: Optional[Dict[str, Any]] = None) -> Optional[Path]:
     log_file = run_dir / "session_details.log"
-    summary = session.get_session_summary()
+    if summary is None:
+        summary = session.get_session_summary()
     try:
-        with open(log_file, 'w', encoding='utf-8') as f:
+        # A large write buffer keeps this to a handful of syscalls.
+        with open(log_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
             f.write("SESSION SUMMARY:\n")
-            f.write(json.dumps(summary, indent=2))
-            f.write("\n\nDETAILED LOGS:\n")
-            f.write("Successful URLs:\n")
-            for url in session.successful_urls:
-                f.write(f"- {url}\n")
+            f.write(dumps_json(summary))
+            f.write("\n\nDETAILED LOGS:\nSuccessful URLs:\n")
+            f.writelines(f"- {url}\n" for url in session.successful_urls)
             f.write("\nFailed URLs:\n")
-            for url, error in session.failed_urls:
-                error_str = str(error) if error else "N/A"
-                f.write(f"- {url}: {error_str}\n")
+            f.writelines(f"- {url}: {str(error) if error else 'N/A'}\n" for url, error in session.failed_urls)
             f.write("\nWarnings:\n")
-            for url, msg, ts in session.warnings:
-                f.write(f"- [{ts.isoformat()}] {url}: {msg}\n")
+            f.writelines(f"- [{_isoformat(ts)}] {url}: {msg}\n" for url, msg, ts in session.warnings)
             f.write("\nErrors (captured by handler):\n")
-            for url, msg, ts in session.errors:
-                f.write(f"- [{ts.isoformat()}] {url}: {msg}\n")
-        logging.info(f"Session log written to {log_file}")
+            f.writelines(f"- [{_isoformat(ts)}] {url}: {msg}\n" for url, msg, ts in session.errors)
+        return log_file
     except IOError as e:
         logging.error(f"Failed to write session log: {e}")
+        return None
 
 def update_history_log(session: ScrapingSession) -> None:
     if not config.SCRAPER_USE_DATABASE:
@@ -377,8 +537,7 @@ def update_history_log(session: ScrapingSession) -> None:
 def get_formatted_output_paths(run_dir: Path, company_name: str, url: str) -> Dict[str, Path]:
     hostname = normalize_hostname(url)
     safe_company_name = "".join(c for c in company_name if c.isalnum() or c in (' ', '-', '_')).strip().replace(' ', '_')
-    base_path = run_dir / safe_company_name / hostname
-    base_path.mkdir(parents=True, exist_ok=True)
+    base_path = ensure_dir(run_dir / safe_company_name / hostname)
     return {
         'html': base_path / "page.html",
         'text': base_path / "text.txt",
@@ -392,12 +551,20 @@ def process_single_pending_url(
     run_dir: Path, 
     scrape_session: ScrapingSession, 
     scrape_mode: str, 
-    debug_mode: bool
+    debug_mode: bool,
+    scraped_pages: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> None:
-    start_time = datetime.now()
+    """Scrape one pending URL, record the outcome in the session and queue its DB updates.
+
+    scraped_pages, when given, maps canonical_url() keys to results already scraped in this
+    batch; a URL found there is not scraped again, and new results are added to it.
+    """
+    start_time = time.time()
     page_data = None
     success_flag = False
+    output_paths = get_output_paths(run_dir, url_to_scrape)
     scraping_error_obj: Optional[ScrapingError] = None
+    current_summary: Optional[Dict[str, Any]] = None
 
     try:
         logging.info(f"Processing URL: {url_to_scrape} (Client: {client_id or 'N/A'}, Log ID: {log_id or 'N/A - DB Disabled'})")
@@ -414,26 +581,35 @@ def process_single_pending_url(
         # For now, removing the problematic call to get_url_specific_safe_dirname.
         # url_specific_dir_name = get_url_specific_safe_dirname(url_to_scrape) # Corrected call, but output not used.
         
-        page_data = scrape_page(
-            url=url_to_scrape,
-            scrape_mode=scrape_mode,
-        )
+        cache_key = canonical_url(url_to_scrape) if scraped_pages is not None else None
+        page_data = scraped_pages.get(cache_key) if cache_key is not None else None
+        if page_data is not None:
+            logging.info(f"Reusing result for {url_to_scrape}, already scraped in this batch")
+        else:
+            page_data = scrape_page(
+                url=url_to_scrape,
+                scrape_mode=scrape_mode,
+            )
+            if page_data and cache_key is not None:
+                # The raw HTML is already on disk and nothing downstream reads it again
+                scraped_pages[cache_key] = {k: v for k, v in page_data.items() if k != 'html'}
 
         if page_data:
             logging.info(f"Successfully scraped content from {url_to_scrape}")
             success_flag = True
             if config.SCRAPER_USE_DATABASE and log_id:
-                db_utils.update_scraping_log_status(log_id, 'completed')
+                scrape_session.queue_status_update(log_id, 'completed')
             
             if config.SCRAPER_USE_DATABASE:
-                summary_for_db = generate_scraping_summary(url_to_scrape, page_data, start_time)
-                db_utils.insert_scraped_page_data(
+                # Built once here and reused by the finally block for the session totals.
+                current_summary = generate_scraping_summary(url_to_scrape, page_data, start_time, output_paths)
+                scrape_session.queue_page_insert(
                     client_id=client_id,
                     url=url_to_scrape,
                     page_type="website", 
-                    raw_html_path=summary_for_db['output_files'].get('page'),
-                    plain_text_path=summary_for_db['output_files'].get('text'),
-                    summary=json.dumps(summary_for_db['extraction']),
+                    raw_html_path=current_summary['output_files'].get('page'),
+                    plain_text_path=current_summary['output_files'].get('text'),
+                    summary=dumps_json(current_summary['extraction'], indent=False),
                     extraction_notes=f"Mode: {scrape_mode}"
                 )
         else:
@@ -458,52 +634,99 @@ def process_single_pending_url(
         logging.error(f"Unexpected error processing {url_to_scrape}: {e}", exc_info=debug_mode)
         scraping_error_obj = ScrapingError(f"Unexpected error: {str(e)}", error_type="Unexpected", details={'url': url_to_scrape})
     finally:
-        final_summary_data = page_data if page_data else {
-            'images': [], 'text_data': {}, 'text': '',
-        }
-        current_summary = generate_scraping_summary(url_to_scrape, final_summary_data, start_time)
-        scrape_session.add_url_result(url_to_scrape, current_summary, success_flag, scraping_error_obj)
+        if not page_data and not debug_mode:
+            # Nothing was extracted, so an all-zero summary would add nothing to the session totals.
+            scrape_session.add_failure(url_to_scrape, scraping_error_obj, time.time() - start_time)
+        else:
+            if current_summary is None:
+                final_summary_data = page_data if page_data else {
+                    'images': [], 'text_data': {}, 'text': '',
+                }
+                current_summary = generate_scraping_summary(url_to_scrape, final_summary_data, start_time, output_paths)
+            scrape_session.add_url_result(url_to_scrape, current_summary, success_flag, scraping_error_obj)
         
         if not success_flag and config.SCRAPER_USE_DATABASE and log_id:
             error_msg_for_db = str(scraping_error_obj)[:1023] if scraping_error_obj else "Unknown error during processing"
-            db_utils.update_scraping_log_status(log_id, 'failed', error_message=error_msg_for_db)
+            scrape_session.queue_status_update(log_id, 'failed', error_message=error_msg_for_db)
+
+        if config.SCRAPER_USE_DATABASE:
+            scrape_session.flush_db(config.SCRAPER_DB_WRITE_BATCH_SIZE)
         
-        if debug_mode or not success_flag : 
+        if current_summary is not None and (debug_mode or not success_flag): 
              log_scraping_summary(current_summary)
 
-def write_run_summary(session: ScrapingSession, run_dir: Path) -> None:
+def write_run_summary(session: ScrapingSession, run_dir: Path, summary: Optional[Dict[str, Any]] = None) -> Optional[Path]:
     summary_file = run_dir / "run_summary.json"
+    if summary is None:
+        summary = session.get_session_summary()
     try:
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(session.get_session_summary(), f, indent=2)
-        logging.info(f"Run summary written to {summary_file}")
+        write_json(summary_file, summary)
+        return summary_file
     except IOError as e:
         logging.error(f"Failed to write run summary: {e}")
+        return None
+
+def process_source_url(
+    client_id: Optional[str],
+    url: str,
+    run_dir: Path,
+    session: ScrapingSession,
+    source_description: str,
+    already_scraped: Optional[bool] = None,
+    log_id: Optional[str] = None
+) -> None:
+    """Register one URL from the configured source (DB pending log or local) and scrape it.
+
+    already_scraped and log_id carry the results of main()'s batched DB lookups; when
+    they are None the URL is checked and logged individually.
+    """
+    log_id_for_this_url: Optional[str] = log_id
+    if config.SCRAPER_USE_DATABASE:
+        if already_scraped is None:
+            already_scraped = db_utils.check_url_scraped(url, client_id)
+        if already_scraped:
+            logging.info(f"DB: Skipping already completed URL: {url} (Client: {client_id or 'N/A'})")
+            session.add_url_result(url, {'timestamp': {'duration_seconds': 0}, 'extraction': {'metrics': {}}}, True)
+            return
+        
+        if not log_id_for_this_url:
+            log_id_for_this_url = db_utils.log_pending_scrape(url, client_id, source=source_description)
+        if not log_id_for_this_url:
+            logging.error(f"DB: Failed to log 'pending' status for {url}. Skipping.")
+            session.add_url_result(url, {'timestamp': {'duration_seconds': 0}, 'extraction': {'metrics': {}}}, False, ScrapingError("DB pending log failed", details={'url': url}))
+            return
+        logging.info(f"DB: Logged 'pending' for {url}, log_id: {log_id_for_this_url}")
+    else:
+        log_id_for_this_url = f"local_{time.time()}" 
+        logging.info(f"DB disabled. Processing locally: {url}")
+
+    process_single_pending_url(
+        log_id=log_id_for_this_url,
+        client_id=client_id,
+        url_to_scrape=url,
+        run_dir=run_dir,
+        scrape_session=session,
+        scrape_mode=config.SCRAPER_MODE,
+        debug_mode=config.SCRAPER_DEBUG_MODE
+    )
 
 def main() -> None:
     setup_logging() 
 
-    run_dir = config.get_run_directory() 
-    logging.info(f"Scraper run starting. Output directory: {run_dir}")
-
-    session = ScrapingSession()
-
-    class WarningErrorHandler(logging.Handler):
-        def emit(self, record):
-            url_context = getattr(record, 'url', 'N/A') 
-            if record.levelno == logging.WARNING:
-                session.add_warning(url_context, record.getMessage())
-            elif record.levelno >= logging.ERROR:
-                session.add_error(url_context, record.getMessage())
-    
-    warning_error_handler = WarningErrorHandler()
-    warning_error_handler.setLevel(logging.WARNING)
-    logging.getLogger().addHandler(warning_error_handler)
+    # Explicit sentinels so finalize can tell whether setup got far enough.
+    session: Optional[ScrapingSession] = None
+    run_dir: Optional[Path] = None
 
     urls_to_process: List[Tuple[Optional[str], str]] = []
     source_description = "No source"
 
     try:
+        run_dir = config.get_run_directory() 
+        logging.info(f"Scraper run starting. Output directory: {run_dir}")
+
+        session = ScrapingSession()
+        logging.getLogger().addHandler(SessionWarningErrorHandler(session))
+
         if config.SCRAPER_TARGET_URL:
             urls_to_process = [(None, config.SCRAPER_TARGET_URL)]
             source_description = f"single URL: {config.SCRAPER_TARGET_URL}"
@@ -552,58 +775,83 @@ def main() -> None:
             logging.info(f"No URLs to process from {source_description}.")
         else:
             logging.info(f"Processing {len(urls_to_process)} URLs from {source_description}")
+
+            # Create each host's output tree once up front; scrape_page's ensure_dir calls then hit the cache.
+            for hostname in {normalize_hostname(url) for _, url in urls_to_process}:
+                ensure_dir(run_dir / config.PAGES_SUBDIR / hostname / config.OCR_SUBDIR)
+                ensure_dir(run_dir / config.IMAGES_SUBDIR / hostname)
             
             progress_bar = None
             if not config.SCRAPER_DEBUG_MODE and len(urls_to_process) > 1:
                 print(f"\nStarting batch processing of {len(urls_to_process)} URLs from {source_description}...")
                 progress_bar = tqdm(total=len(urls_to_process), desc="Processing URLs", unit="url")
 
-            for client_id_from_source, url_from_source in urls_to_process:
-                log_id_for_this_url: Optional[str] = None
-                if config.SCRAPER_USE_DATABASE:
-                    if db_utils.check_url_scraped(url_from_source, client_id_from_source):
-                        logging.info(f"DB: Skipping already completed URL: {url_from_source} (Client: {client_id_from_source or 'N/A'})")
-                        if progress_bar: progress_bar.update(1)
-                        session.add_url_result(url_from_source, {'timestamp': {'duration_seconds': 0}, 'extraction': {'metrics': {}}}, True)
-                        continue
-                    
-                    log_id_for_this_url = db_utils.log_pending_scrape(url_from_source, client_id_from_source, source=source_description)
-                    if not log_id_for_this_url:
-                        logging.error(f"DB: Failed to log 'pending' status for {url_from_source}. Skipping.")
-                        session.add_url_result(url_from_source, {'timestamp': {'duration_seconds': 0}, 'extraction': {'metrics': {}}}, False, ScrapingError("DB pending log failed", details={'url': url_from_source}))
-                        if progress_bar: progress_bar.update(1)
-                        continue
-                    logging.info(f"DB: Logged 'pending' for {url_from_source}, log_id: {log_id_for_this_url}")
-                else:
-                    log_id_for_this_url = f"local_{time.time()}" 
-                    logging.info(f"DB disabled. Processing locally: {url_from_source}")
-
-                process_single_pending_url(
-                    log_id=log_id_for_this_url,
-                    client_id=client_id_from_source,
-                    url_to_scrape=url_from_source,
-                    run_dir=run_dir,
-                    scrape_session=session,
-                    scrape_mode=config.SCRAPER_MODE,
-                    debug_mode=config.SCRAPER_DEBUG_MODE
-                )
+            # One query for the completed check and one insert for the 'pending' rows,
+            # instead of two round trips per URL. On failure, URLs fall back to per-URL calls.
+            already_scraped: Optional[set] = None
+            pending_log_ids: Dict[Tuple[Optional[str], str], str] = {}
+            if config.SCRAPER_USE_DATABASE:
+                already_scraped = db_utils.filter_already_scraped(urls_to_process)
+                if already_scraped is not None:
+                    to_log = list(dict.fromkeys(pair for pair in urls_to_process if pair not in already_scraped))
+                    pending_log_ids = db_utils.log_pending_scrapes_many(to_log, source_description) or {}
+
+            def _source_url_kwargs(client_id: Optional[str], url: str) -> Dict[str, Any]:
+                return {
+                    'already_scraped': (client_id, url) in already_scraped if already_scraped is not None else None,
+                    'log_id': pending_log_ids.get((client_id, url)),
+                }
+
+            def _advance_progress() -> None:
                 if progress_bar:
                     progress_bar.update(1)
                     progress_bar.set_postfix_str(f"Success: {len(session.successful_urls)}, Failed: {len(session.failed_urls)}")
+
+            max_workers = max(1, config.SCRAPER_MAX_WORKERS)
+            if max_workers == 1 or len(urls_to_process) == 1:
+                for client_id_from_source, url_from_source in urls_to_process:
+                    process_source_url(client_id_from_source, url_from_source, run_dir, session, source_description,
+                                       **_source_url_kwargs(client_id_from_source, url_from_source))
+                    _advance_progress()
+            else:
+                # Pages are fetched concurrently; scrape_page's per-host rate limiter still caps request rate.
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scrape") as executor:
+                    futures: List[Future] = []
+                    try:
+                        futures = [
+                            executor.submit(process_source_url, client_id_from_source, url_from_source, run_dir, session, source_description,
+                                            **_source_url_kwargs(client_id_from_source, url_from_source))
+                            for client_id_from_source, url_from_source in urls_to_process
+                        ]
+                        for future in as_completed(futures):
+                            future.result()
+                            _advance_progress()
+                    finally:
+                        # On Ctrl-C or a failed URL, drop the URLs not started yet instead of
+                        # scraping the rest of the list before the browsers can be closed
+                        for future in futures:
+                            future.cancel()
+                        # Each worker thread launched its own browser; close them before the threads exit
+                        close_worker_browsers(executor, max_workers)
             
             if progress_bar:
                 progress_bar.close()
                 print(f"\nProcessing complete! Success: {len(session.successful_urls)}, Failed: {len(session.failed_urls)}")
 
         if config.SCRAPER_USE_DATABASE and config.SCRAPER_DB_PENDING_BATCH_SIZE > 0:
-            logging.info(f"DB: Checking for 'pending' URLs from previous runs (batch size: {config.SCRAPER_DB_PENDING_BATCH_SIZE}).")
-            process_pending_urls_loop(
-                scrape_session=session,
-                run_dir=run_dir,
-                scrape_mode=config.SCRAPER_MODE,
-                debug_mode=config.SCRAPER_DEBUG_MODE,
-                num_to_process=config.SCRAPER_DB_PENDING_BATCH_SIZE
-            )
+            # Flush buffered status updates first so URLs handled above are no longer 'pending';
+            # if that fails they would be picked up (and scraped) a second time, so skip the queue.
+            if session.flush_db():
+                logging.info(f"DB: Checking for 'pending' URLs from previous runs (batch size: {config.SCRAPER_DB_PENDING_BATCH_SIZE}).")
+                process_pending_urls_loop(
+                    scrape_session=session,
+                    run_dir=run_dir,
+                    scrape_mode=config.SCRAPER_MODE,
+                    debug_mode=config.SCRAPER_DEBUG_MODE,
+                    num_to_process=config.SCRAPER_DB_PENDING_BATCH_SIZE
+                )
+            else:
+                logging.warning("DB: Buffered writes could not be saved; skipping the pending queue for this run.")
         elif config.SCRAPER_DB_PENDING_BATCH_SIZE <= 0 and config.SCRAPER_USE_DATABASE : # only log if db is enabled but batch size is 0
              logging.info("DB enabled, but skipping processing of pending queue as SCRAPER_DB_PENDING_BATCH_SIZE is 0 or less.")
         elif not config.SCRAPER_USE_DATABASE:
@@ -614,39 +862,60 @@ def main() -> None:
     except Exception as e:
         logging.critical(f"An unhandled exception occurred in main: {e}", exc_info=True)
     finally:
-        logging.info("Finalizing run...")
-        log_session_summary(session) 
-        write_session_log(session, run_dir) 
-        if config.SCRAPER_USE_DATABASE: 
-            update_history_log(session)
-        write_run_summary(session, run_dir) 
-        
-        logging.info(f"Run finalized. Results and logs in: {run_dir}")
-
-        try:
-            from playwright.sync_api import sync_playwright 
-            with sync_playwright() as p:
-                browser = getattr(p, '_default_browser', None)
-                if browser and browser.is_connected():
-                    logging.debug("Attempting to close Playwright default browser.")
-                    browser.close()
-        except ImportError:
-            logging.debug("Playwright not installed or accessible, skipping cleanup.")
-        except Exception as e:
-            logging.debug(f"Error during Playwright browser cleanup: {str(e)}")
+        if session is not None and config.SCRAPER_USE_DATABASE:
+            with suppress(Exception):
+                session.flush_db()
+            if session.pending_db_writes:
+                logging.error(
+                    f"DB: {session.pending_db_writes} buffered writes could not be saved; "
+                    "their URLs stay 'pending' and will be scraped again by a later run."
+                )
+
+        if session is not None and run_dir is not None:
+            final_summary = session.get_session_summary()
+            log_session_summary(session, summary=final_summary) 
+            # Keep the run_dir writes back to back; the history update goes last.
+            session_log_path = write_session_log(session, run_dir, summary=final_summary) 
+            run_summary_path = write_run_summary(session, run_dir, summary=final_summary) 
+            if config.SCRAPER_USE_DATABASE: 
+                update_history_log(session)
         
-        try:
-            for proc in psutil.process_iter(['pid', 'name']):
-                if 'playwright' in proc.info['name'].lower():
-                    logging.debug(f"Attempting to kill lingering Playwright process: {proc.info['name']} (PID: {proc.info['pid']})")
-                    proc.kill()
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            pass 
-        except Exception as e:
-            logging.warning(f"Error during Playwright process cleanup: {str(e)}")
+            logging.info(
+                "Run finalized. Results and logs in: %s\n  session log -> %s\n  run summary -> %s\n  history -> %s",
+                run_dir,
+                session_log_path or "not written",
+                run_summary_path or "not written",
+                "database" if config.SCRAPER_USE_DATABASE else "skipped (database disabled)",
+            )
+
+        # Nothing to sweep if no browser was ever launched (e.g. early config/input errors).
+        if browser_launched():
+            # Close the persistent browser used by this thread (worker pools close their own
+            # threads' browsers); anything still left behind is cleaned up by the sweep below.
+            close_browser()
+            # Only the processes recorded at launch are checked; psutil refuses to kill
+            # a PID that has since been reused. The full scan is a last resort.
+            tracked = spawned_browser_processes()
+            with suppress(Exception):
+                if tracked:
+                    for proc in tracked:
+                        with suppress(psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                            if proc.is_running():
+                                logging.debug(f"Attempting to kill lingering browser process: {proc.name()} (PID: {proc.pid})")
+                                proc.kill()
+                else:
+                    for proc in psutil.process_iter(['pid', 'name']):
+                        if 'playwright' in (proc.info['name'] or '').lower():
+                            logging.debug(f"Attempting to kill lingering Playwright process: {proc.info['name']} (PID: {proc.info['pid']})")
+                            with suppress(psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                                proc.kill()
             
         logging.info("Scraper finished.")
-        logging.shutdown()
+        with suppress(Exception):
+            logging.shutdown()
+            # The logging module registers shutdown() with atexit as well; handlers
+            # have already been flushed and closed above, so skip the second pass.
+            atexit.unregister(logging.shutdown)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,10 +1,89 @@
-from PIL import Image, ImageEnhance, ImageFilter, UnidentifiedImageError # Added UnidentifiedImageError for specific catch
+from PIL import Image, ImageFilter, ImageStat, UnidentifiedImageError # Added UnidentifiedImageError for specific catch
 import pytesseract
+import atexit
+import hashlib
+import io
 import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import suppress
+from functools import lru_cache
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import TypedDict, Union
+from typing import Any, TypedDict, Union, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 
+from . import config
+
+try:
+    import cv2 # Optional: OpenCV/numpy preprocessing instead of separate PIL passes
+    import numpy as np
+except ImportError:
+    cv2 = None
+    np = None
+
+# Tesseract's OpenMP threading scales poorly; run each engine single-threaded and get
+# parallelism from several workers instead. Set before tesserocr loads libtesseract (and
+# inherited by every pytesseract subprocess) unless the environment already chose a value.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+try:
+    import tesserocr # Optional: keeps Tesseract engines loaded in-process instead of a subprocess per call
+except ImportError:
+    tesserocr = None
+
+# Images flatter than this (greyscale pixel variance) are treated as text-free when fast_processing
+_MIN_TEXT_VARIANCE = 50.0
+
+# Same weights as PIL's ImageFilter.SHARPEN, so both preprocessing paths match
+_SHARPEN_KERNEL = np.array([[-2, -2, -2], [-2, 32, -2], [-2, -2, -2]], dtype=np.float32) / 16 if np is not None else None
+_SHARPEN_FILTER = ImageFilter.SHARPEN()  # Filter instances are stateless; build once
+# _SHARPEN_KERNEL with the 2x contrast gain folded in (see _enhance_cv2)
+_CONTRAST_SHARPEN_KERNEL = _SHARPEN_KERNEL * 2.0 if np is not None else None
+
+# One tesserocr engine per thread: PyTessBaseAPI is not thread-safe, and a single shared
+# engine behind a lock would cut ocr_images_parallel's workers down to one engine.
+_thread_tess = threading.local()
+_tess_apis: List[Any] = [] # Every engine created, so each is ended at exit
+_tess_apis_lock = threading.Lock()
+_tess_api_failed = False
+
+def _end_tess_apis() -> None:
+    with _tess_apis_lock:
+        for api in _tess_apis:
+            with suppress(Exception): api.End()
+        _tess_apis.clear()
+
+atexit.register(_end_tess_apis)
+
+def _get_tess_api():
+    """Return this thread's PyTessBaseAPI, creating it on first use (None if unavailable)."""
+    global _tess_api_failed
+    if tesserocr is None or _tess_api_failed:
+        return None
+    api = getattr(_thread_tess, 'api', None)
+    if api is None:
+        try:
+            api = tesserocr.PyTessBaseAPI()
+        except Exception as e:
+            logging.warning(f"tesserocr engine could not be initialized ({e}); using pytesseract instead")
+            _tess_api_failed = True
+            return None
+        with _tess_apis_lock:
+            _tess_apis.append(api)
+        _thread_tess.api = api
+    return api
+
+def _image_to_string(image: Image.Image) -> str:
+    """OCR a preprocessed image with this thread's tesserocr engine, or pytesseract as a fallback."""
+    api = _get_tess_api()
+    if api is not None:
+        api.SetImage(image)
+        return api.GetUTF8Text()
+    return pytesseract.image_to_string(image)
+
 class OCRResult(TypedDict):
     text: str
     char_count: int
@@ -12,13 +91,325 @@ class OCRResult(TypedDict):
     path: str
     ocr_status: str # New field for detailed status
 
+# OCR results by image content (plus preprocessing flags), so images repeated across
+# pages of a run (logos, banners, icons) are only recognised once. Least recently used
+# entries are evicted beyond config.OCR_CACHE_SIZE so long crawls don't grow it without bound.
+_ocr_cache: "OrderedDict[str, OCRResult]" = OrderedDict()
+_ocr_cache_lock = threading.Lock()
+_CACHEABLE_STATUSES = ("success", "no_text_found")
+
+def _content_cache_key(data: bytes, enhancement: bool, fast_processing: bool) -> str:
+    return f"{hashlib.sha1(data).hexdigest()}:{int(enhancement)}{int(fast_processing)}"
+
+def _ocr_cache_key(img_path: Path | str, enhancement: bool, fast_processing: bool) -> Optional[str]:
+    try:
+        data = Path(img_path).read_bytes()
+    except OSError:
+        return None # Let the normal OCR path report the file error
+    return _content_cache_key(data, enhancement, fast_processing)
+
+def _cached_ocr_result(cache_key: Optional[str], img_path: Path | str) -> Optional[OCRResult]:
+    if cache_key is None:
+        return None
+    with _ocr_cache_lock:
+        cached = _ocr_cache.get(cache_key)
+        if cached is None:
+            return None
+        _ocr_cache.move_to_end(cache_key)
+    logging.debug(f"OCR cache hit for {img_path}")
+    result = dict(cached)
+    result["path"] = str(img_path)
+    return result  # type: ignore[return-value]
+
+def _store_ocr_result(cache_key: Optional[str], result: OCRResult) -> None:
+    # Errors are not cached; a later attempt may succeed.
+    if cache_key is not None and result["ocr_status"] in _CACHEABLE_STATUSES:
+        with _ocr_cache_lock:
+            _ocr_cache[cache_key] = result
+            _ocr_cache.move_to_end(cache_key)
+            while len(_ocr_cache) > max(0, config.OCR_CACHE_SIZE):
+                _ocr_cache.popitem(last=False)
+
+def _empty_result(img_path: Path | str, ocr_status: str) -> OCRResult:
+    return {"text": "", "char_count": 0, "word_count": 0, "path": str(img_path), "ocr_status": ocr_status}
+
+class _LowTextLikelihood(Exception):
+    """Raised by _prepare_image when an image looks too flat to contain text."""
+
+def _error_result(img_path: Path | str, e: Exception) -> OCRResult:
+    """Log an OCR failure and map the exception to its ocr_status."""
+    if isinstance(e, _LowTextLikelihood):
+        logging.debug(f"Skipping OCR for {img_path}: {e}")
+        return _empty_result(img_path, "skipped_low_text_likelihood")
+    if isinstance(e, FileNotFoundError):
+        logging.error(f"Image file not found: {img_path} - {str(e)}")
+        return _empty_result(img_path, "error_file_not_found")
+    if isinstance(e, (IOError, UnidentifiedImageError)): # Catch PIL's UnidentifiedImageError and general IOErrors
+        logging.warning(f"Could not process image file (possibly unsupported format like SVG, or corrupt) for OCR at {img_path}: {type(e).__name__} - {str(e)}")
+        return _empty_result(img_path, "error_unsupported_format")
+    if isinstance(e, pytesseract.TesseractError):
+        logging.error(f"Tesseract OCR error for {img_path}: {str(e)}")
+        return _empty_result(img_path, "error_tesseract")
+    if isinstance(e, ValueError):
+        logging.error(f"ValueError during OCR for {img_path}: {str(e)}")
+        return _empty_result(img_path, "error_processing")
+    logging.error(f"Unexpected error during OCR for {img_path}: {type(e).__name__} - {str(e)}")
+    return _empty_result(img_path, "error_processing") # Generic processing error
+
+def _prepare_image(
+    img_path: Path | str, enhancement: bool, fast_processing: bool, data: Optional[bytes] = None
+) -> Optional[Image.Image]:
+    """Load an image and apply the OCR preprocessing; None if the image is empty or corrupted.
+
+    If data (the encoded file contents) is given it is decoded instead of reading img_path,
+    which then only labels log messages.
+    """
+    if data is not None and not data:
+        logging.error(f"Image appears to be empty or corrupted: {img_path}")
+        return None
+    if cv2 is not None:
+        # Decode straight to one grayscale array and stay in OpenCV from there;
+        # formats OpenCV cannot read (GIF, ...) go through PIL below.
+        if data is not None:
+            arr = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+        else:
+            arr = cv2.imread(str(img_path), cv2.IMREAD_GRAYSCALE)
+        if arr is not None:
+            logging.debug(f"Image decoded to grayscale by OpenCV: {arr.shape[1]}x{arr.shape[0]}")
+            return _prepare_array(arr, img_path, enhancement, fast_processing)
+
+    img = Image.open(io.BytesIO(data) if data is not None else str(img_path))
+    
+    # Log image format and mode
+    logging.debug(f"Image format: {img.format}, mode: {img.mode}")
+
+    # Go straight to grayscale: JPEGs are decoded as luminance only (full size, so
+    # OCR resolution is unchanged) and images that are already 'L' are used as-is.
+    if img.format == 'JPEG':
+        img.draft('L', img.size)
+    gray = img if img.mode == 'L' else img.convert('L')
+    gray.load()
+    logging.debug(f"Image converted to grayscale: {gray.size}")
+
+    # Check if image is empty or corrupted
+    if gray.getbbox() is None:
+        logging.error(f"Image appears to be empty or corrupted: {img_path}")
+        return None
+
+    if fast_processing:
+        reason = _low_text_likelihood(gray)
+        if reason:
+            raise _LowTextLikelihood(reason)
+
+    scale = _scale_factor(gray.width, gray.height, fast_processing)
+    if cv2 is not None:
+        return _enhance_cv2(np.asarray(gray), scale, enhancement)
+
+    # Resize (2x upscale if image is small, downscale if it is huge)
+    if scale != 1.0:
+        old_size = gray.size
+        new_size = (max(1, round(gray.width * scale)), max(1, round(gray.height * scale)))
+        resample = _resample_filter(enhancement) if scale > 1.0 else getattr(Image, 'Resampling', Image).BOX
+        gray = gray.resize(new_size, resample)
+        logging.debug(f"Image resized from {old_size} to {gray.size}")
+
+    # Improve contrast and sharpness if enhancement is enabled
+    if enhancement:
+        # Same result as ImageEnhance.Contrast(gray).enhance(2.0), applied as one lookup table
+        mean = int(ImageStat.Stat(gray).mean[0] + 0.5)
+        gray = gray.point(_contrast_lut(mean))  # Increase contrast
+        gray = gray.filter(_SHARPEN_FILTER)     # Apply sharpen filter
+        logging.debug("Applied contrast enhancement and sharpening")
+    else:
+        logging.debug("Skipping image enhancement")
+
+    if config.OCR_USE_OTSU:
+        threshold = _otsu_threshold(gray.histogram())
+        gray = gray.point(lambda p: 255 if p > threshold else 0)
+        logging.debug(f"Applied Otsu binarization (threshold {threshold})")
+    return gray
+
+@lru_cache(maxsize=256)
+def _contrast_lut(mean: int) -> List[int]:
+    """Lookup table for a 2x contrast stretch around the image's mean grey level (2*p - mean, clipped)."""
+    return [min(255, max(0, 2 * i - mean)) for i in range(256)]
+
+def _otsu_threshold(histogram: List[int]) -> int:
+    """Otsu's threshold for a 256-bin greyscale histogram (maximises between-class variance)."""
+    total = sum(histogram)
+    if total == 0:
+        return 127
+    sum_all = sum(i * count for i, count in enumerate(histogram))
+    sum_background = 0.0
+    weight_background = 0
+    best_threshold, best_variance = 0, -1.0
+    for level, count in enumerate(histogram):
+        weight_background += count
+        if weight_background == 0:
+            continue
+        weight_foreground = total - weight_background
+        if weight_foreground == 0:
+            break
+        sum_background += level * count
+        mean_background = sum_background / weight_background
+        mean_foreground = (sum_all - sum_background) / weight_foreground
+        variance = weight_background * weight_foreground * (mean_background - mean_foreground) ** 2
+        if variance > best_variance:
+            best_threshold, best_variance = level, variance
+    return best_threshold
+
+def _low_text_likelihood(gray: "Image.Image | np.ndarray") -> Optional[str]:
+    """Cheap pre-filter for photos, gradients and flat fills; returns why OCR should be skipped."""
+    if cv2 is not None:
+        arr = np.asarray(gray)
+        variance = float(arr.var())
+        edge_density = float(cv2.Canny(arr, 100, 200).mean())
+    else:
+        variance = ImageStat.Stat(gray).var[0]
+        edges = gray.filter(ImageFilter.FIND_EDGES).point(lambda p: 255 if p > 100 else 0)
+        edge_density = ImageStat.Stat(edges).mean[0]
+    if variance < _MIN_TEXT_VARIANCE:
+        return f"pixel variance {variance:.1f} below {_MIN_TEXT_VARIANCE}"
+    if edge_density < config.OCR_SKIP_THRESHOLD:
+        return f"edge density {edge_density:.2f} below {config.OCR_SKIP_THRESHOLD}"
+    return None
+
+def _scale_factor(width: int, height: int, fast_processing: bool) -> float:
+    """Resize factor before OCR.
+
+    Small images (<300px on a side) are upscaled 2x; images longer than OCR_MAX_DIMENSION
+    are shrunk to it. fast_processing leaves large images alone.
+    """
+    longest = max(width, height)
+    if config.OCR_MAX_DIMENSION > 0 and longest > config.OCR_MAX_DIMENSION:
+        return config.OCR_MAX_DIMENSION / longest
+    if fast_processing and not (width < 1000 and height < 1000):
+        logging.debug(f"Skipping resize for large image ({width}x{height}) due to fast_processing=True")
+        return 1.0
+    return 2.0 if width < 300 or height < 300 else 1.0
+
+def _wants_lanczos(enhancement: bool) -> bool:
+    """Lanczos only pays off for greyscale output; after binarization, or without enhancement, bilinear is indistinguishable."""
+    return enhancement and not config.OCR_USE_OTSU
+
+def _resample_filter(enhancement: bool) -> int:
+    """PIL resampling filter for the 2x upscale."""
+    resampling = getattr(Image, 'Resampling', Image)
+    return resampling.LANCZOS if _wants_lanczos(enhancement) else resampling.BILINEAR
+
+def _prepare_array(arr: "np.ndarray", img_path: Path | str, enhancement: bool, fast_processing: bool) -> Optional[Image.Image]:
+    """OpenCV counterpart of _prepare_image's checks for an already decoded grayscale array."""
+    if not arr.any():
+        logging.error(f"Image appears to be empty or corrupted: {img_path}")
+        return None
+    if fast_processing:
+        reason = _low_text_likelihood(arr)
+        if reason:
+            raise _LowTextLikelihood(reason)
+    height, width = arr.shape[:2]
+    return _enhance_cv2(arr, _scale_factor(width, height, fast_processing), enhancement)
+
+def _enhance_cv2(arr: "np.ndarray", scale: float, enhancement: bool) -> Image.Image:
+    """OpenCV version of the resize/contrast/sharpen chain, operating on one uint8 array."""
+    if scale != 1.0:
+        old_size = (arr.shape[1], arr.shape[0])
+        if scale < 1.0:
+            interpolation = cv2.INTER_AREA # Averages source pixels; no aliasing when shrinking
+        else:
+            interpolation = cv2.INTER_LANCZOS4 if _wants_lanczos(enhancement) else cv2.INTER_LINEAR
+        new_size = (max(1, round(old_size[0] * scale)), max(1, round(old_size[1] * scale)))
+        arr = cv2.resize(arr, new_size, interpolation=interpolation)
+        logging.debug(f"Image resized from {old_size} to {new_size}")
+    if enhancement and config.OCR_USE_CLAHE:
+        # Contrast equalized per 8x8 tile (clip limit 2.0), then the plain sharpen kernel
+        arr = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8)).apply(arr)
+        arr = cv2.filter2D(arr, -1, _SHARPEN_KERNEL)
+        logging.debug("Applied CLAHE contrast enhancement and sharpening")
+    elif enhancement:
+        # Contrast and sharpen fused into one convolution: ImageEnhance.Contrast(2.0) is
+        # 2*p - mean and the sharpen kernel sums to 1, so sharpen(2*p - mean) equals a
+        # doubled kernel with delta -mean (saturating once at the end instead of twice).
+        arr = cv2.filter2D(arr, -1, _CONTRAST_SHARPEN_KERNEL, delta=-float(arr.mean()))
+        logging.debug("Applied contrast enhancement and sharpening")
+    else:
+        logging.debug("Skipping image enhancement")
+    if config.OCR_USE_OTSU:
+        threshold, arr = cv2.threshold(arr, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        logging.debug(f"Applied Otsu binarization (threshold {threshold:.0f})")
+    if config.OCR_DESKEW:
+        arr = _deskew_cv2(arr)
+    return Image.fromarray(np.ascontiguousarray(arr))
+
+def _deskew_cv2(arr: "np.ndarray") -> "np.ndarray":
+    """Rotate the image so the dominant text direction is horizontal (minAreaRect over the dark pixels)."""
+    _, ink = cv2.threshold(arr, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    points = cv2.findNonZero(ink)
+    if points is None or len(points) < 10:
+        return arr
+    angle = cv2.minAreaRect(points)[-1]
+    # minAreaRect's angle convention differs across OpenCV versions; map it to (-45, 45]
+    if angle > 45:
+        angle -= 90
+    elif angle <= -45:
+        angle += 90
+    if abs(angle) < 1.0:
+        return arr
+    height, width = arr.shape[:2]
+    matrix = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+    logging.debug(f"Deskewing image by {angle:.1f} degrees")
+    return cv2.warpAffine(arr, matrix, (width, height), flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+
+def _split_tiles(image: Image.Image) -> List[Image.Image]:
+    """Split an image into roughly equal 3:4 tiles no larger than OCR_TILE_MAX_DIMENSION high,
+    in reading order (rows top to bottom, left to right). Small images come back whole."""
+    tile_height = config.OCR_TILE_MAX_DIMENSION
+    tile_width = max(1, tile_height * 3 // 4)
+    if tile_height <= 0 or (image.width <= tile_width and image.height <= tile_height):
+        return [image]
+    # Even steps, so the last row/column isn't a thin sliver
+    step_x = -(-image.width // -(-image.width // tile_width))
+    step_y = -(-image.height // -(-image.height // tile_height))
+    return [
+        image.crop((x, y, min(x + step_x, image.width), min(y + step_y, image.height)))
+        for y in range(0, image.height, step_y)
+        for x in range(0, image.width, step_x)
+    ]
+
+def _image_to_string_tiled(image: Image.Image) -> str:
+    """_image_to_string over each tile of a large image, joining the texts in reading order."""
+    tiles = _split_tiles(image)
+    if len(tiles) == 1:
+        return _image_to_string(image)
+    logging.debug(f"OCR over {len(tiles)} tiles of a {image.width}x{image.height} image")
+    return "\n".join(text for text in (_image_to_string(tile).strip() for tile in tiles) if text)
+
+def _text_result(text: str, img_path: Path | str) -> OCRResult:
+    text_length = len(text)
+    word_count = len(text.split())
+    logging.info(f"OCR completed: extracted {text_length} characters, {word_count} words for {img_path}")
+    
+    if text_length == 0:
+        logging.warning(f"No text extracted from {img_path}")
+        ocr_status = "no_text_found"
+    else:
+        ocr_status = "success"
+    
+    return {
+        "text": text,
+        "char_count": text_length,
+        "word_count": word_count,
+        "path": str(img_path),
+        "ocr_status": ocr_status
+    }
+
 def ocr_image(img_path: Path | str, enhancement: bool = True, fast_processing: bool = False) -> OCRResult:
     """Perform OCR on an image file.
     
     Args:
         img_path (Path | str): Path to the image file
         enhancement (bool, optional): Whether to apply contrast enhancement and sharpening. Defaults to True.
-        fast_processing (bool, optional): If True, skips resizing for larger images (>1000x1000). Defaults to False.
+        fast_processing (bool, optional): If True, skips resizing for larger images (>1000x1000) and skips
+            OCR entirely for images that look text-free (low variance / edge density). Defaults to False.
         
     Returns:
         OCRResult: Dictionary containing:
@@ -28,89 +419,203 @@ def ocr_image(img_path: Path | str, enhancement: bool = True, fast_processing: b
             - path (str): Input image path as string
             - ocr_status (str): Detailed status of the OCR operation
                                 ('success', 'no_text_found', 'error_unsupported_format',
-                                 'error_processing', 'error_file_not_found', 'error_tesseract')
+                                 'error_processing', 'error_file_not_found', 'error_tesseract',
+                                 'skipped_low_text_likelihood')
             
     Raises:
         ValueError: If the image is empty or corrupted (this is now handled internally and returns a dict)
     """
-    ocr_status = "error_processing" # Default status
     try:
-        logging.debug(f"Starting OCR processing for {img_path}")
-        img = Image.open(str(img_path)).convert('RGB')
-        
-        # Log image format and mode
-        logging.debug(f"Image format: {img.format}, mode: {img.mode}")
-
-        # Check if image is empty or corrupted
-        if img.getbbox() is None:
-            error_msg = f"Image appears to be empty or corrupted: {img_path}"
-            logging.error(error_msg)
-            # Instead of raising ValueError, return the standard error dict
-            ocr_status = "error_processing" # Specifically, image seems corrupt or empty
-            return {
-                "text": "", "char_count": 0, "word_count": 0, "path": str(img_path), "ocr_status": ocr_status
-            }
-
-        # Convert to grayscale
-        gray = img.convert('L')
-        logging.debug(f"Image converted to grayscale: {gray.size}")
-
-        # Resize (2x upscale if image is small)
-        if not fast_processing or (gray.width < 1000 and gray.height < 1000):
-            if gray.width < 300 or gray.height < 300:
-                old_size = gray.size
-                gray = gray.resize((gray.width * 2, gray.height * 2), Image.Resampling.LANCZOS if hasattr(Image, 'Resampling') else 1)
-                logging.debug(f"Image upscaled from {old_size} to {gray.size}")
-        else:
-            logging.debug(f"Skipping resize for large image ({gray.width}x{gray.height}) due to fast_processing=True")
+        # Read once: the same bytes key the result cache and are decoded for OCR
+        data = Path(img_path).read_bytes()
+    except OSError as e:
+        return _error_result(img_path, e)
+    return ocr_image_bytes(data, img_path, enhancement, fast_processing)
 
-        # Improve contrast and sharpness if enhancement is enabled
-        if enhancement:
-            gray = ImageEnhance.Contrast(gray).enhance(2.0)  # Increase contrast
-            gray = gray.filter(ImageFilter.SHARPEN)         # Apply sharpen filter
-            logging.debug("Applied contrast enhancement and sharpening")
-        else:
-            logging.debug("Skipping image enhancement")
+def ocr_image_bytes(
+    data: bytes, img_path: Path | str = "<memory>", enhancement: bool = True, fast_processing: bool = False
+) -> OCRResult:
+    """Perform OCR on an encoded image (PNG, JPEG, ...) held in memory.
+
+    Same preprocessing, caching and result format as ocr_image(); img_path is not read,
+    it only labels the result and log messages (e.g. where the image was or will be saved).
+    """
+    cache_key = _content_cache_key(data, enhancement, fast_processing)
+    cached = _cached_ocr_result(cache_key, img_path)
+    if cached is not None:
+        return cached
+    try:
+        logging.debug(f"Starting OCR processing for {img_path}")
+        gray = _prepare_image(img_path, enhancement, fast_processing, data)
+        if gray is None:
+            # Image seems corrupt or empty
+            return _empty_result(img_path, "error_processing")
 
         # Run OCR
-        text = pytesseract.image_to_string(gray)
-        text_length = len(text)
-        word_count = len(text.split())
-        logging.info(f"OCR completed: extracted {text_length} characters, {word_count} words for {img_path}")
-        
-        if text_length == 0:
-            logging.warning(f"No text extracted from {img_path}")
-            ocr_status = "no_text_found"
-        else:
-            ocr_status = "success"
-        
-        return {
-            "text": text,
-            "char_count": text_length,
-            "word_count": word_count,
-            "path": str(img_path),
-            "ocr_status": ocr_status
-        }
-    except FileNotFoundError as e:
-        logging.error(f"Image file not found: {img_path} - {str(e)}")
-        ocr_status = "error_file_not_found"
-        return {"text": "", "char_count": 0, "word_count": 0, "path": str(img_path), "ocr_status": ocr_status}
-    except (IOError, UnidentifiedImageError) as e: # Catch PIL's UnidentifiedImageError and general IOErrors
-        logging.warning(f"Could not process image file (possibly unsupported format like SVG, or corrupt) for OCR at {img_path}: {type(e).__name__} - {str(e)}")
-        ocr_status = "error_unsupported_format"
-        return {"text": "", "char_count": 0, "word_count": 0, "path": str(img_path), "ocr_status": ocr_status}
-    except pytesseract.TesseractError as e:
-        logging.error(f"Tesseract OCR error for {img_path}: {str(e)}")
-        ocr_status = "error_tesseract"
-        return {"text": "", "char_count": 0, "word_count": 0, "path": str(img_path), "ocr_status": ocr_status}
-    except ValueError as e: # This was originally for empty/corrupted, now handled above. Kept for other ValueErrors.
-        logging.error(f"ValueError during OCR for {img_path}: {str(e)}")
-        ocr_status = "error_processing"
-        return {"text": "", "char_count": 0, "word_count": 0, "path": str(img_path), "ocr_status": ocr_status}
+        text = _image_to_string_tiled(gray)
+        result = _text_result(text, img_path)
+        _store_ocr_result(cache_key, result)
+        return result
     except Exception as e:
-        logging.error(f"Unexpected error during OCR for {img_path}: {type(e).__name__} - {str(e)}")
-        ocr_status = "error_processing" # Generic processing error
-        return {"text": "", "char_count": 0, "word_count": 0, "path": str(img_path), "ocr_status": ocr_status}
+        return _error_result(img_path, e)
+
+def _ocr_list_file(image_files: List[Path], list_file: Path) -> Optional[List[str]]:
+    """Run one Tesseract process over every image named in list_file.
+
+    Tesseract treats a .txt input as a list of images and ends each page's text with
+    a form feed. Returns None if the output cannot be split back into one text per image.
+    """
+    list_file.write_text("\n".join(str(f) for f in image_files) + "\n", encoding='utf-8')
+    output = pytesseract.image_to_string(str(list_file))
+    pages = output.split('\f')
+    if len(pages) == len(image_files) + 1 and not pages[-1].strip():
+        pages.pop()
+    if len(pages) != len(image_files):
+        logging.warning(f"Batch OCR returned {len(pages)} pages for {len(image_files)} images; falling back to per-image OCR")
+        return None
+    return pages
+
+def ocr_images_batch(
+    img_paths: Sequence[Path | str],
+    enhancement: bool = True,
+    fast_processing: bool = False,
+    batch_size: Optional[int] = None
+) -> List[OCRResult]:
+    """Perform OCR on several images with one Tesseract invocation per batch.
+
+    Each image gets the same preprocessing as ocr_image(), is written to a temporary
+    PNG, and up to batch_size of them are recognised by a single Tesseract process.
+    When tesserocr is installed the persistent in-process engine is used instead.
+    If a batch fails or its output cannot be split per image, that batch is retried
+    one image at a time.
+
+    Returns:
+        List[OCRResult]: One result per input path, in the same order.
+    """
+    batch_size = max(1, batch_size or config.OCR_BATCH_SIZE)
+    results: List[Optional[OCRResult]] = [None] * len(img_paths)
+    # Content key -> index of the first image with that content that is actually OCR'd
+    first_index_by_key: Dict[str, int] = {}
+    duplicates: List[Tuple[int, int]] = [] # (index, index of identical image)
+
+    with tempfile.TemporaryDirectory(prefix="ocr_batch_") as tmp_dir_str:
+        tmp_dir = Path(tmp_dir_str)
+        prepared: List[Tuple[int, Path]] = []
+        for index, img_path in enumerate(img_paths):
+            cache_key = _ocr_cache_key(img_path, enhancement, fast_processing)
+            if cache_key is not None:
+                cached = _cached_ocr_result(cache_key, img_path)
+                if cached is not None:
+                    results[index] = cached
+                    continue
+                if cache_key in first_index_by_key:
+                    duplicates.append((index, first_index_by_key[cache_key]))
+                    continue
+                first_index_by_key[cache_key] = index
+            try:
+                logging.debug(f"Starting OCR processing for {img_path}")
+                gray = _prepare_image(img_path, enhancement, fast_processing)
+                if gray is None:
+                    results[index] = _empty_result(img_path, "error_processing")
+                    continue
+                if (tesserocr is not None and not _tess_api_failed) or len(_split_tiles(gray)) > 1:
+                    # An in-process engine has no startup cost to amortize, and a tiled image
+                    # is several OCR calls already; OCR these directly.
+                    results[index] = _text_result(_image_to_string_tiled(gray), img_path)
+                    continue
+                prepared_file = tmp_dir / f"{index:05d}.png"
+                gray.save(prepared_file)
+                prepared.append((index, prepared_file))
+            except Exception as e:
+                results[index] = _error_result(img_path, e)
+
+        for start in range(0, len(prepared), batch_size):
+            chunk = prepared[start:start + batch_size]
+            pages: Optional[List[str]] = None
+            if len(chunk) > 1:
+                try:
+                    pages = _ocr_list_file([f for _, f in chunk], tmp_dir / f"batch_{start:05d}.txt")
+                except Exception as e:
+                    logging.warning(f"Batch OCR of {len(chunk)} images failed ({type(e).__name__}: {e}); falling back to per-image OCR")
+            if pages is not None:
+                for (index, _), text in zip(chunk, pages):
+                    results[index] = _text_result(text, img_paths[index])
+                continue
+            for index, prepared_file in chunk:
+                try:
+                    results[index] = _text_result(pytesseract.image_to_string(str(prepared_file)), img_paths[index])
+                except Exception as e:
+                    results[index] = _error_result(img_paths[index], e)
+
+    for cache_key, index in first_index_by_key.items():
+        _store_ocr_result(cache_key, results[index])
+    for index, source_index in duplicates:
+        duplicate = dict(results[source_index])
+        duplicate["path"] = str(img_paths[index])
+        results[index] = duplicate  # type: ignore[assignment]
+    return results  # type: ignore[return-value]
+
+def ocr_images_parallel(
+    img_paths: Sequence[Path | str],
+    max_workers: Optional[int] = None,
+    enhancement: bool = True,
+    fast_processing: bool = False
+) -> List[OCRResult]:
+    """Perform OCR on several images concurrently, one ocr_image() call per image.
+
+    Tesseract runs outside the GIL, so threads give close to linear speed-up (with
+    tesserocr, each thread has its own engine). With config.OCR_USE_PROCESSES a shared
+    process pool is used instead. The worker count is capped at half the CPU
+    count; each Tesseract engine is single-threaded (OMP_THREAD_LIMIT=1, see above).
+
+    Returns:
+        List[OCRResult]: One result per input path, in the same order.
+    """
+    max_workers = min(max_workers or config.OCR_MAX_WORKERS, max(1, (os.cpu_count() or 2) // 2), max(1, len(img_paths)))
+    if max_workers <= 1:
+        return [ocr_image(p, enhancement, fast_processing) for p in img_paths]
+
+    if config.OCR_USE_PROCESSES:
+        return _ocr_with_executor(_get_ocr_process_pool(max_workers), img_paths, enhancement, fast_processing)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ocr") as executor:
+        return _ocr_with_executor(executor, img_paths, enhancement, fast_processing)
+
+def _ocr_with_executor(
+    executor: Executor,
+    img_paths: Sequence[Path | str],
+    enhancement: bool,
+    fast_processing: bool
+) -> List[OCRResult]:
+    """Run ocr_image() for every path on executor, returning results in input order."""
+    results: List[Optional[OCRResult]] = [None] * len(img_paths)
+    futures = {executor.submit(ocr_image, p, enhancement, fast_processing): i for i, p in enumerate(img_paths)}
+    for future in as_completed(futures):
+        index = futures[future]
+        try:
+            results[index] = future.result()
+        except Exception as e: # ocr_image handles its own errors; this catches worker crashes
+            results[index] = _error_result(img_paths[index], e)
+    return results  # type: ignore[return-value]
+
+# Worker processes are expensive to start, so one pool is kept for the life of the process.
+_ocr_process_pool: Optional[ProcessPoolExecutor] = None
+_ocr_process_pool_lock = threading.Lock()
+
+def _get_ocr_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared OCR process pool, creating it on first use.
+
+    Workers are replaced after config.OCR_WORKER_MAX_TASKS images to cap memory growth
+    in long runs.
+    """
+    global _ocr_process_pool
+    with _ocr_process_pool_lock:
+        if _ocr_process_pool is None:
+            _ocr_process_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                max_tasks_per_child=max(1, config.OCR_WORKER_MAX_TASKS)
+            )
+            atexit.register(_ocr_process_pool.shutdown, cancel_futures=True)
+        return _ocr_process_pool
 
 def generate_ocr_summary(images: list) -> dict:
     """Generate a summary of OCR results from a list of images.
@@ -129,7 +634,7 @@ def generate_ocr_summary(images: list) -> dict:
     """
     logging.info(f"Generating OCR summary for {len(images)} images")
     
-    total_text = ""
+    text_parts: List[str] = []
     total_char_count = 0
     total_word_count = 0
     successful_ocr_count = 0
@@ -143,11 +648,11 @@ def generate_ocr_summary(images: list) -> dict:
             
         if ocr_text: # Considered successful if any text is present
             successful_ocr_count += 1
-            total_text += ocr_text + "\n\n"
+            text_parts.append(ocr_text)
             
-            # Use char_count and word_count directly from ocr_image result
-            char_count = img.get('char_count', 0)
-            word_count = img.get('word_count', 0)
+            # Use char_count and word_count directly from ocr_image result, counting only if missing
+            char_count = img.get('char_count') or len(ocr_text)
+            word_count = img.get('word_count') or len(ocr_text.split())
             total_char_count += char_count
             total_word_count += word_count
             
@@ -168,6 +673,9 @@ def generate_ocr_summary(images: list) -> dict:
                 'ocr_success': False # Mark as not successful if no text
             })
     
+    # Joined once at the end; repeated += copies the accumulated text on every image
+    total_text = "\n\n".join(text_parts)
+
     # Create summary dictionary
     summary = {
         'total_ocr_text': total_text.strip(),
@@ -1,8 +1,10 @@
+import asyncio
 import time
 import logging
 import os
-from threading import Lock
-from typing import Optional, Dict
+from collections import deque
+from threading import Condition, Lock
+from typing import Deque, Optional, Dict
 from . import config
 
 def _get_env_float(key: str, default: float) -> float:
@@ -66,8 +68,12 @@ class RateLimiter:
         
         self.capacity: float = float(burst)
         self.tokens: float = float(burst)  # Start with full bucket
-        self.last_update: float = time.time()
-        self.lock: Lock = Lock()
+        self._inv_rate: float = 1.0 / self.rate if self.rate > 0 else float('inf')  # Seconds per token
+        # Monotonic: wall-clock jumps (NTP, DST) must not stall or overfill the bucket
+        self.last_update: float = time.monotonic()
+        self.cond: Condition = Condition()  # Guards the bucket; reset() notifies waiters
+        # Monotonic time before which no token is handed out (set by back_off() after throttling)
+        self.backoff_until: float = 0.0
         
         resource_info = f" for resource '{resource_name}'" if resource_name else ""
         logging.info(
@@ -77,7 +83,7 @@ class RateLimiter:
     
     def _update_tokens(self) -> None:
         """Update the token count based on elapsed time."""
-        now: float = time.time()
+        now: float = time.monotonic()
         time_passed: float = now - self.last_update
         self.last_update = now
         
@@ -95,21 +101,24 @@ class RateLimiter:
         Returns:
             bool: True if a token was acquired, False if timeout occurred
         """
-        start_time: float = time.time()
-        sleep_time: float = 0.1  # Initial sleep time in seconds
-        max_sleep_time: float = 1.0  # Maximum sleep time in seconds
+        start_time: float = time.monotonic()
         
-        while True:
-            with self.lock:
+        with self.cond:
+            while True:
                 self._update_tokens()
                 
-                if self.tokens >= 1:
+                backoff_wait: float = self.backoff_until - self.last_update
+                if self.tokens >= 1 and backoff_wait <= 0:
                     self.tokens -= 1
                     logging.debug(f"Token acquired. Remaining tokens: {self.tokens:.2f}")
                     return True
                 
+                # Refill is deterministic, so wait exactly until the next token is due (or the
+                # host's backoff ends); reset() can wake waiters earlier via notify_all().
+                wait_time: float = max((1.0 - self.tokens) * self._inv_rate, backoff_wait)
+                
                 if timeout is not None:
-                    elapsed: float = time.time() - start_time
+                    elapsed: float = time.monotonic() - start_time
                     if elapsed >= timeout:
                         logging.warning(
                             f"Token acquisition timed out after {elapsed:.2f}s. "
@@ -117,16 +126,14 @@ class RateLimiter:
                             f"Rate: {self.rate} req/s"
                         )
                         return False
+                    wait_time = min(wait_time, timeout - elapsed)
                 
                 logging.debug(
                     f"Waiting for token. Current tokens: {self.tokens:.2f}, "
                     f"Rate: {self.rate} req/s, "
-                    f"Sleep time: {sleep_time:.2f}s"
+                    f"Wait time: {wait_time:.2f}s"
                 )
-            
-            # Sleep with exponential backoff
-            time.sleep(sleep_time)
-            sleep_time = min(sleep_time * 1.5, max_sleep_time)  # Increase sleep time up to max
+                self.cond.wait(timeout=wait_time)
     
     def wait(self) -> None:
         """Wait until a token is available.
@@ -135,6 +142,34 @@ class RateLimiter:
         """
         self.acquire()
     
+    async def acquire_async(self) -> None:
+        """Wait for a token without blocking the event loop.
+        
+        Shares the bucket with acquire(); the lock is only held to update it, and the
+        wait for the next token is an asyncio.sleep.
+        """
+        while True:
+            with self.cond:
+                self._update_tokens()
+                backoff_wait: float = self.backoff_until - self.last_update
+                if self.tokens >= 1 and backoff_wait <= 0:
+                    self.tokens -= 1
+                    logging.debug(f"Token acquired. Remaining tokens: {self.tokens:.2f}")
+                    return
+                wait_time: float = max((1.0 - self.tokens) * self._inv_rate, backoff_wait)
+            await asyncio.sleep(wait_time)
+    
+    def back_off(self, delay: float) -> None:
+        """Hold every caller of this limiter for delay seconds from now.
+        
+        Used after the resource throttles or fails (HTTP 429/5xx) so that all workers
+        pause together instead of each hitting it again; an earlier deadline never
+        shortens one already set.
+        """
+        with self.cond:
+            self.backoff_until = max(self.backoff_until, time.monotonic() + delay)
+        logging.info(f"Backing off{f' from {self.resource_name}' if self.resource_name else ''} for {delay:.2f}s")
+    
     def reset(self) -> None:
         """Reset the token bucket to its initial capacity.
         
@@ -142,19 +177,22 @@ class RateLimiter:
         updates the last update timestamp. Useful for resetting the rate limiter
         after a period of inactivity or when starting a new batch of requests.
         
-        Note: This method is thread-safe and will acquire the lock before resetting.
+        Note: This method is thread-safe and wakes any threads blocked in acquire().
         """
-        with self.lock:
+        with self.cond:
             self.tokens = self.capacity
-            self.last_update = time.time()
+            self.last_update = time.monotonic()
+            self.backoff_until = 0.0
+            self.cond.notify_all()
             logging.info(
                 f"Rate limiter reset: tokens={self.tokens:.2f}, "
                 f"capacity={self.capacity:.2f}, "
                 f"rate={self.rate} req/s"
             )
 
-# Global rate limiter instances
+# Global rate limiter instances, one per resource name
 _rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock: Lock = Lock()
 
 def get_rate_limiter(resource_name: Optional[str] = None) -> RateLimiter:
     """Get a rate limiter instance for the specified resource.
@@ -166,12 +204,67 @@ def get_rate_limiter(resource_name: Optional[str] = None) -> RateLimiter:
     Returns:
         RateLimiter: The rate limiter instance for the specified resource
     """
-    global _rate_limiters
-    
     if resource_name is None:
         resource_name = "default"
     
-    if resource_name not in _rate_limiters:
-        _rate_limiters[resource_name] = RateLimiter(resource_name=resource_name)
+    # Lock-free lookup on the hot path; creation is locked so concurrent workers
+    # never end up with two limiters for the same resource.
+    limiter = _rate_limiters.get(resource_name)
+    if limiter is None:
+        with _rate_limiters_lock:
+            limiter = _rate_limiters.get(resource_name)
+            if limiter is None:
+                limiter = _rate_limiters[resource_name] = RateLimiter(resource_name=resource_name)
+    return limiter
+
+class AdaptiveBackoffState:
+    """Recent success/failure history for one host, used to scale its retry delays.
+    
+    Keeps an exponentially weighted failure rate (weight alpha per outcome) plus the
+    last window outcomes. Healthy hosts keep the base retry delay; hosts that keep
+    failing back off up to 5x longer.
+    """
+    
+    def __init__(self, alpha: float = 0.2, window: int = 32):
+        self.alpha = alpha
+        self.ewma_failure_rate: float = 0.0
+        self.outcomes: Deque[bool] = deque(maxlen=window)  # True = failure
+        self._lock: Lock = Lock()
+    
+    def _record(self, failed: bool) -> None:
+        with self._lock:
+            self.ewma_failure_rate += self.alpha * ((1.0 if failed else 0.0) - self.ewma_failure_rate)
+            self.outcomes.append(failed)
     
-    return _rate_limiters[resource_name] 
\ No newline at end of file
+    def record_success(self) -> None:
+        """Record a successful call to this host."""
+        self._record(False)
+    
+    def record_failure(self, exception: Optional[BaseException] = None) -> None:
+        """Record a failed (retryable) call to this host."""
+        self._record(True)
+        logging.debug(f"Host failure recorded ({type(exception).__name__ if exception else 'unknown'}); EWMA failure rate now {self.ewma_failure_rate:.2f}")
+    
+    @property
+    def recent_failure_ratio(self) -> float:
+        """Share of failures among the last window outcomes."""
+        with self._lock:
+            return sum(self.outcomes) / len(self.outcomes) if self.outcomes else 0.0
+    
+    def delay_multiplier(self) -> float:
+        """Factor applied to the base retry delay: 1.0 for a healthy host, up to 5.0."""
+        return 1.0 + 4.0 * self.ewma_failure_rate
+
+# Adaptive backoff state per host, created on first use
+_backoff_states: Dict[str, AdaptiveBackoffState] = {}
+_backoff_states_lock: Lock = Lock()
+
+def get_backoff_state(hostname: str) -> AdaptiveBackoffState:
+    """Get the adaptive backoff state for a host (the key scrape_page uses for its rate limiter)."""
+    state = _backoff_states.get(hostname)
+    if state is None:
+        with _backoff_states_lock:
+            state = _backoff_states.get(hostname)
+            if state is None:
+                state = _backoff_states[hostname] = AdaptiveBackoffState()
+    return state
@@ -1,9 +1,12 @@
+import asyncio
 import time
 import logging
 import random
 from functools import wraps
 from typing import Callable, TypeVar, Any, Optional, Type, Dict, List, Union, Tuple
 
+from .rate_limiter import AdaptiveBackoffState, get_backoff_state
+from .utils import parse_url
 from .exceptions import (
     ScrapingError, ConnectionError, ServerError, 
     ServiceUnavailableError, RateLimitError
@@ -12,13 +15,18 @@ from .exceptions import (
 # Type variable for generic function return type
 T = TypeVar('T')
 
+JITTER_STRATEGIES = ('full', 'decorrelated', 'equal')
+
 def retry_with_backoff(
     max_retries: int = 3,
     initial_delay: float = 1.0,
     max_delay: float = 60.0,
     backoff_factor: float = 2.0,
     jitter: bool = True,
-    retry_on_exceptions: Optional[List[Type[Exception]]] = None
+    retry_on_exceptions: Optional[List[Type[Exception]]] = None,
+    jitter_strategy: str = 'full',
+    adaptive: bool = False,
+    total_timeout: Optional[float] = None
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Decorator that retries a function with exponential backoff when specified exceptions occur.
@@ -31,10 +39,22 @@ def retry_with_backoff(
         jitter: Whether to add random jitter to the delay to prevent thundering herd
         retry_on_exceptions: List of exception types to retry on. If None, retries on
                             ConnectionError, ServerError, ServiceUnavailableError, and RateLimitError
+        jitter_strategy: How jitter is applied when jitter is True:
+                         'full' - uniform between 0 and the capped exponential delay (default)
+                         'decorrelated' - uniform between initial_delay and 3x the previous delay
+                         'equal' - the capped exponential delay ±25%
+        adaptive: If True and the call's first argument (or url= keyword) is a URL, the
+                  base delay is scaled by that host's recent failure rate (see
+                  rate_limiter.AdaptiveBackoffState), and each outcome is recorded there
+        total_timeout: Optional wall-clock budget in seconds for all attempts of one call;
+                       a retry whose backoff would end past it is not attempted
     
     Returns:
         Decorated function that will be retried with exponential backoff
     """
+    if jitter_strategy not in JITTER_STRATEGIES:
+        raise ValueError(f"Unknown jitter_strategy '{jitter_strategy}'; expected one of {JITTER_STRATEGIES}")
+
     if retry_on_exceptions is None:
         retry_on_exceptions = [
             ConnectionError,
@@ -44,10 +64,118 @@ def retry_with_backoff(
         ]
     
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        retryable = tuple(retry_on_exceptions)
+
+        def backoff_state(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[AdaptiveBackoffState]:
+            """The per-host backoff state for this call (only called when adaptive)."""
+            url = kwargs.get('url', args[0] if args else None)
+            if not isinstance(url, str):
+                return None
+            hostname = parse_url(url).netloc # Memoized; the same URL is usually parsed again by func
+            return get_backoff_state(hostname or "default")
+
+        def past_deadline(deadline: Optional[float], delay: float) -> bool:
+            """True if sleeping delay seconds would run past the call's deadline."""
+            if deadline is None or time.monotonic() + delay < deadline:
+                return False
+            logging.error("Giving up on %s: the %.2fs backoff would exceed its %ss total timeout", func.__name__, delay, total_timeout)
+            return True
+
+        def plan_retry(e: Exception, attempt: int, delay: float, state: Optional[AdaptiveBackoffState] = None) -> Optional[float]:
+            """Log a retryable failure and return the delay before the next attempt, or None if retries are exhausted."""
+            # Recorded before the exhaustion check: the final failure is the strongest sign the host is unhealthy
+            if state is not None:
+                state.record_failure(e)
+            # If this was the last attempt, the caller re-raises the exception
+            if attempt >= max_retries:
+                logging.error(
+                    "All %s retry attempts failed for %s. Last error: %s", max_retries, func.__name__, e
+                )
+                return None
+            
+            # Exponential schedule, capped before jitter is sampled so that
+            # jittered delays keep spreading out even once max_delay is reached
+            base_delay = initial_delay
+            if state is not None:
+                base_delay *= state.delay_multiplier()
+            cap = min(base_delay * backoff_factor ** (attempt + 1), max_delay)
+            if not jitter:
+                delay = cap
+            elif jitter_strategy == 'full':
+                delay = random.uniform(0, cap)
+            elif jitter_strategy == 'decorrelated':
+                delay = min(max_delay, random.uniform(initial_delay, max(delay, initial_delay) * 3))
+            else: # 'equal'
+                delay = min(cap * (0.75 + random.random() * 0.5), max_delay)
+            
+            # Special handling for specific exceptions
+            if isinstance(e, RateLimitError):
+                retry_after = getattr(e, 'details', {}).get('retry_after')
+                if retry_after is not None and float(retry_after) > max_delay:
+                    # Retrying any sooner is certain to be rate limited again; give up instead
+                    logging.error(
+                        "Rate limit detected. Retry-After of %.2fs exceeds the %.2fs maximum delay; giving up on %s.",
+                        float(retry_after), max_delay, func.__name__
+                    )
+                    return None
+                if retry_after is not None:
+                    # The server said how long to wait; add a little jitter so clients don't return in lockstep
+                    delay = min(float(retry_after) + random.uniform(0, 1), max_delay)
+                    logging.warning("Rate limit detected. Honoring Retry-After: waiting %.2fs.", delay)
+                else:
+                    logging.warning(
+                        f"Rate limit detected. Consider increasing backoff or reducing request frequency."
+                    )
+                    # For rate limits, we might want to increase the delay more aggressively
+                    delay = min(delay * 2, max_delay)
+            elif isinstance(e, ServiceUnavailableError):
+                logging.warning(
+                    f"Service unavailable (HTTP 503). Server may be temporarily down or overloaded."
+                )
+
+            # Log the exception and retry plan, with the delay actually used
+            logging.warning(
+                "Exception in %s (attempt %s/%s): %s: %s. Retrying in %.2fs...", func.__name__, attempt+1, max_retries+1, type(e).__name__, e, delay
+            )
+            return delay
+
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                # Same loop as wrapper below, but backs off with asyncio.sleep so the
+                # event loop keeps serving other tasks while this one waits.
+                delay = initial_delay
+                state = backoff_state(args, kwargs) if adaptive else None
+                deadline = time.monotonic() + total_timeout if total_timeout else None
+                for attempt in range(max_retries + 1):
+                    try:
+                        if attempt > 0:
+                            logging.info(
+                                "Retry attempt %s/%s for %s after %.2fs delay", attempt, max_retries, func.__name__, delay
+                            )
+                        result = await func(*args, **kwargs)
+                        if state is not None:
+                            state.record_success()
+                        return result
+                    except retryable as e:
+                        next_delay = plan_retry(e, attempt, delay, state)
+                        if next_delay is None or past_deadline(deadline, next_delay):
+                            raise
+                        delay = next_delay
+                        await asyncio.sleep(delay)
+                    except Exception as e:
+                        logging.error("Non-retryable exception in %s: %s: %s", func.__name__, type(e).__name__, e)
+                        raise
+                raise RuntimeError(f"Unexpected error in retry logic for {func.__name__}")
+
+            return async_wrapper  # type: ignore[return-value]
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
             last_exception = None
             delay = initial_delay
+            state = backoff_state(args, kwargs) if adaptive else None
+            deadline = time.monotonic() + total_timeout if total_timeout else None
             
             # Try the function up to max_retries + 1 times (initial attempt + retries)
             for attempt in range(max_retries + 1):
@@ -55,55 +183,29 @@ def retry_with_backoff(
                     # If this is a retry attempt, log it
                     if attempt > 0:
                         logging.info(
-                            f"Retry attempt {attempt}/{max_retries} for {func.__name__} "
-                            f"after {delay:.2f}s delay"
+                            "Retry attempt %s/%s for %s after %.2fs delay", attempt, max_retries, func.__name__, delay
                         )
                     
                     # Call the function
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
+                    if state is not None:
+                        state.record_success()
+                    return result
                     
-                except tuple(retry_on_exceptions) as e:
+                except retryable as e:
                     last_exception = e
                     
-                    # If this was the last attempt, re-raise the exception
-                    if attempt >= max_retries:
-                        logging.error(
-                            f"All {max_retries} retry attempts failed for {func.__name__}. "
-                            f"Last error: {str(e)}"
-                        )
+                    next_delay = plan_retry(e, attempt, delay, state)
+                    if next_delay is None or past_deadline(deadline, next_delay):
                         raise
-                    
-                    # Calculate next delay with exponential backoff
-                    delay = min(delay * backoff_factor, max_delay)
-                    
-                    # Add jitter if enabled (±25% of delay)
-                    if jitter:
-                        delay = delay * (0.75 + random.random() * 0.5)
-                    
-                    # Log the exception and retry plan
-                    logging.warning(
-                        f"Exception in {func.__name__} (attempt {attempt+1}/{max_retries+1}): "
-                        f"{type(e).__name__}: {str(e)}. Retrying in {delay:.2f}s..."
-                    )
-                    
-                    # Special handling for specific exceptions
-                    if isinstance(e, RateLimitError):
-                        logging.warning(
-                            f"Rate limit detected. Consider increasing backoff or reducing request frequency."
-                        )
-                        # For rate limits, we might want to increase the delay more aggressively
-                        delay = min(delay * 2, max_delay)
-                    elif isinstance(e, ServiceUnavailableError):
-                        logging.warning(
-                            f"Service unavailable (HTTP 503). Server may be temporarily down or overloaded."
-                        )
+                    delay = next_delay
                     
                     # Wait before retrying
                     time.sleep(delay)
                     
                 except Exception as e:
                     # For non-retryable exceptions, log and re-raise immediately
-                    logging.error(f"Non-retryable exception in {func.__name__}: {type(e).__name__}: {str(e)}")
+                    logging.error("Non-retryable exception in %s: %s: %s", func.__name__, type(e).__name__, e)
                     raise
             
             # This should never be reached due to the raise in the last retry attempt
@@ -1,30 +1,39 @@
+import atexit
+import json
 import os
 import traceback
 import sys
-import json
-import re
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
 from datetime import datetime
-from urllib.parse import urljoin, urlparse
-from playwright.sync_api import sync_playwright, TimeoutError, Error as PlaywrightError
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from urllib.parse import urljoin
 import hashlib
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 import time
-import requests
+import psutil
 from . import config
 
 from .utils import (
     download_image,
     get_safe_filename,
     create_metadata,
+    create_ocr_metadata,
     # process_image_for_ocr, # This seems unused directly in scraper.py, ocr_image is used
     validate_url,
     # create_scraper_directories, # Directories are created within scrape_page now
     normalize_hostname,
-    construct_absolute_url
+    construct_absolute_url,
+    ensure_dir,
+    parse_url,
+    write_json,
+    write_ndjson,
+    write_text
 )
-from .ocr import ocr_image # Directly import ocr_image
 # from . import config # Redundant import
 from .exceptions import (
     ScrapingError, InvalidURLError, ConnectionError, ParsingError, OCRError,
@@ -33,24 +42,180 @@ from .exceptions import (
 from .rate_limiter import get_rate_limiter
 from .retry import retry_with_backoff
 
+# Set once scrape_page has launched a browser in this process, so shutdown
+# cleanup can skip Playwright-related work when no browser was ever started.
+_browser_launched = False
+
+# Playwright driver / browser processes spawned by this process, recorded at launch so
+# shutdown can clean them up without scanning every process on the machine.
+_BROWSER_PROCESS_MARKERS = ('playwright', 'chrom', 'headless_shell', 'node')
+_spawned_processes: Dict[int, psutil.Process] = {}
+_spawned_processes_lock = threading.Lock()
+
+def browser_launched() -> bool:
+    """Return True if a Playwright browser has been launched in this process."""
+    return _browser_launched
+
+def spawned_browser_processes() -> List[psutil.Process]:
+    """Return the Playwright/browser child processes recorded when browsers were launched."""
+    with _spawned_processes_lock:
+        return list(_spawned_processes.values())
+
+def _record_browser_processes() -> None:
+    """Remember the browser-related children of this process (called right after a launch)."""
+    with suppress(psutil.Error):
+        children = psutil.Process().children(recursive=True)
+        with _spawned_processes_lock:
+            for child in children:
+                with suppress(psutil.Error):
+                    if child.pid not in _spawned_processes and any(m in child.name().lower() for m in _BROWSER_PROCESS_MARKERS):
+                        _spawned_processes[child.pid] = child
+
+@lru_cache(maxsize=None)
+def _load_playwright():
+    """Import playwright.sync_api on first use; importing scraper_app alone doesn't pay for it."""
+    from playwright import sync_api
+    return sync_api
+
+# One Playwright driver and Chromium instance per thread, reused across URLs (sync
+# Playwright objects are bound to the thread that created them). Consecutive URLs on
+# the same host share a browser context, so its connections and cache carry over.
+_thread_browser = threading.local()
+
+def _get_browser_context(hostname: str):
+    """Return this thread's browser context for hostname, launching the browser if needed."""
+    global _browser_launched
+    state = _thread_browser
+    browser = getattr(state, 'browser', None)
+    if browser is None or not browser.is_connected():
+        close_browser() # Drop whatever is left of a crashed or disconnected browser
+        state.playwright = _load_playwright().sync_playwright().start()
+        state.browser = state.playwright.chromium.launch(headless=True)
+        _browser_launched = True
+        _record_browser_processes()
+        logging.info("Launched persistent Chromium browser")
+    if getattr(state, 'context', None) is None or state.context_host != hostname:
+        if getattr(state, 'context', None) is not None:
+            with suppress(Exception): state.context.close()
+        state.context = state.browser.new_context()
+        state.context_host = hostname
+    return state.context
+
+_NON_TEXT_RESOURCE_TYPES = frozenset(('image', 'media', 'font'))
+# OCR needs the <img> elements (and their loaded sizes), but never audio/video or web fonts
+_NON_IMAGE_RESOURCE_TYPES = frozenset(('media', 'font'))
+
+def _abort_non_text_resources(route) -> None:
+    """Playwright route handler for text mode: abort image/media/font requests, pass the rest through."""
+    if route.request.resource_type in _NON_TEXT_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+def _abort_media_and_fonts(route) -> None:
+    """Playwright route handler for OCR modes: abort media/font requests, pass the rest through."""
+    if route.request.resource_type in _NON_IMAGE_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+def close_browser() -> None:
+    """Close the calling thread's persistent browser context, browser and Playwright driver."""
+    state = _thread_browser
+    for attr in ('context', 'browser'):
+        obj = getattr(state, attr, None)
+        if obj is not None:
+            with suppress(Exception): obj.close()
+        setattr(state, attr, None)
+    playwright = getattr(state, 'playwright', None)
+    if playwright is not None:
+        with suppress(Exception): playwright.stop()
+    state.playwright = None
+    state.context_host = None
+
+def close_worker_browsers(executor: ThreadPoolExecutor, max_workers: int) -> None:
+    """Run close_browser() on every worker thread of executor, once its submitted work is done.
+
+    Sync Playwright objects can only be closed from the thread that created them, so one
+    task per possible worker is submitted; a barrier holds each task until all have been
+    picked up, which puts exactly one on every thread (spawning any the pool hasn't yet).
+    """
+    barrier = threading.Barrier(max_workers)
+
+    def close_on_worker() -> None:
+        barrier.wait()
+        close_browser()
+
+    for future in [executor.submit(close_on_worker) for _ in range(max_workers)]:
+        with suppress(Exception): future.result()
+
+# Library callers that never call close_browser() still get the main thread's browser shut down
+atexit.register(close_browser)
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or an HTTP date) into seconds to wait."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logging.debug("Ignoring unparseable Retry-After header: %r", value)
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+def _server_error(message: str, details: Dict[str, Any], response: Any) -> ServerError:
+    return ServerError(f"Server Error: {message}", details['status_code'], details=details)
+
+# Non-OK HTTP statuses with a dedicated exception type; other 5xx use _server_error.
+# Each factory takes (message, details, Playwright response).
+_HTTP_STATUS_ERRORS: Dict[int, Any] = {
+    503: lambda message, details, response: ServiceUnavailableError(f"Service Unavailable: {message}", details=details),
+    429: lambda message, details, response: RateLimitError(
+        f"Rate Limited: {message}", details=details, retry_after=parse_retry_after(response.headers.get('retry-after'))
+    ),
+}
+
 def clean_text(text: str) -> str:
     """Clean and normalize text content."""
-    text = re.sub(r'\s+', ' ', text).strip()
-    text = re.sub(r'\n\s*\n', '\n', text)
-    return text.strip()
+    # Every whitespace run (newlines included) collapses to one space, which leaves no
+    # blank lines behind. Already-normalized text is detected with two C-level scans:
+    # every whitespace character except ' ' is non-printable, so a printable string
+    # without double spaces has nothing to collapse.
+    if '  ' not in text and text.isprintable():
+        return text.strip(' ')
+    # str.split() breaks on the same characters as the regex \s+ and drops leading and
+    # trailing runs, at about a third of the cost of re.sub(r'\s+', ' ', text).strip().
+    return ' '.join(text.split())
 
 def get_hostname(url: str) -> str: # This function seems unused in this file now
     """Extract hostname from URL and convert to a safe filename."""
     return normalize_hostname(url)
 
+OCR_RESULTS_FILENAME = 'ocr_results.ndjson'
+
+def iter_ocr_results(ocr_dir: Path) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the per-image OCR records written by save_ocr_results for one page."""
+    results_path = ocr_dir / OCR_RESULTS_FILENAME
+    if not results_path.exists():
+        return
+    with open(results_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
 def save_ocr_results(ocr_dir: Path, ocr_results: List[Dict[str, Any]], url: str, hostname: str) -> Path:
     """Save OCR results with metadata."""
-    logging.info(f"Saving OCR results for {url} ({len(ocr_results)} images)")
+    logging.info("Saving OCR results for %s (%s images)", url, len(ocr_results))
     
-    ocr_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(ocr_dir)
     
     if not ocr_results:
-        logging.warning(f"No OCR results to save for {url}")
+        logging.warning("No OCR results to save for %s", url)
         # create_metadata is from utils.py
         summary_data = create_metadata(url, hostname) 
         summary_data.update({
@@ -61,21 +226,17 @@ def save_ocr_results(ocr_dir: Path, ocr_results: List[Dict[str, Any]], url: str,
         summary_path = ocr_dir / 'summary.json'
         try:
             # print(f"DEBUG save_ocr_results: Dumping empty summary: {summary_data}")
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                json.dump(summary_data, f, indent=2, ensure_ascii=False)
-            logging.info(f"Saved empty OCR summary to {summary_path}")
+            write_json(summary_path, summary_data, indent=config.SCRAPER_DEBUG_MODE)
+            logging.info("Saved empty OCR summary to %s", summary_path)
             return summary_path
         except Exception as e:
-            logging.error(f"Failed to save empty OCR summary to {summary_path}: {e}")
+            logging.error("Failed to save empty OCR summary to %s: %s", summary_path, e)
             raise OCRError(f"Failed to save empty OCR summary: {e}") from e
     
-    for idx, result_item in enumerate(ocr_results): # Renamed result to result_item
-        # print(f"DEBUG save_ocr_results: Processing result item {idx}: {result_item}")
-        image_url_from_result = result_item.get('image_url', f"unknown_image_{idx}")
-        ocr_filename = f"ocr_{idx+1:03d}_{get_safe_filename(image_url_from_result)}.json"
-        ocr_path = ocr_dir / ocr_filename
-        
-        individual_ocr_data = create_metadata(url, hostname) 
+    ocr_records: List[Dict[str, Any]] = []
+    base_meta = create_metadata(url, hostname) # Flat dict of str values; a shallow copy per image is enough
+    for result_item in ocr_results: # Renamed result to result_item
+        individual_ocr_data = dict(base_meta)
         individual_ocr_data.update({
             'image_url': result_item.get('image_url', ''),
             'image_path': str(result_item.get('image_path', '')),
@@ -84,51 +245,106 @@ def save_ocr_results(ocr_dir: Path, ocr_results: List[Dict[str, Any]], url: str,
             'ocr_text_word_count': result_item.get('word_count', 0),
             'ocr_failed': result_item.get('ocr_failed', False)
         })
-        
-        try:
-            # print(f"DEBUG save_ocr_results: Dumping individual ocr_data {idx}: {individual_ocr_data}")
-            with open(ocr_path, 'w', encoding='utf-8') as f:
-                json.dump(individual_ocr_data, f, indent=2, ensure_ascii=False)
-            logging.info(f"Saved OCR result {idx+1}/{len(ocr_results)} to {ocr_path}")
-        except Exception as e:
-            logging.error(f"Failed to save OCR result {idx+1} for {image_url_from_result} to {ocr_path}: {e}")
-            # Continue to save other results, but the overall operation might be considered failed by caller
+        ocr_records.append(individual_ocr_data)
+
+    # All per-image records go to one NDJSON file (one line per image) instead of a file each
+    results_path = ocr_dir / OCR_RESULTS_FILENAME
+    try:
+        write_ndjson(results_path, ocr_records)
+        logging.info("Saved %s OCR results to %s", len(ocr_records), results_path)
+    except Exception as e:
+        logging.error("Failed to save OCR results for %s to %s: %s", url, results_path, e)
+        # Still write the summary, but the overall operation might be considered failed by caller
     
     # Create and save the summary of all OCR results
     # ocr_results here is the full list of dicts from scrape_page
-    overall_summary_data = create_metadata(url, hostname, ocr_results=ocr_results)
+    # Same base metadata (and timestamp) as the per-image records, plus the aggregate OCR fields
+    overall_summary_data = dict(base_meta)
+    overall_summary_data.update(create_ocr_metadata(ocr_results))
     summary_path = ocr_dir / 'summary.json'
     try:
         # print(f"DEBUG save_ocr_results: Dumping final summary: {overall_summary_data}")
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(overall_summary_data, f, indent=2, ensure_ascii=False)
-        logging.info(f"Saved OCR summary to {summary_path}")
-        logging.info(f"Total OCR text length: {overall_summary_data.get('total_ocr_text_length', 0)} characters")
-        logging.info(f"Total OCR word count: {overall_summary_data.get('total_ocr_word_count', 0)} words")
+        # Holds every image's text concatenated; pretty-printing it only pays off when debugging
+        write_json(summary_path, overall_summary_data, indent=config.SCRAPER_DEBUG_MODE)
+        logging.info("Saved OCR summary to %s", summary_path)
+        logging.info("Total OCR text length: %s characters", overall_summary_data.get('total_ocr_text_length', 0))
+        logging.info("Total OCR word count: %s words", overall_summary_data.get('total_ocr_word_count', 0))
     except Exception as e:
-        logging.error(f"Failed to save OCR summary to {summary_path}: {e}")
+        logging.error("Failed to save OCR summary to %s: %s", summary_path, e)
         raise OCRError(f"Failed to save OCR summary: {e}") from e
     
     return summary_path
 
+# Returns the URL of every <img> unless it is <= minDim pixels wide or high. The URL is
+# currentSrc (the candidate the browser picked from srcset) with the src attribute as a
+# fallback for images not loaded yet, or whose currentSrc is a blob: URL that only exists
+# inside the page (download_image cannot fetch those). Loaded images are sized by their
+# natural dimensions, others by their width/height attributes; missing or non-numeric
+# sizes never exclude one.
+_IMAGE_SRCS_JS = """(els, minDim) => els.filter(e => {
+    if (minDim <= 0) return true;
+    const loaded = e.complete && e.naturalWidth > 0;
+    const w = loaded ? e.naturalWidth : parseInt(e.getAttribute("width"), 10);
+    const h = loaded ? e.naturalHeight : parseInt(e.getAttribute("height"), 10);
+    return !(w <= minDim || h <= minDim);
+}).map(e => {
+    const src = e.getAttribute("src") || "";
+    const current = e.currentSrc;
+    if (current && !current.startsWith("blob:")) return current;
+    return src.startsWith("blob:") ? "" : src;
+})"""
+
+def _resolve_image_targets(image_srcs: List[str], page_url: str, images_dir: Path) -> Tuple[List[Tuple[str, Path]], List[str]]:
+    """Turn raw <img> src values into (absolute image URL, target path) pairs.
+
+    Empty srcs are ignored and repeated URLs are kept once, since the same image is often
+    referenced several times (thumbnail + hero, placeholders). Returns the targets and the
+    srcs that could not be resolved.
+    """
+    targets: List[Tuple[str, Path]] = []
+    failed: List[str] = []
+    seen_image_urls: set = set()
+    for src_attr in image_srcs:
+        if not src_attr:
+            continue
+        absolute_img_url: Optional[str] = None
+        try:
+            absolute_img_url = construct_absolute_url(src_attr, page_url)
+            if not absolute_img_url:
+                logging.warning("Could not construct absolute URL for image: %s on page %s", src_attr, page_url)
+                failed.append(src_attr)
+                continue
+            if absolute_img_url in seen_image_urls:
+                continue
+            seen_image_urls.add(absolute_img_url)
+            targets.append((absolute_img_url, images_dir / get_safe_filename(absolute_img_url)))
+        except Exception as e_img_proc:
+            failed_img_id = absolute_img_url or src_attr
+            logging.error("Failed to process image %s: %s", failed_img_id, e_img_proc)
+            failed.append(failed_img_id)
+    return targets, failed
+
 @retry_with_backoff(
     max_retries=config.SCRAPE_MAX_RETRIES,
     initial_delay=config.SCRAPE_INITIAL_DELAY,
     max_delay=config.SCRAPE_MAX_DELAY,
     backoff_factor=config.SCRAPE_BACKOFF_FACTOR,
     jitter=config.SCRAPE_RETRY_JITTER,
+    jitter_strategy=config.SCRAPE_RETRY_JITTER_STRATEGY,
+    adaptive=True,
+    total_timeout=config.SCRAPE_TOTAL_TIMEOUT or None,
     retry_on_exceptions=[ConnectionError, ServerError, ServiceUnavailableError, RateLimitError] # ServerError is fine here as it's specific
 )
 def scrape_page(url: str, scrape_mode: str = 'both', use_rate_limiter: bool = True) -> Dict[str, Any]:
     """Scrape a webpage and extract text, images, and perform OCR."""
     try:
         if use_rate_limiter:
-            hostname_from_url = urlparse(url).netloc # Renamed to avoid conflict
+            hostname_from_url = parse_url(url).netloc # Renamed to avoid conflict
             rate_limiter = get_rate_limiter(hostname_from_url if hostname_from_url else "default")
-            logging.info(f"[RATE LIMIT] Waiting for rate limiter slot for {url}")
+            logging.info("[RATE LIMIT] Waiting for rate limiter slot for %s", url)
             rate_limiter.wait()
             
-        logging.info(f"[OK] Scraping {url} in mode: {scrape_mode}")
+        logging.info("[OK] Scraping %s in mode: %s", url, scrape_mode)
         
         is_valid, error_message = validate_url(url)
         if not is_valid:
@@ -140,16 +356,14 @@ def scrape_page(url: str, scrape_mode: str = 'both', use_rate_limiter: bool = Tr
         # Get output paths using the main URL's hostname
         paths = {
             'base_dir': run_dir, # base_dir is run_dir
-            'images_dir': run_dir / 'images' / hostname,
-            'pages_dir': run_dir / 'pages' / hostname,
-            'ocr_dir': run_dir / 'pages' / hostname / 'ocr'
+            'images_dir': run_dir / config.IMAGES_SUBDIR / hostname,
+            'pages_dir': run_dir / config.PAGES_SUBDIR / hostname,
+            'ocr_dir': run_dir / config.PAGES_SUBDIR / hostname / config.OCR_SUBDIR
         }
         
-        # Create directories if they don't exist
-        for dir_path_key, dir_path_val in paths.items(): # Iterate over items for clarity
-            if isinstance(dir_path_val, Path): # Ensure it's a Path object
-                dir_path_val.mkdir(parents=True, exist_ok=True)
-                # logging.debug(f"Ensured directory: {dir_path_val}") # Too verbose for normal runs
+        # Create directories if they don't exist (cached; main pre-creates known hosts)
+        ensure_dir(paths['images_dir'])
+        ensure_dir(paths['ocr_dir']) # also covers pages_dir and run_dir
         
         metrics = {
             'browser_init': 0.0, 'page_load': 0.0, 'content_extraction': 0.0,
@@ -171,120 +385,149 @@ def scrape_page(url: str, scrape_mode: str = 'both', use_rate_limiter: bool = Tr
         ocr_summary_path: Optional[Path] = None
 
 
-        with sync_playwright() as p:
-            browser = None 
+        sync_api = _load_playwright()
+        page = None
+        download_pool: Optional[ThreadPoolExecutor] = None
+        try:
+            context = _get_browser_context(hostname)
+            metrics['browser_init'] = time.time() - browser_init_start
+            page = context.new_page()
+            # Use a timeout from config, e.g. config.PAGE_TIMEOUT_MS or a new one
+            page_timeout = getattr(config, 'SCRAPER_PAGE_TIMEOUT_MS', 30000) # Default 30s
+            page.set_default_timeout(page_timeout) 
+            # Don't fetch what this mode never looks at: text-only runs skip images too,
+            # and images wanted for OCR are downloaded again by download_image anyway.
+            page.route("**/*", _abort_non_text_resources if scrape_mode == 'text' else _abort_media_and_fonts)
+
+            page_load_start = time.time()
             try:
-                browser = p.chromium.launch(headless=True)
-                metrics['browser_init'] = time.time() - browser_init_start
-                context = browser.new_context()
-                page = context.new_page()
-                # Use a timeout from config, e.g. config.PAGE_TIMEOUT_MS or a new one
-                page_timeout = getattr(config, 'SCRAPER_PAGE_TIMEOUT_MS', 30000) # Default 30s
-                page.set_default_timeout(page_timeout) 
-
-                page_load_start = time.time()
-                try:
-                    response = page.goto(url, wait_until='domcontentloaded')
-                    if not response: raise RuntimeError(f"Failed to load {url}: No response received")
-                    if not response.ok:
-                        status_code = response.status
-                        status_text = response.status_text
-                        error_msg_detail = f"Failed to load {url}: HTTP {status_code} - {status_text}"
-                        if status_code == 503: raise ServiceUnavailableError(f"Service Unavailable: {error_msg_detail}", details={'url': url, 'status_code': status_code, 'status_text': status_text})
-                        elif status_code == 429: raise RateLimitError(f"Rate Limited: {error_msg_detail}", details={'url': url, 'status_code': status_code, 'status_text': status_text})
-                        elif 500 <= status_code < 600: raise ServerError(f"Server Error: {error_msg_detail}", status_code, details={'url': url, 'status_code': status_code, 'status_text': status_text})
-                        else: raise RuntimeError(error_msg_detail)
-                    
-                    page.wait_for_load_state('domcontentloaded')
+                response = page.goto(url, wait_until='domcontentloaded')
+                if not response: raise RuntimeError(f"Failed to load {url}: No response received")
+                if not response.ok:
+                    status_code = response.status
+                    status_text = response.status_text
+                    error_msg_detail = f"Failed to load {url}: HTTP {status_code} - {status_text}"
+                    status_error = _HTTP_STATUS_ERRORS.get(status_code)
+                    if status_error is None and 500 <= status_code < 600: status_error = _server_error
+                    if status_error is None: raise RuntimeError(error_msg_detail)
+                    raise status_error(error_msg_detail, {'url': url, 'status_code': status_code, 'status_text': status_text}, response)
+                
+                # goto() already waited for DOMContentLoaded, which is all text extraction and
+                # the <img> query need; the optional idle wait only helps late-loading images
+                if scrape_mode != 'text' and config.WAIT_NETWORK_IDLE:
                     try:
                         page.wait_for_load_state('networkidle', timeout=5000)
-                    except TimeoutError: logging.warning(f"Timeout waiting for network idle on {url}, continuing anyway")
-                    except Exception as e_idle: logging.warning(f"Error waiting for network idle: {str(e_idle)}, continuing anyway")
-                except TimeoutError: raise RuntimeError(f"Timeout while loading {url}")
-                except PlaywrightError as e_pw: raise RuntimeError(f"Playwright error while loading {url}: {str(e_pw)}")
-                finally: metrics['page_load'] = time.time() - page_load_start
-
-                content_extraction_start = time.time()
-                if scrape_mode in ['text', 'both']:
-                    try:
-                        html_content = page.content()
-                        # Fallback for body if not present or empty
-                        body_element = page.query_selector('body')
-                        visible_text = body_element.inner_text() if body_element else ""
-                        cleaned_text = clean_text(visible_text)
-                    except Exception as e_content: raise RuntimeError(f"Failed to extract page content: {str(e_content)}")
+                    except sync_api.TimeoutError: logging.warning("Timeout waiting for network idle on %s, continuing anyway", url)
+                    except Exception as e_idle: logging.warning("Error waiting for network idle: %s, continuing anyway", e_idle)
+            except sync_api.TimeoutError: raise RuntimeError(f"Timeout while loading {url}")
+            except sync_api.Error as e_pw: raise RuntimeError(f"Playwright error while loading {url}: {str(e_pw)}")
+            finally: metrics['page_load'] = time.time() - page_load_start
 
-                if scrape_mode in ['ocr', 'both']:
-                    image_processing_start = time.time()
-                    images_on_page = page.query_selector_all('img')
-                    metrics['image_processing']['count'] = len(images_on_page)
-                    
-                    for img_element in images_on_page:
-                        src_attr: Optional[str] = None
-                        absolute_img_url_for_loop: Optional[str] = None
-                        try:
-                            src_attr = img_element.get_attribute('src')
-                            if not src_attr: continue
-                            
-                            absolute_img_url_for_loop = construct_absolute_url(src_attr, url)
-                            if not absolute_img_url_for_loop:
-                                logging.warning(f"Could not construct absolute URL for image: {src_attr} on page {url}")
-                                failed_images.append(src_attr or "unknown_src_on_failed_construct")
-                                metrics['image_processing']['failed'] += 1
-                                continue
-
-                            img_filename = get_safe_filename(absolute_img_url_for_loop)
-                            img_file_path = paths['images_dir'] / img_filename
-                                
-                            saved_img_path = download_image(absolute_img_url_for_loop, img_file_path)
-                            
-                            if not saved_img_path:
-                                logging.warning(f"Failed to download image: {absolute_img_url_for_loop}")
-                                failed_images.append(absolute_img_url_for_loop)
-                                metrics['image_processing']['failed'] += 1
-                                continue
-                                
-                            ocr_output_dict = ocr_image(saved_img_path)
-                            
-                            current_ocr_status = ocr_output_dict.get('ocr_status', 'error_processing') # Get the new status
-                            ocr_item = {
-                                'image_path': str(saved_img_path),
-                                'text': ocr_output_dict['text'],
-                                'char_count': ocr_output_dict['char_count'],
-                                'word_count': ocr_output_dict['word_count'],
-                                'image_url': absolute_img_url_for_loop,
-                                'ocr_status': current_ocr_status, # Store the detailed status
-                                'ocr_failed': current_ocr_status != 'success' # ocr_failed is true if status is not 'success'
-                            }
-                            ocr_results.append(ocr_item)
-
-                            if current_ocr_status == 'success':
-                                metrics['image_processing']['successful'] += 1
-                            else:
-                                # Log based on the specific status
-                                if current_ocr_status == 'no_text_found':
-                                    logging.warning(f"OCR processed but found no text for image: {absolute_img_url_for_loop} (saved at {saved_img_path}) - Status: {current_ocr_status}")
-                                elif current_ocr_status.startswith('error_'):
-                                    logging.warning(f"OCR error for image: {absolute_img_url_for_loop} (saved at {saved_img_path}) - Status: {current_ocr_status}")
-                                else: # Should not happen if ocr_status is always set
-                                    logging.warning(f"OCR did not succeed for image: {absolute_img_url_for_loop} (saved at {saved_img_path}) - Status: {current_ocr_status}")
-                        except Exception as e_img_proc:
-                            failed_img_id = absolute_img_url_for_loop if absolute_img_url_for_loop else (src_attr if src_attr else "unknown_image_src_in_exception")
-                            logging.error(f"Failed to process image {failed_img_id}: {str(e_img_proc)}")
-                            failed_images.append(failed_img_id)
-                            metrics['image_processing']['failed'] += 1
-                                            
-                    metrics['image_processing']['total'] = time.time() - image_processing_start
+            content_extraction_start = time.time()
+            image_targets: List[Tuple[str, Path]] = []
+            download_futures: Dict[str, Future] = {} # By absolute image URL
+            if scrape_mode in ['ocr', 'both']:
+                image_processing_start = time.time()
+                # One protocol round trip for every src, instead of an ElementHandle plus a
+                # get_attribute call per image. Tiny images (tracking pixels, spacers) are dropped here.
+                image_srcs: List[str] = page.eval_on_selector_all('img', _IMAGE_SRCS_JS, config.IMAGE_MIN_DIMENSION)
+                metrics['image_processing']['count'] = len(image_srcs)
                 
-                metrics['content_extraction'] = time.time() - content_extraction_start
-                page.close()
-                context.close()
-            except Exception as e_browser_setup:
-                metrics['browser_init'] = time.time() - browser_init_start
-                if browser and browser.is_connected(): browser.close()
-                raise RuntimeError(f"Failed to initialize or use browser: {str(e_browser_setup)}") from e_browser_setup
-            finally:
-                if browser and browser.is_connected(): browser.close()
+                # Phase 1: resolve image URLs (Playwright calls stay on this thread) and start
+                # the downloads straight away so they overlap with text extraction below.
+                image_targets, unresolved_images = _resolve_image_targets(image_srcs, url, paths['images_dir'])
+                failed_images.extend(unresolved_images)
+                metrics['image_processing']['failed'] += len(unresolved_images)
+
+                if image_targets:
+                    # Downloads are I/O-bound; the per-host rate limiter in download_image still paces them.
+                    # Targets are one per URL and get_safe_filename gives each URL its own file,
+                    # so no two downloads write the same path.
+                    download_pool = ThreadPoolExecutor(max_workers=max(1, config.IMAGE_DOWNLOAD_WORKERS), thread_name_prefix="img")
+                    for image_url, image_path in image_targets:
+                        download_futures[image_url] = download_pool.submit(download_image, image_url, image_path)
+
+            if scrape_mode in ['text', 'both']:
+                try:
+                    html_content = page.content()
+                    # Fallback for body if not present or empty
+                    body_element = page.query_selector('body')
+                    # Cleaned straight away: the raw inner_text is never kept alive alongside it
+                    cleaned_text = clean_text(body_element.inner_text() if body_element else "")
+                except Exception as e_content: raise RuntimeError(f"Failed to extract page content: {str(e_content)}")
+
+            # Everything after this point only needs the extracted data; release the page now
+            # rather than holding it (and its renderer memory) open through downloads and OCR.
+            page.close()
+            page = None
+
+            if scrape_mode in ['ocr', 'both']:
+                downloaded_images: List[Tuple[str, Path]] = [] # (absolute image URL, saved path)
+                for image_url, image_path in image_targets:
+                    try:
+                        saved_img_path = download_futures[image_url].result()
+                    except Exception as e_img_proc:
+                        logging.error("Failed to process image %s: %s", image_url, e_img_proc)
+                        saved_img_path = None
+                    if not saved_img_path:
+                        logging.warning("Failed to download image: %s", image_url)
+                        failed_images.append(image_url)
+                        metrics['image_processing']['failed'] += 1
+                        continue
+                    downloaded_images.append((image_url, saved_img_path))
+
+                # Deferred to first use: loads PIL/Tesseract (and OpenCV if installed)
+                from .ocr import ocr_images_batch, ocr_images_parallel
+
+                # Phase 2: OCR the downloaded images, across worker threads when enabled,
+                # otherwise with as few Tesseract launches as possible.
+                saved_paths = [saved for _, saved in downloaded_images]
+                if not saved_paths:
+                    ocr_outputs = []
+                elif config.OCR_MAX_WORKERS > 1:
+                    ocr_outputs = ocr_images_parallel(saved_paths)
+                else:
+                    ocr_outputs = ocr_images_batch(saved_paths)
+                for (absolute_img_url_for_loop, saved_img_path), ocr_output_dict in zip(downloaded_images, ocr_outputs):
+                    current_ocr_status = ocr_output_dict.get('ocr_status', 'error_processing') # Get the new status
+                    ocr_item = {
+                        'image_path': str(saved_img_path),
+                        'text': ocr_output_dict['text'],
+                        'char_count': ocr_output_dict['char_count'],
+                        'word_count': ocr_output_dict['word_count'],
+                        'image_url': absolute_img_url_for_loop,
+                        'ocr_status': current_ocr_status, # Store the detailed status
+                        'ocr_failed': current_ocr_status != 'success' # ocr_failed is true if status is not 'success'
+                    }
+                    ocr_results.append(ocr_item)
+
+                    if current_ocr_status == 'success':
+                        metrics['image_processing']['successful'] += 1
+                    else:
+                        # Log based on the specific status
+                        if current_ocr_status == 'no_text_found':
+                            logging.warning("OCR processed but found no text for image: %s (saved at %s) - Status: %s", absolute_img_url_for_loop, saved_img_path, current_ocr_status)
+                        elif current_ocr_status.startswith('error_'):
+                            logging.warning("OCR error for image: %s (saved at %s) - Status: %s", absolute_img_url_for_loop, saved_img_path, current_ocr_status)
+                        else: # Should not happen if ocr_status is always set
+                            logging.warning("OCR did not succeed for image: %s (saved at %s) - Status: %s", absolute_img_url_for_loop, saved_img_path, current_ocr_status)
+                                        
+                metrics['image_processing']['total'] = time.time() - image_processing_start
+            
+            metrics['content_extraction'] = time.time() - content_extraction_start
+        except ScrapingError:
+            # HTTP-status errors (429/503/5xx) must reach retry_with_backoff with their type intact
+            raise
+        except Exception as e_browser_setup:
+            metrics['browser_init'] = time.time() - browser_init_start
+            raise RuntimeError(f"Failed to initialize or use browser: {str(e_browser_setup)}") from e_browser_setup
+        finally:
+            # The browser and context stay open for the next URL; only the page is per-URL.
+            if page is not None:
+                with suppress(Exception): page.close()
+            if download_pool is not None:
+                # Cancel anything still queued if extraction failed part-way through
+                download_pool.shutdown(cancel_futures=True)
 
         file_saving_start = time.time()
         page_path = paths['pages_dir'] / "page.html"
@@ -292,28 +535,37 @@ def scrape_page(url: str, scrape_mode: str = 'both', use_rate_limiter: bool = Tr
         raw_text_path = paths['pages_dir'] / "text.txt"
         
         try:
-            with open(page_path, 'w', encoding='utf-8') as f: f.write(html_content)
-            
             text_data_for_json = create_metadata(url, hostname, text=cleaned_text)
             text_data_for_json['ocr_results_count'] = len(ocr_results)
             text_data_for_json['images_dir'] = str(paths['images_dir'])
             text_data_for_json['failed_images_download'] = failed_images
 
-            with open(text_path, 'w', encoding='utf-8') as f: json.dump(text_data_for_json, f, indent=2, ensure_ascii=False)
-            with open(raw_text_path, 'w', encoding='utf-8') as f: f.write(cleaned_text)
-
-            if scrape_mode in ['ocr', 'both']:
-                ocr_summary_path = save_ocr_results(paths['ocr_dir'], ocr_results, url, hostname)
+            # The page's output files are independent, so write them concurrently rather than
+            # one after another.
+            with ThreadPoolExecutor(max_workers=4, thread_name_prefix="save") as save_pool:
+                save_futures = [
+                    save_pool.submit(write_text, page_path, html_content),
+                    # Pretty-printed only in debug mode; compact JSON is several times cheaper to produce
+                    save_pool.submit(write_json, text_path, text_data_for_json, indent=config.SCRAPER_DEBUG_MODE),
+                    save_pool.submit(write_text, raw_text_path, cleaned_text),
+                ]
+                ocr_save_future: Optional[Future] = None
+                if scrape_mode in ['ocr', 'both']:
+                    ocr_save_future = save_pool.submit(save_ocr_results, paths['ocr_dir'], ocr_results, url, hostname)
+                for save_future in save_futures:
+                    save_future.result()
+                if ocr_save_future is not None:
+                    ocr_summary_path = ocr_save_future.result()
         
         except Exception as e_save:
-            logging.error(f"Error during file saving phase for {url}: {str(e_save)}", exc_info=True)
+            logging.error("Error during file saving phase for %s: %s", url, e_save, exc_info=True)
             raise RuntimeError(f"Failed to save files for {url}: {str(e_save)}") from e_save
         
         metrics['file_saving'] = time.time() - file_saving_start
         metrics['total_time'] = time.time() - start_time
 
-        logging.info(f"\n[STATS] Performance Metrics for {url}:")
-        logging.info(f"Total scraping time: {metrics['total_time']:.2f}s")
+        logging.info("\n[STATS] Performance Metrics for %s:", url)
+        logging.info("Total scraping time: %.2fs", metrics['total_time'])
         # ... (other metric logs like browser_init, page_load etc. can be added here if needed for verbosity)
 
         return {
@@ -327,33 +579,33 @@ def scrape_page(url: str, scrape_mode: str = 'both', use_rate_limiter: bool = Tr
         }
 
     except InvalidURLError as e_url: 
-        logging.error(f"[ERROR] Invalid URL for scraping: {url} - {str(e_url)}")
+        logging.error("[ERROR] Invalid URL for scraping: %s - %s", url, e_url)
         raise 
     except ServiceUnavailableError as e_serv_unavail: 
-        logging.error(f"[ERROR] Service Unavailable for {url} (HTTP 503): {str(e_serv_unavail)}")
+        logging.error("[ERROR] Service Unavailable for %s (HTTP 503): %s", url, e_serv_unavail)
         raise
     except RateLimitError as e_rate_limit: 
-        logging.error(f"[ERROR] Rate Limited for {url} (HTTP 429): {str(e_rate_limit)}")
+        logging.error("[ERROR] Rate Limited for %s (HTTP 429): %s", url, e_rate_limit)
         raise
     except ServerError as e_serv: 
-        logging.error(f"[ERROR] Server error for {url} (HTTP {e_serv.status_code if hasattr(e_serv, 'status_code') else 'N/A'}): {str(e_serv)}")
+        logging.error("[ERROR] Server error for %s (HTTP %s): %s", url, e_serv.status_code if hasattr(e_serv, 'status_code') else 'N/A', e_serv)
         raise
     except ConnectionError as e_conn: 
-        logging.error(f"[ERROR] Connection error for {url}: {str(e_conn)}")
+        logging.error("[ERROR] Connection error for %s: %s", url, e_conn)
         raise
     except ParsingError as e_parse: 
-        logging.error(f"[ERROR] Parsing error for {url}: {str(e_parse)}")
+        logging.error("[ERROR] Parsing error for %s: %s", url, e_parse)
         raise
     except OCRError as e_ocr: 
-        logging.error(f"[ERROR] OCR error for {url}: {str(e_ocr)}")
+        logging.error("[ERROR] OCR error for %s: %s", url, e_ocr)
         raise
     except RuntimeError as e_rt: 
-        logging.error(f"[ERROR] Runtime error during scraping {url}: {str(e_rt)}", exc_info=config.SCRAPER_DEBUG_MODE)
+        logging.error("[ERROR] Runtime error during scraping %s: %s", url, e_rt, exc_info=config.SCRAPER_DEBUG_MODE)
         if isinstance(e_rt.__cause__, KeyError):
-             logging.error(f"Root cause of file saving error was KeyError: {str(e_rt.__cause__)}")
+             logging.error("Root cause of file saving error was KeyError: %s", e_rt.__cause__)
              raise ParsingError(f"Data structure error during file saving for {url}: {str(e_rt.__cause__)}", details={'original_runtime_error': str(e_rt)}) from e_rt.__cause__
         else:
              raise ScrapingError(f"Runtime error during scraping {url}: {str(e_rt)}", details={'url': url}) from e_rt
     except Exception as e_unexp: 
-        logging.error(f"[ERROR] Unexpected error during scraping {url}: {str(e_unexp)}", exc_info=config.SCRAPER_DEBUG_MODE)
+        logging.error("[ERROR] Unexpected error during scraping %s: %s", url, e_unexp, exc_info=config.SCRAPER_DEBUG_MODE)
         raise ScrapingError(f"Unexpected error for {url}: {str(e_unexp)}", details={'url': url}) from e_unexp
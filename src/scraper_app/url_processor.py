@@ -1,8 +1,11 @@
 import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from itertools import chain
 from pathlib import Path
 from tqdm import tqdm
-from typing import Optional
+from typing import Any, Dict, Optional, Set
 
+from . import config
 from .exceptions import ScrapingError
 
 def process_pending_urls_loop(
@@ -18,20 +21,26 @@ def process_pending_urls_loop(
     """
     # Import here to avoid circular imports
     from . import db_utils
-    from .main import process_single_pending_url
     
     logging.info(f"Starting Step 3: Processing up to {num_to_process} 'pending' URLs from scraping_logs.")
-    pending_urls_data = db_utils.fetch_pending_urls(limit=num_to_process)
+    # Rows are read in short keyset-paged queries and handed out as workers become free
+    pending_rows = db_utils.iter_pending_urls(limit=num_to_process)
+    first_row = next(pending_rows, None)
 
-    if not pending_urls_data:
+    if first_row is None:
         logging.info("No 'pending' URLs found in scraping_logs to process in this batch.")
         return
 
-    logging.info(f"Found {len(pending_urls_data)} 'pending' URLs to process.")
+    # Only now: main pulls in the scraper stack, which an empty poll never needs
+    from .main import process_single_pending_url
+    from .scraper import close_worker_browsers
     
-    progress_bar = tqdm(pending_urls_data, desc="Step 3: Processing Pending URLs", unit="url", disable=debug_mode)
-    for log_id, client_id, url_to_scrape in progress_bar:
-        progress_bar.set_postfix_str(f"{url_to_scrape[:50]}...")
+    # Results by canonical URL, so duplicate pending rows (same page, different tracking
+    # parameters or fragment) are completed from the first scrape instead of scraping again.
+    # With several workers, duplicates already in flight together may still both be scraped.
+    scraped_pages: Dict[str, Dict[str, Any]] = {}
+
+    def _process(log_id: Optional[str], client_id: Optional[str], url_to_scrape: str) -> None:
         # process_single_pending_url contains the logic for scraping, saving, and DB updates for one URL
         process_single_pending_url(
             log_id=log_id,
@@ -40,6 +49,51 @@ def process_pending_urls_loop(
             run_dir=run_dir,
             scrape_session=scrape_session,
             scrape_mode=scrape_mode,
-            debug_mode=debug_mode
+            debug_mode=debug_mode,
+            scraped_pages=scraped_pages
         )
-    logging.info(f"Finished processing batch of {len(pending_urls_data)} 'pending' URLs.")
\ No newline at end of file
+
+    max_workers = max(1, config.SCRAPER_MAX_WORKERS)
+    url_count = 0
+    rows = chain((first_row,), pending_rows)
+    try:
+        with tqdm(total=num_to_process, desc="Step 3: Processing Pending URLs", unit="url", disable=debug_mode) as progress_bar:
+            if max_workers == 1:
+                # Read the (LIMIT-bounded) rows up front; scraping one by one would otherwise
+                # interleave minutes of page loads and OCR with the follow-up reads
+                for log_id, client_id, url_to_scrape in list(rows):
+                    url_count += 1
+                    progress_bar.set_postfix_str(f"{url_to_scrape[:50]}...")
+                    _process(log_id, client_id, url_to_scrape)
+                    progress_bar.update(1)
+            else:
+                # While one URL is being OCR'd or saved, the next ones are already loading: each worker
+                # thread runs whole URLs on its own persistent browser, and scrape_page's per-host
+                # rate limiter still caps the request rate. Rows are read from the cursor only as
+                # workers free up, so at most max_in_flight rows and futures are held at a time.
+                max_in_flight = 2 * max_workers
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pending") as executor:
+                    try:
+                        in_flight: Set[Future] = set()
+                        for row in rows:
+                            if len(in_flight) >= max_in_flight:
+                                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                                for future in done:
+                                    future.result()
+                                    progress_bar.update(1)
+                            in_flight.add(executor.submit(_process, *row))
+                            url_count += 1
+                        for future in as_completed(in_flight):
+                            future.result()
+                            progress_bar.update(1)
+                    finally:
+                        # Each worker thread launched its own browser; close them before the threads exit
+                        close_worker_browsers(executor, max_workers)
+            progress_bar.total = url_count
+            progress_bar.refresh()
+    finally:
+        pending_rows.close() # Releases the cursor's DB connection even if a URL raised part-way through
+        # Status updates and page inserts are buffered on the session; callers other than
+        # main() never flush them, so write this batch's rows before returning.
+        scrape_session.flush_db()
+    logging.info(f"Finished processing batch of {url_count} 'pending' URLs.")
\ No newline at end of file
@@ -1,161 +1,412 @@
+import asyncio
 import os
+import json
 import hashlib
-import requests
+import httpx
 import time
 import logging
+import random
 import re # Added import re
-from urllib.parse import urlparse, urljoin, urlunparse 
+from urllib.parse import ParseResult, parse_qsl, unquote_to_bytes, urlencode, urlparse, urljoin, urlunparse 
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Any, Tuple, List, Union
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncIterator, Callable, Dict, Iterator, Optional, Any, Tuple, List, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from . import config
 from .rate_limiter import get_rate_limiter
-from .ocr import ocr_image 
+from .http_client import create_async_http_client, get_http_client
 
-from .exceptions import ConnectionError, ServerError, ServiceUnavailableError, RateLimitError
+from .exceptions import ConnectionError, ServerError, ServiceUnavailableError, RateLimitError, OCRError
 
+try:
+    import orjson # Optional: much faster JSON encoding for summaries and metadata
+except ImportError:
+    orjson = None
+
+try:
+    from pybase64 import b64decode as _b64decode # Optional: SIMD base64 decoder for inline (data:) images
+except ImportError:
+    from base64 import b64decode as _b64decode
+
+
+
+# Stdlib separators matching orjson's unindented output (no space after ',' and ':')
+_COMPACT_SEPARATORS = (',', ':')
+
+def dumps_json(obj: Any, indent: bool = True) -> str:
+    """Serialize to JSON with orjson when installed, falling back to the stdlib encoder."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    return json.dumps(obj, default=str, indent=2 if indent else None, separators=None if indent else _COMPACT_SEPARATORS, ensure_ascii=False)
+
+def write_json(path: Path, obj: Any, indent: bool = True) -> None:
+    """Write obj as UTF-8 JSON to path (orjson bytes in one write, or streamed via the stdlib)."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0))
+        return
+    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        json.dump(obj, f, default=str, indent=2 if indent else None, separators=None if indent else _COMPACT_SEPARATORS, ensure_ascii=False)
+
+# Characters encoded per write by write_text for large strings
+_WRITE_CHUNK_CHARS = 1 << 20
+
+def write_text(path: Path, text: str) -> None:
+    """Write text to path as UTF-8.
+
+    Large strings (page HTML can be tens of MB) are encoded and written a chunk at a time,
+    so a full encoded copy never sits in memory next to the string itself.
+    """
+    if len(text) <= _WRITE_CHUNK_CHARS:
+        path.write_bytes(text.encode('utf-8'))
+        return
+    with open(path, 'wb') as f:
+        for start in range(0, len(text), _WRITE_CHUNK_CHARS):
+            f.write(text[start:start + _WRITE_CHUNK_CHARS].encode('utf-8'))
+
+def write_ndjson(path: Path, records: List[Any]) -> None:
+    """Write records to path as newline-delimited JSON, one compact object per line."""
+    if orjson is not None:
+        path.write_bytes(b"".join(orjson.dumps(r, default=str, option=orjson.OPT_APPEND_NEWLINE) for r in records))
+        return
+    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        for record in records:
+            f.write(json.dumps(record, default=str, separators=_COMPACT_SEPARATORS, ensure_ascii=False))
+            f.write("\n")
 
 def construct_absolute_url(url: str, base_url: str) -> Optional[str]:
     """Construct an absolute URL from a potentially relative URL and a base URL."""
     if not url:
         return None
+    if url.startswith(('http://', 'https://')):
+        return url
     try:
-        parsed_url = urlparse(url)
-        if parsed_url.scheme and parsed_url.netloc:
-            return url
+        # urljoin returns other absolute URLs unchanged and gives protocol-relative ones the base's scheme
         return urljoin(base_url, url)
     except Exception as e:
         logging.error(f"Error constructing absolute URL for '{url}' with base '{base_url}': {e}")
         return None
 
+# Longer URLs (inline data: images, often hundreds of KB) skip the memoized helpers; a cache
+# entry would pin the whole payload, and the next lookup of the same string is unlikely anyway
+_MAX_CACHED_URL_LENGTH = 2048
+
+@lru_cache(maxsize=4096)
+def _parse_url_cached(url: str) -> ParseResult:
+    return urlparse(url)
+
+def parse_url(url: str) -> ParseResult:
+    """urlparse() memoized per URL string, shared by the page-level helpers that each need the parts."""
+    if len(url) > _MAX_CACHED_URL_LENGTH:
+        return urlparse(url)
+    return _parse_url_cached(url)
+
+# Query parameters that only carry click/campaign tracking and never change the page content
+_TRACKING_QUERY_PARAMS = frozenset(('fbclid', 'gclid', 'msclkid'))
+
+@lru_cache(maxsize=4096)
+def canonical_url(url: str) -> str:
+    """Normalize a URL for duplicate detection.
+
+    Lowercases the scheme and host, drops the fragment and tracking parameters (utm_*,
+    fbclid, ...) and sorts the remaining query, so equivalent links map to one string.
+    """
+    parsed = parse_url(url)
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.startswith('utm_') and key not in _TRACKING_QUERY_PARAMS
+    )
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), parsed.path or '/', parsed.params, urlencode(query), ''))
+
+# Characters rejected anywhere in a URL's domain, path or query. frozenset.isdisjoint(str)
+# scans the string once in C instead of an interpreted any() loop per character.
+_INVALID_URL_CHARS = frozenset('<>{}|\\^~[]`')
+
+# Plain http(s)://host.tld[:port][/path][?query][#fragment] URLs that pass every check in
+# validate_url. Deliberately stricter than those checks (ASCII host, no userinfo, no empty path
+# segments): a match is accepted in one C-level scan, anything else gets the detailed checks.
+_SIMPLE_VALID_URL_RE = re.compile(
+    r'https?://[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)+(?::[0-9]+)?'
+    r'(?:/[^/?#\s<>{}|\\^~\[\]`]+)*/?'
+    r'(?:\?[^#\s<>{}|\\^~\[\]`]*)?'
+    r'(?:#\S*)?',
+    re.IGNORECASE
+)
+
+@lru_cache(maxsize=4096) # Pure function of the string; page URLs are validated repeatedly
 def validate_url(url: str) -> Tuple[bool, str]:
     """Validate a URL for scraping."""
     if not url or not isinstance(url, str):
         return False, "URL must be a non-empty string"
     url = url.strip()
+    # Cheap string checks first: noise from link extraction is rejected without parsing it
+    if len(url) > 2048: return False, f"URL exceeds maximum length of 2048 characters (current length: {len(url)})"
+    if ' ' in url: return False, "URL contains spaces. Please remove spaces or use URL encoding"
+    if not url[:8].lower().startswith(('http://', 'https://')):
+        if '://' not in url: return False, "URL must include a scheme (e.g., 'http://' or 'https://')"
+        return False, f"Unsupported URL scheme: '{url.split('://', 1)[0].lower()}'"
+    if _SIMPLE_VALID_URL_RE.fullmatch(url):
+        return True, ""
     try:
-        parsed = urlparse(url)
-        if not parsed.scheme: return False, "URL must include a scheme (e.g., 'http://' or 'https://')"
+        parsed = parse_url(url)
         if not parsed.netloc: return False, "URL must include a domain name"
-        if parsed.scheme not in ['http', 'https']: return False, f"Unsupported URL scheme: '{parsed.scheme}'"
-        if ' ' in url: return False, "URL contains spaces. Please remove spaces or use URL encoding"
         if not '.' in parsed.netloc: return False, f"Invalid domain format: '{parsed.netloc}'"
         if len(parsed.netloc) < 3: return False, f"Domain name too short: '{parsed.netloc}'"
-        if len(url) > 2048: return False, f"URL exceeds maximum length of 2048 characters (current length: {len(url)})"
         
-        invalid_chars = set('<>{}|\\^~[]`')
-        if any(char in parsed.netloc for char in invalid_chars): return False, "URL contains invalid characters in domain name"
+        if not _INVALID_URL_CHARS.isdisjoint(parsed.netloc): return False, "URL contains invalid characters in domain name"
         
-        if parsed.path:
-            if ' ' in parsed.path: return False, "URL path contains spaces. Please use URL encoding (e.g., %20)"
-            if any(char in parsed.path for char in invalid_chars): return False, "URL path contains invalid characters"
-            if '//' in parsed.path: return False, "URL path contains consecutive slashes"
-            if len(parsed.path) > 2048: return False, f"URL path exceeds maximum length (current length: {len(parsed.path)})"
-        
-        if parsed.query:
-            if ' ' in parsed.query: return False, "URL query contains spaces. Please use URL encoding (e.g., %20)"
-            if any(char in parsed.query for char in invalid_chars): return False, "URL query contains invalid characters"
-            if len(parsed.query) > 2048: return False, f"URL query exceeds maximum length (current length: {len(parsed.query)})"
+        # Spaces and over-long URLs were rejected above, so each segment only needs the character scan
+        for segment_name, segment in (("path", parsed.path), ("query", parsed.query)):
+            if not _INVALID_URL_CHARS.isdisjoint(segment): return False, f"URL {segment_name} contains invalid characters"
+        if '//' in parsed.path: return False, "URL path contains consecutive slashes"
         
         return True, ""
     except Exception as e:
         return False, f"Failed to parse URL: {str(e)}"
 
-def download_and_process_image(
-    full_url: str, img_path: Path, ocr_retry_count: int = 3, ocr_retry_delay: float = 1.0
-) -> Optional[Dict[str, Any]]:
-    """Download an image and process it with OCR. Returns OCRResult compatible dict or None."""
-    filename = img_path.name
-    if download_image(full_url, img_path): 
-        logging.info(f"[OK] Saved image '{filename}' from {full_url}")
-        for attempt in range(ocr_retry_count):
-            try:
-                ocr_result_dict = ocr_image(str(img_path)) 
-                logging.info(f"[TEXT] OCR successful for '{filename}' - Text preview: {ocr_result_dict['text'][:100]}")
-                return {
-                    'image_url': full_url,
-                    'image_path': str(img_path), 
-                    'text': ocr_result_dict['text'],
-                    'char_count': ocr_result_dict['char_count'],
-                    'word_count': ocr_result_dict['word_count'],
-                    'ocr_failed': False 
-                }
-            except Exception as e:
-                if attempt < ocr_retry_count - 1:
-                    logging.warning(f"OCR attempt {attempt + 1} failed for '{filename}' ({full_url}): {str(e)}")
-                    time.sleep(ocr_retry_delay)
-                else:
-                    logging.error(f"All OCR attempts failed for '{filename}' ({full_url}): {str(e)}")
-                    return { 
-                        'image_url': full_url, 'image_path': str(img_path), 
-                        'text': "", 'char_count': 0, 'word_count': 0, 'ocr_failed': True
-                    }
+# ocr_image statuses worth another attempt: Tesseract itself failed (killed, timed out, out of
+# memory). Missing, unreadable or corrupt files fail the same way every time, so they are final.
+_RETRYABLE_OCR_STATUSES = frozenset({'error_tesseract'})
+
+def _ocr_once(img_path: Path, data: Optional[bytes] = None) -> Dict[str, Any]:
+    """Run ocr_image once (ocr_image_bytes if the encoded image is already in memory),
+    raising OCRError when the failure is worth retrying.
+
+    With config.OCR_USE_PROCESSES the work is handed to ocr's shared process pool (the
+    calling thread just waits), so image preprocessing isn't limited by the GIL.
+    """
+    from .ocr import ocr_image, ocr_image_bytes, _get_ocr_process_pool # Deferred: loads PIL/Tesseract (and OpenCV if installed)
+
+    call, args = (ocr_image, (str(img_path),)) if data is None else (ocr_image_bytes, (data, str(img_path)))
+    if config.OCR_USE_PROCESSES:
+        pool = _get_ocr_process_pool(max(1, min(config.OCR_MAX_WORKERS, (os.cpu_count() or 2) // 2)))
+        ocr_result_dict = pool.submit(call, *args).result()
     else:
-        logging.error(f"[ERROR] Failed to download '{filename}' from {full_url}")
+        ocr_result_dict = call(*args)
+    if ocr_result_dict.get('ocr_status') in _RETRYABLE_OCR_STATUSES:
+        raise OCRError(f"OCR failed for {img_path.name}", details={'ocr_status': ocr_result_dict['ocr_status']})
+    return ocr_result_dict
+
+def _ocr_retry(ocr_retry_count: int, ocr_retry_delay: float) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """The retry_with_backoff decorator used for OCR attempts (wraps sync and async callables)."""
+    from .retry import retry_with_backoff # Deferred: retry imports this module
+
+    return retry_with_backoff(
+        max_retries=max(0, ocr_retry_count - 1), initial_delay=ocr_retry_delay,
+        backoff_factor=2.0, max_delay=10.0, jitter=True, retry_on_exceptions=[OCRError]
+    )
+
+def _image_ocr_result(full_url: str, img_path: Path, ocr_result_dict: Optional[Dict[str, Any]], error: Optional[Exception] = None) -> Dict[str, Any]:
+    """Shape an ocr_image result (or the error that ended the retries) into an image result dict."""
+    filename = img_path.name
+    if ocr_result_dict is None:
+        logging.error("All OCR attempts failed for '%s' (%s): %s", filename, full_url, error)
         return {
-            'image_url': full_url, 'image_path': str(img_path), 
-            'text': "", 'char_count': 0, 'word_count': 0, 'ocr_failed': True, 'download_failed': True
+            'image_url': full_url, 'image_path': str(img_path),
+            'text': "", 'char_count': 0, 'word_count': 0, 'ocr_failed': True
         }
-    return None 
+    if logging.getLogger().isEnabledFor(logging.INFO): # Skip the preview slice when INFO is off
+        logging.info("[TEXT] OCR successful for '%s' - Text preview: %s", filename, ocr_result_dict['text'][:100])
+    return {
+        'image_url': full_url,
+        'image_path': str(img_path), 
+        'text': ocr_result_dict['text'],
+        'char_count': ocr_result_dict['char_count'],
+        'word_count': ocr_result_dict['word_count'],
+        'ocr_failed': False 
+    }
+
+def _ocr_downloaded_image(
+    full_url: str, img_path: Path, ocr_retry_count: int = 3, ocr_retry_delay: float = 1.0,
+    data: Optional[bytes] = None
+) -> Dict[str, Any]:
+    """OCR a downloaded image (read from img_path unless its bytes are passed as data),
+    retrying engine failures with backoff. Returns an OCRResult compatible dict."""
+    try:
+        ocr_result_dict = _ocr_retry(ocr_retry_count, ocr_retry_delay)(_ocr_once)(img_path, data)
+    except Exception as e:
+        return _image_ocr_result(full_url, img_path, None, e)
+    return _image_ocr_result(full_url, img_path, ocr_result_dict)
+
+def _download_failed_result(full_url: str, img_path: Path) -> Dict[str, Any]:
+    logging.error("[ERROR] Failed to download '%s' from %s", img_path.name, full_url)
+    return {
+        'image_url': full_url, 'image_path': str(img_path), 
+        'text': "", 'char_count': 0, 'word_count': 0, 'ocr_failed': True, 'download_failed': True
+    }
+
+# Images saved during this run: target path -> the URL it was downloaded from. A file on disk is
+# only reused for that same URL, never for another one whose name happens to map to the path.
+# data: URLs are left out (decoding them again is cheap, and the key would pin the payload).
+_downloaded_images: Dict[Path, str] = {}
+
+def _record_download(full_url: str, img_path: Path) -> None:
+    if not full_url.startswith('data:'):
+        _downloaded_images[img_path] = full_url
+
+def _already_downloaded(full_url: str, img_path: Path) -> bool:
+    """True if full_url was saved to img_path earlier in this run and the file is still there, non-empty."""
+    if _downloaded_images.get(img_path) != full_url:
+        return False
+    try:
+        return img_path.stat().st_size > 0
+    except OSError:
+        return False
+
+def download_and_process_image(
+    full_url: str, img_path: Path, ocr_retry_count: int = 3, ocr_retry_delay: float = 1.0
+) -> Optional[Dict[str, Any]]:
+    """Download an image (unless this run already saved it from the same URL) and process it with OCR. Returns OCRResult compatible dict or None.
+
+    A fresh download is OCR'd from memory; the saved copy is written but never read back.
+    """
+    if _already_downloaded(full_url, img_path):
+        logging.debug("Reusing already downloaded image %s", img_path)
+        return _ocr_downloaded_image(full_url, img_path, ocr_retry_count, ocr_retry_delay)
+    data = download_image_bytes(full_url)
+    if data is None:
+        return _download_failed_result(full_url, img_path)
+    try:
+        ensure_dir(img_path.parent)
+        img_path.write_bytes(data)
+        _record_download(full_url, img_path)
+        logging.info("[OK] Saved image '%s' from %s", img_path.name, full_url)
+    except OSError as e: # The OCR text is still usable without the saved copy
+        logging.error("Failed to save image '%s' from %s: %s", img_path.name, full_url, e)
+    return _ocr_downloaded_image(full_url, img_path, ocr_retry_count, ocr_retry_delay, data)
+
+def _image_target(img_url: str, base_url: str, images_dir: Path) -> Optional[Tuple[str, Path]]:
+    """Resolve an <img> src against its page to (absolute URL, target path), or None if unusable."""
+    full_url = construct_absolute_url(img_url, base_url)
+    if not full_url:
+        logging.warning("Skipping image with invalid or unconstructable URL from src: %s", img_url)
+        return None
+        
+    parsed = parse_url(full_url)
+    if not parsed.scheme or not parsed.netloc:
+        logging.warning("Skipping image with invalid scheme/netloc: %s", full_url)
+        return None
+        
+    return full_url, images_dir / get_safe_filename(full_url)
 
 def process_single_image(
     img_url: str, base_url: str, images_dir: Path, 
     ocr_retry_count: int = 3, ocr_retry_delay: float = 1.0
 ) -> Optional[Dict[str, Any]]:
     try:
-        full_url = construct_absolute_url(img_url, base_url)
-        if not full_url:
-            logging.warning(f"Skipping image with invalid or unconstructable URL from src: {img_url}")
-            return None
-            
-        parsed = urlparse(full_url)
-        if not parsed.scheme or not parsed.netloc:
-            logging.warning(f"Skipping image with invalid scheme/netloc: {full_url}")
+        target = _image_target(img_url, base_url, images_dir)
+        if target is None:
             return None
-            
-        filename = get_safe_filename(full_url)
-        img_path = images_dir / filename
-        
+        full_url, img_path = target
         return download_and_process_image(
             full_url=full_url, img_path=img_path,
             ocr_retry_count=ocr_retry_count, ocr_retry_delay=ocr_retry_delay
         )
     except Exception as e:
-        logging.error(f"[ERROR] Error processing image URL {img_url}: {e}")
+        logging.error("[ERROR] Error processing image URL %s: %s", img_url, e)
         return None
 
 def process_images_concurrently(
     img_urls: List[str], base_url: str, images_dir: Path, max_workers: int = 5,
-    ocr_retry_count: int = 3, ocr_retry_delay: float = 1.0
+    ocr_retry_count: int = 3, ocr_retry_delay: float = 1.0, ocr_workers: Optional[int] = None
 ) -> List[Dict[str, Any]]:
-    successful_results = []
-    logging.info(f"Starting concurrent processing of {len(img_urls)} images with {max_workers} workers")
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_url = {
-            executor.submit(
-                process_single_image, img_url, base_url, images_dir,
-                ocr_retry_count, ocr_retry_delay
-            ): img_url for img_url in img_urls
-        }
-        for future in as_completed(future_to_url):
-            original_img_src = future_to_url[future]
-            try:
-                result = future.result()
-                if result: 
-                    successful_results.append(result)
-            except Exception as e:
-                logging.error(f"[ERROR] Exception for {original_img_src} in ThreadPool: {str(e)}")
-    
-    logging.info(f"Completed concurrent processing. Successful results: {len(successful_results)}/{len(img_urls)}")
+    """Download and OCR a page's images.
+
+    Downloads run on one event loop over a shared async HTTP client, at most max_workers
+    at a time. Each finished image is handed to a separate OCR thread pool of ocr_workers
+    threads (default config.OCR_MAX_WORKERS, capped at half the CPU count) while the
+    remaining downloads continue, so network and CPU concurrency are sized independently.
+    Must not be called from a running event loop.
+    """
+    ocr_workers = max(1, min(ocr_workers or config.OCR_MAX_WORKERS, (os.cpu_count() or 2) // 2))
+    logging.info("Starting concurrent processing of %d images with %d download and %d OCR workers", len(img_urls), max_workers, ocr_workers)
+    results = asyncio.run(_process_images_async(img_urls, base_url, images_dir, max_workers, ocr_workers, ocr_retry_count, ocr_retry_delay))
+    successful_results = [result for result in results if result]
+    logging.info("Completed concurrent processing. Successful results: %d/%d", len(successful_results), len(img_urls))
     return successful_results
 
+async def _process_images_async(
+    img_urls: List[str], base_url: str, images_dir: Path, max_workers: int, ocr_workers: int,
+    ocr_retry_count: int, ocr_retry_delay: float
+) -> List[Optional[Dict[str, Any]]]:
+    targets: List[Tuple[str, Tuple[str, Path]]] = [] # (original src, (absolute URL, target path))
+    seen_urls = set() # The same asset is often referenced by several <img> tags
+    for img_url in img_urls:
+        try:
+            target = _image_target(img_url, base_url, images_dir)
+        except Exception as e:
+            logging.error("[ERROR] Error processing image URL %s: %s", img_url, e)
+            continue
+        if target is not None and target[0] not in seen_urls:
+            seen_urls.add(target[0])
+            targets.append((img_url, target))
+
+    loop = asyncio.get_running_loop()
+    download_slots = asyncio.Semaphore(max(1, max_workers))
+    async with create_async_http_client() as client:
+        with ThreadPoolExecutor(max_workers=ocr_workers, thread_name_prefix="ocr") as ocr_pool:
+            @_ocr_retry(ocr_retry_count, ocr_retry_delay)
+            async def ocr_with_retry(img_path: Path) -> Dict[str, Any]:
+                return await loop.run_in_executor(ocr_pool, _ocr_once, img_path)
+
+            async def process(full_url: str, img_path: Path) -> Dict[str, Any]:
+                if _already_downloaded(full_url, img_path):
+                    logging.debug("Reusing already downloaded image %s", img_path)
+                else:
+                    async with download_slots:
+                        saved = await download_image_async(client, full_url, img_path)
+                    if not saved:
+                        return _download_failed_result(full_url, img_path)
+                    _record_download(full_url, img_path)
+                    logging.info("[OK] Saved image '%s' from %s", img_path.name, full_url)
+                # OCR is CPU-bound (Tesseract runs outside the GIL); keep it off the event loop.
+                # Each attempt takes a pool thread only while it runs: backoff waits on the loop.
+                try:
+                    ocr_result_dict = await ocr_with_retry(img_path)
+                except Exception as e:
+                    return _image_ocr_result(full_url, img_path, None, e)
+                return _image_ocr_result(full_url, img_path, ocr_result_dict)
+
+            outcomes = await asyncio.gather(*(process(*target) for _, target in targets), return_exceptions=True)
+
+    results: List[Optional[Dict[str, Any]]] = []
+    for (original_img_src, _), outcome in zip(targets, outcomes):
+        if isinstance(outcome, BaseException):
+            logging.error("[ERROR] Exception for %s: %s", original_img_src, outcome)
+            results.append(None)
+        else:
+            results.append(outcome)
+    return results
+
+# Longest wait between two download attempts, however many have failed
+_MAX_DOWNLOAD_BACKOFF = 30.0
+
+def _download_backoff(error: Exception, url: str, attempt: int, retry_delay: float) -> float:
+    """Seconds the caller should sleep before retrying a failed download.
+
+    Exponential (retry_delay * 2^attempt) with 0.5-1.5x jitter so parallel workers spread out.
+    Throttling responses (HTTP 429, 5xx) put the whole host on hold instead: the delay (or a
+    longer Retry-After) goes to its rate limiter, every worker waits there, and 0 is returned.
+    """
+    delay = min(retry_delay * 2 ** attempt, _MAX_DOWNLOAD_BACKOFF) * random.uniform(0.5, 1.5)
+    if isinstance(error, httpx.HTTPStatusError):
+        response = error.response
+        if response.status_code == 429 or response.status_code >= 500:
+            retry_after = response.headers.get('retry-after', '')
+            if retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), _MAX_DOWNLOAD_BACKOFF))
+            get_rate_limiter(normalize_hostname(url)).back_off(delay)
+            return 0.0
+    return delay
+
 def handle_download_error(error: Exception, url: str, attempt: int, max_retries: int, retry_delay: float, raise_on_failure: bool) -> bool:
-    """Handles download errors with logging. Returns True if retry should occur."""
+    """Handles download errors with logging and backoff (see _download_backoff). Returns True if retry should occur."""
     logging.warning(f"Attempt {attempt + 1}/{max_retries} failed for {url}: {type(error).__name__} - {str(error)}")
     if attempt < max_retries - 1:
-        logging.info(f"Retrying in {retry_delay:.2f} seconds...")
-        time.sleep(retry_delay)
+        delay = _download_backoff(error, url, attempt, retry_delay)
+        if delay > 0:
+            logging.info(f"Retrying in {delay:.2f} seconds...")
+            time.sleep(delay)
         return True
     else:
         logging.error(f"All {max_retries} attempts failed for {url}. Last error: {type(error).__name__} - {str(error)}")
@@ -163,10 +414,15 @@ def handle_download_error(error: Exception, url: str, attempt: int, max_retries:
             raise RuntimeError(f"Failed to download {url} after {max_retries} attempts.") from error
         return False
 
+# Base64 characters decoded per write for large data URLs (a multiple of 4, so slices decode independently)
+_DATA_URL_CHUNK_SIZE = 1024 * 1024
+
+# Whitespace that wrapped base64 in inline images may contain; removed before decoding
+_BASE64_WHITESPACE = str.maketrans('', '', ' \t\r\n')
+
 def handle_data_url(data_url: str, path: Path) -> Optional[Path]:
     """Handle downloading of data URLs (base64 encoded images)."""
     from .logging_utils import info, error 
-    import base64
     
     mime_type = "unknown" 
     data_size_approx = 0  
@@ -179,9 +435,19 @@ def handle_data_url(data_url: str, path: Path) -> Optional[Path]:
         info(f"Processing data URL image: type={mime_type}, size_approx={data_size_approx} bytes",
              category='NETWORK', context={'url_stub': f'data:{mime_type};base64,[{data_size_approx}b]'})
         
-        image_data = base64.b64decode(encoded)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(str(path), 'wb') as f: f.write(image_data)
+        ensure_dir(path.parent)
+        if ';base64' not in header:
+            # Plain data URLs (typically inline SVG) are percent-encoded, not base64
+            path.write_bytes(unquote_to_bytes(encoded))
+        else:
+            # \t, \r and \n are not printable, so one C-level check covers all of it
+            if ' ' in encoded or not encoded.isprintable():
+                encoded = encoded.translate(_BASE64_WHITESPACE)
+            with open(os.fspath(path), 'wb') as f:
+                # Decode in slices (a multiple of 4 characters each) so large inline images
+                # never hold a second full-size copy in memory
+                for start in range(0, len(encoded), _DATA_URL_CHUNK_SIZE):
+                    f.write(_b64decode(encoded[start:start + _DATA_URL_CHUNK_SIZE]))
         info(f"Successfully saved data URL image to {path}", category='FILE', 
              context={'path': str(path), 'url_stub': f'data:{mime_type};base64,[{data_size_approx}b]'})
         return path
@@ -190,6 +456,37 @@ def handle_data_url(data_url: str, path: Path) -> Optional[Path]:
               category='NETWORK', context={'url_stub': f'data:{mime_type};base64,[{data_size_approx}b]'})
         return None
 
+# Bytes read from the network per write; bounds each download worker's buffer to one chunk
+_DOWNLOAD_CHUNK_SIZE = 32 * 1024
+
+# Images are already compressed, so they are requested without transfer encoding and the body
+# can be streamed as received (iter_raw) instead of through httpx's decoder chain
+_IMAGE_REQUEST_HEADERS = {'Accept-Encoding': 'identity'}
+
+def _is_unencoded(res: httpx.Response) -> bool:
+    """True if the server honoured Accept-Encoding: identity (some compress regardless)."""
+    return res.headers.get('content-encoding', 'identity').strip().lower() in ('', 'identity')
+
+def _body_chunks(res: httpx.Response) -> Iterator[bytes]:
+    if _is_unencoded(res):
+        return res.iter_raw(chunk_size=_DOWNLOAD_CHUNK_SIZE)
+    return res.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE)
+
+def _body_chunks_async(res: httpx.Response) -> AsyncIterator[bytes]:
+    if _is_unencoded(res):
+        return res.aiter_raw(chunk_size=_DOWNLOAD_CHUNK_SIZE)
+    return res.aiter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE)
+
+class _ImageTooLarge(Exception):
+    """Raised while streaming an image that exceeds config.IMAGE_MAX_BYTES (never retried)."""
+
+def _check_declared_size(res: httpx.Response) -> None:
+    """Raise _ImageTooLarge if the response's Content-Length is over config.IMAGE_MAX_BYTES."""
+    max_bytes = config.IMAGE_MAX_BYTES
+    declared_size = res.headers.get('content-length')
+    if max_bytes > 0 and declared_size and declared_size.isdigit() and int(declared_size) > max_bytes:
+        raise _ImageTooLarge(f"Content-Length {declared_size} exceeds {max_bytes} bytes")
+
 def download_image(url: str, path: Path, raise_on_failure: bool = False) -> Optional[Path]:
     """Download an image with retry logic and rate limiting."""
     from .logging_utils import info, warning, error 
@@ -198,87 +495,235 @@ def download_image(url: str, path: Path, raise_on_failure: bool = False) -> Opti
         return handle_data_url(url, path)
     
     rate_limiter = get_rate_limiter(normalize_hostname(url)) 
+    client = get_http_client()
+    # The structured info() records build a message and context dict each; skip them when INFO is off
+    info_enabled = logging.getLogger().isEnabledFor(logging.INFO)
     
     for attempt in range(config.IMAGE_RETRY_COUNT):
         try:
             rate_limiter.wait()
-            info(f"Downloading image (attempt {attempt+1}) from {url}", category='NETWORK', context={'url': url})
-            res = requests.get(url, timeout=config.IMAGE_DOWNLOAD_TIMEOUT, stream=True) 
-            res.raise_for_status() 
-
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(str(path), 'wb') as f:
-                for chunk in res.iter_content(chunk_size=8192): 
-                    f.write(chunk)
-            info(f"Successfully downloaded image to {path}", category='FILE', context={'url': url, 'path': str(path)})
+            if info_enabled:
+                info(f"Downloading image (attempt {attempt+1}) from {url}", category='NETWORK', context={'url': url})
+            with client.stream('GET', url, headers=_IMAGE_REQUEST_HEADERS) as res:
+                res.raise_for_status() 
+                _check_declared_size(res)
+                max_bytes = config.IMAGE_MAX_BYTES
+
+                ensure_dir(path.parent)
+                written = 0
+                with open(os.fspath(path), 'wb') as f:
+                    for chunk in _body_chunks(res): 
+                        written += len(chunk)
+                        if max_bytes > 0 and written > max_bytes:
+                            raise _ImageTooLarge(f"more than {max_bytes} bytes received")
+                        f.write(chunk)
+            if info_enabled:
+                info(f"Successfully downloaded image to {path}", category='FILE', context={'url': url, 'path': str(path)})
             return path
-        except requests.exceptions.HTTPError as e: 
+        except _ImageTooLarge as e:
+            # Retrying would fetch the same oversized body again
+            warning(f"Skipping oversized image {url}: {e}", category='NETWORK', context={'url': url})
+            path.unlink(missing_ok=True)
+            if raise_on_failure:
+                raise RuntimeError(f"Image {url} exceeds the {config.IMAGE_MAX_BYTES}-byte limit.") from e
+            return None
+        except httpx.HTTPStatusError as e: 
             error_msg = f"HTTP error {e.response.status_code} while downloading {url}: {str(e)}"
             warning(error_msg, category='NETWORK', context={'url': url, 'status_code': e.response.status_code})
             if not handle_download_error(e, url, attempt, config.IMAGE_RETRY_COUNT, config.IMAGE_RETRY_DELAY, raise_on_failure):
                 return None 
-        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+        except httpx.TransportError as e: # Timeouts, connection and protocol errors
+            path.unlink(missing_ok=True) # The body may have been cut off mid-stream
             error_msg = f"Network error (attempt {attempt+1}) for {url}: {str(e)}"
             warning(error_msg, category='NETWORK', context={'url': url})
             if not handle_download_error(e, url, attempt, config.IMAGE_RETRY_COUNT, config.IMAGE_RETRY_DELAY, raise_on_failure):
                 return None
         except Exception as e: 
+            path.unlink(missing_ok=True)
             error_msg = f"Unexpected error (attempt {attempt+1}) downloading {url}: {str(e)}"
             error(error_msg, category='NETWORK', context={'url': url})
             if not handle_download_error(e, url, attempt, config.IMAGE_RETRY_COUNT, config.IMAGE_RETRY_DELAY, raise_on_failure):
                 return None
     return None 
 
+def download_image_bytes(url: str) -> Optional[bytes]:
+    """download_image() without the file: same rate limiting, retries and size cap, but the
+    body is returned in memory (for callers that OCR it straight away). None on failure."""
+    if url.startswith('data:'):
+        try:
+            header, encoded = url.split(',', 1)
+            return _b64decode(encoded) if ';base64' in header else unquote_to_bytes(encoded)
+        except Exception as e:
+            logging.error("Failed to decode data URL image: %s", e)
+            return None
+
+    rate_limiter = get_rate_limiter(normalize_hostname(url))
+    client = get_http_client()
+    for attempt in range(config.IMAGE_RETRY_COUNT):
+        try:
+            rate_limiter.wait()
+            logging.info("Downloading image (attempt %d) from %s", attempt + 1, url)
+            with client.stream('GET', url, headers=_IMAGE_REQUEST_HEADERS) as res:
+                res.raise_for_status()
+                _check_declared_size(res)
+                max_bytes = config.IMAGE_MAX_BYTES
+                chunks: List[bytes] = []
+                written = 0
+                for chunk in _body_chunks(res):
+                    written += len(chunk)
+                    if max_bytes > 0 and written > max_bytes:
+                        raise _ImageTooLarge(f"more than {max_bytes} bytes received")
+                    chunks.append(chunk)
+            return b''.join(chunks)
+        except _ImageTooLarge as e:
+            logging.warning("Skipping oversized image %s: %s", url, e)
+            return None
+        except Exception as e:
+            if not handle_download_error(e, url, attempt, config.IMAGE_RETRY_COUNT, config.IMAGE_RETRY_DELAY, False):
+                return None
+    return None
+
+async def download_image_async(client: httpx.AsyncClient, url: str, path: Path) -> Optional[Path]:
+    """download_image() for an event loop: same rate limiting, retries and size cap, but
+    waits without blocking the loop. Returns the saved path, or None on failure."""
+    if url.startswith('data:'):
+        return handle_data_url(url, path)
+
+    rate_limiter = get_rate_limiter(normalize_hostname(url))
+    for attempt in range(config.IMAGE_RETRY_COUNT):
+        try:
+            await rate_limiter.acquire_async()
+            logging.info("Downloading image (attempt %d) from %s", attempt + 1, url)
+            async with client.stream('GET', url, headers=_IMAGE_REQUEST_HEADERS) as res:
+                res.raise_for_status()
+                _check_declared_size(res)
+                max_bytes = config.IMAGE_MAX_BYTES
+
+                ensure_dir(path.parent)
+                written = 0
+                # Local file writes of one chunk are short; they don't need a thread hop
+                with open(os.fspath(path), 'wb') as f:
+                    async for chunk in _body_chunks_async(res):
+                        written += len(chunk)
+                        if max_bytes > 0 and written > max_bytes:
+                            raise _ImageTooLarge(f"more than {max_bytes} bytes received")
+                        f.write(chunk)
+            return path
+        except _ImageTooLarge as e:
+            logging.warning("Skipping oversized image %s: %s", url, e)
+            path.unlink(missing_ok=True)
+            return None
+        except Exception as e:
+            path.unlink(missing_ok=True) # Never leave a truncated file to be reused as a finished download
+            logging.warning("Attempt %d/%d failed for %s: %s - %s", attempt + 1, config.IMAGE_RETRY_COUNT, url, type(e).__name__, e)
+            if attempt < config.IMAGE_RETRY_COUNT - 1:
+                delay = _download_backoff(e, url, attempt, config.IMAGE_RETRY_DELAY)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+    logging.error("All %d attempts failed for %s", config.IMAGE_RETRY_COUNT, url)
+    return None
+
+def _ascii_unsafe_table(allowed: str) -> Dict[int, str]:
+    """str.translate table mapping every ASCII character except [A-Za-z0-9_] and allowed to '_'."""
+    return {code: '_' for code in range(128) if not (chr(code).isalnum() or chr(code) == '_' or chr(code) in allowed)}
+
+# Filesystem-safe character sets, each as a regex (any text) and an equivalent ASCII
+# translate table: for ASCII input \w is exactly [A-Za-z0-9_], and one translate pass in C
+# is cheaper than the regex engine.
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\.-]')
+_FILENAME_TABLE = _ascii_unsafe_table('.-')
+_UNSAFE_EXTENSION_RE = re.compile(r'[^\w\.]')
+_EXTENSION_TABLE = _ascii_unsafe_table('.')
+_UNSAFE_HOSTNAME_RE = re.compile(r'[^\w-]')
+# Hostnames are also lowercased; for ASCII input that folds into the same translate pass
+_HOSTNAME_TABLE = {**_ascii_unsafe_table('-'), **{code: chr(code + 32) for code in range(ord('A'), ord('Z') + 1)}}
+
+def _replace_unsafe(text: str, table: Dict[int, str], pattern: "re.Pattern[str]") -> str:
+    """Replace every character outside the safe set with '_'."""
+    return text.translate(table) if text.isascii() else pattern.sub('_', text)
+
+def _short_hash(text: str, digest_size: int = 4) -> str:
+    """Hex digest of text for use in file names (2 * digest_size characters).
+
+    Not security-sensitive: BLAKE2b is faster than MD5 on short strings and emits exactly
+    the requested length, so nothing is computed only to be truncated.
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=digest_size).hexdigest()
+
+def _url_path_and_query(url: str) -> Tuple[str, str]:
+    """The path and query of url, as urlparse() would return them, found with plain string scans.
+
+    Only the common 'scheme://host/path?query#fragment' shape is scanned; anything else
+    (path parameters, no '://') goes through parse_url.
+    """
+    rest = url.split('#', 1)[0]
+    path, _, query = rest.partition('?')
+    scheme_end = path.find('://')
+    if scheme_end <= 0 or path.find('/', 0, scheme_end) >= 0 or ';' in path:
+        parsed = parse_url(url)
+        return parsed.path, parsed.query
+    path_start = path.find('/', scheme_end + 3)
+    return (path[path_start:] if path_start >= 0 else ''), query
+
 def get_safe_filename(url: str) -> str:
-    """Convert a URL to a safe filename, including a hash of the query."""
+    """Convert a URL to a safe filename, unique per URL.
+
+    The name keeps the URL's basename and appends a short hash of the whole URL (fragment
+    excluded), so /p/1/large.jpg and /p/2/large.jpg never share a file.
+    """
+    if len(url) > _MAX_CACHED_URL_LENGTH:
+        return _safe_filename(url)
+    return _safe_filename_cached(url)
+
+def _safe_filename(url: str) -> str:
     try:
-        parsed_url = urlparse(url)
-        path_part = Path(parsed_url.path)
+        url_path, _ = _url_path_and_query(url)
+        path_part = Path(url_path)
         filename = path_part.name
         
         if not filename:
-            filename = hashlib.md5(parsed_url.path.encode('utf-8')).hexdigest()[:8]
+            filename = _short_hash(url_path)
 
         name, ext = os.path.splitext(filename)
-        safe_name = re.sub(r'[^\w\.-]', '_', name)
-        safe_ext = re.sub(r'[^\w\.]', '_', ext)
+        safe_name = _replace_unsafe(name, _FILENAME_TABLE, _UNSAFE_FILENAME_RE)
+        safe_ext = _replace_unsafe(ext, _EXTENSION_TABLE, _UNSAFE_EXTENSION_RE)
 
-        if parsed_url.query:
-            query_hash = hashlib.md5(parsed_url.query.encode('utf-8')).hexdigest()[:8]
-            safe_name = f"{safe_name}_{query_hash}"
-            
         if not safe_ext and '.' not in safe_name: 
             if path_part.suffix:
-                 safe_ext = re.sub(r'[^\w\.]', '_', path_part.suffix)
+                 safe_ext = _replace_unsafe(path_part.suffix, _EXTENSION_TABLE, _UNSAFE_EXTENSION_RE)
             else:
                  safe_ext = config.DEFAULT_IMAGE_EXTENSION 
         
-        final_filename = safe_name + safe_ext
+        url_hash = "_" + _short_hash(url.split('#', 1)[0], digest_size=6)
         
         max_len = 100
-        if len(final_filename) > max_len:
-            name_part, ext_part = os.path.splitext(final_filename)
-            allowed_name_len = max_len - len(ext_part)
-            final_filename = name_part[:allowed_name_len] + ext_part
-            
-        return final_filename if final_filename else "unknown_image"
+        # Shorten the readable part only; the hash is what keeps the name unique
+        allowed_name_len = max(max_len - len(url_hash) - len(safe_ext), 0)
+        return safe_name[:allowed_name_len] + url_hash + safe_ext
     except Exception as e:
         logging.error(f"Error creating safe filename for {url}: {e}")
-        return hashlib.md5(url.encode('utf-8')).hexdigest() + config.DEFAULT_IMAGE_EXTENSION
+        return _short_hash(url, digest_size=16) + config.DEFAULT_IMAGE_EXTENSION
+
+# The same image URLs (logos, sprites) recur across a site's pages
+_safe_filename_cached = lru_cache(maxsize=4096)(_safe_filename)
 
 def create_text_metadata(text: str) -> Dict[str, Any]:
     """Creates metadata for extracted text."""
     return {
         'text_length': len(text),
         'word_count': len(text.split()),
-        'paragraph_count': len([p for p in text.split('\n') if p.strip()])
+        # Same test as p.strip() without building the stripped copies or a filtered list
+        'paragraph_count': sum(1 for p in text.split('\n') if p and not p.isspace())
     }
 
-def create_ocr_metadata(ocr_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+def create_ocr_metadata(ocr_results: List[Dict[str, Any]], include_text: bool = True) -> Dict[str, Any]:
     """
     Generate a summary of OCR results from a list of image OCR dictionaries.
     Each dictionary in ocr_results is expected to have 'text', 'char_count', 'word_count',
     'image_url', 'image_path', and 'ocr_failed' (boolean).
+
+    With include_text=False the 'total_ocr_text' key (every image's text joined, which can
+    run to megabytes) is left out, for callers that only need the counts.
     """
     total_text_list = []
     total_char_count = 0
@@ -294,7 +739,8 @@ def create_ocr_metadata(ocr_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         is_successful_ocr = not result_item.get('ocr_failed', True) and bool(text)
         if is_successful_ocr:
             successful_ocr_count += 1
-            total_text_list.append(text)
+            if include_text:
+                total_text_list.append(text)
         
         # Always sum up char_count and word_count from the ocr_image output
         total_char_count += char_count 
@@ -308,8 +754,7 @@ def create_ocr_metadata(ocr_results: List[Dict[str, Any]]) -> Dict[str, Any]:
             'ocr_success': is_successful_ocr
         })
 
-    return {
-        'total_ocr_text': "\n\n".join(total_text_list).strip(),
+    summary: Dict[str, Any] = {
         'total_ocr_text_length': total_char_count, 
         'total_ocr_word_count': total_word_count, 
         'image_count': len(ocr_results),
@@ -317,54 +762,98 @@ def create_ocr_metadata(ocr_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         'success_rate': (successful_ocr_count / len(ocr_results)) * 100 if ocr_results else 0,
         'image_summaries': image_summaries
     }
+    if include_text:
+        summary = {'total_ocr_text': "\n\n".join(total_text_list).strip(), **summary} # Keeps it the first key
+    return summary
 
-def create_metadata(url: str, hostname: str, text: Optional[str] = None, ocr_results: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
-    """Create metadata dictionary for scraped content."""
+# (epoch second, ISO string) of the last metadata timestamp; records from the same second share it
+_last_timestamp: Tuple[int, str] = (0, "")
+
+def _now_iso() -> str:
+    """Local time as an ISO-8601 string at one-second resolution, formatted at most once per second."""
+    global _last_timestamp
+    second = int(time.time())
+    cached_second, cached_iso = _last_timestamp
+    if second != cached_second:
+        cached_iso = datetime.fromtimestamp(second).isoformat(timespec='seconds')
+        _last_timestamp = (second, cached_iso) # One tuple assignment, so threads never see a torn pair
+    return cached_iso
+
+def create_metadata(
+    url: str, hostname: str, text: Optional[str] = None, ocr_results: Optional[List[Dict[str, Any]]] = None,
+    include_ocr_text: bool = True
+) -> Dict[str, Any]:
+    """Create metadata dictionary for scraped content (see create_ocr_metadata for include_ocr_text)."""
     metadata: Dict[str, Any] = {
         'url': url,
         'hostname': hostname,
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': _now_iso(),
     }
     if text is not None:
         metadata['text_data'] = create_text_metadata(text)
     
     if ocr_results is not None:
-        ocr_summary_data = create_ocr_metadata(ocr_results)
+        ocr_summary_data = create_ocr_metadata(ocr_results, include_text=include_ocr_text)
         metadata.update(ocr_summary_data) 
         
     return metadata
 
-def create_scraper_directories(base_dir: Path, hostname: Optional[str] = None) -> Dict[str, Path]:
-    """Create the directory structure for scraper output."""
-    logging.debug(f"Ensuring directories under base: {base_dir}" + (f" for host: {hostname}" if hostname else ""))
+# Directories already created during this process, so repeat calls skip the mkdir syscalls.
+_created_dirs: set = set()
+
+def ensure_dir(path: Path) -> Path:
+    """Create a directory (and parents) once per process; later calls are a set lookup."""
+    if path not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        # parents=True created every ancestor too, so later calls for them are free.
+        _created_dirs.add(path)
+        _created_dirs.update(path.parents)
+    return path
+
+@lru_cache(maxsize=512)
+def _scraper_directories(base_dir: str, hostname: Optional[str]) -> Tuple[Tuple[str, Path], ...]:
+    """Create the output tree for (base_dir, hostname) once; repeat calls hit the cache."""
+    base = Path(base_dir)
     paths: Dict[str, Path] = {
-        "base": base_dir,
-        "images": base_dir / config.IMAGES_SUBDIR,
-        "pages": base_dir / config.PAGES_SUBDIR,
+        "base": base,
+        "images": base / config.IMAGES_SUBDIR,
+        "pages": base / config.PAGES_SUBDIR,
     }
     if hostname:
         paths["host_images"] = paths["images"] / hostname
         paths["host_pages"] = paths["pages"] / hostname
         paths["host_ocr"] = paths["host_pages"] / config.OCR_SUBDIR
-    
+
     for path_obj in paths.values():
         try:
-            path_obj.mkdir(parents=True, exist_ok=True)
+            ensure_dir(path_obj)
         except Exception as e:
             logging.error(f"Failed to create directory {path_obj}: {e}")
-            raise 
-            
-    logging.info(f"Ensured directories: {list(paths.keys())}")
-    return paths
+            raise
+
+    logging.info(f"Ensured directories under {base_dir}" + (f" for host: {hostname}" if hostname else "") + f": {list(paths.keys())}")
+    return tuple(paths.items())
+
+def create_scraper_directories(base_dir: Path, hostname: Optional[str] = None) -> Dict[str, Path]:
+    """Create the directory structure for scraper output.
+
+    Results are memoized per (base_dir, hostname), so only the first call for a
+    pair touches the filesystem. A fresh dict is returned each time so callers
+    can't mutate the cached entry.
+    """
+    return dict(_scraper_directories(str(base_dir), hostname))
 
+@lru_cache(maxsize=8192)
 def normalize_hostname(url: str) -> str:
     """Normalize a hostname to be filesystem-safe."""
     try:
-        hostname = urlparse(url).netloc
+        hostname = parse_url(url).netloc
         if not hostname: 
-            return "unknown_host_" + hashlib.md5(url.encode('utf-8')).hexdigest()[:8]
-        safe_hostname = re.sub(r'[^\w-]', '_', hostname.replace('.', '_'))
-        return safe_hostname.lower()
+            return "unknown_host_" + _short_hash(url)
+        # '.' is outside the allowed set, so dots become '_' in the same pass
+        if hostname.isascii():
+            return hostname.translate(_HOSTNAME_TABLE) # Sanitises and lowercases in one pass
+        return _UNSAFE_HOSTNAME_RE.sub('_', hostname).lower()
     except Exception as e:
         logging.warning(f"Could not normalize hostname for URL '{url}': {e}")
         return "error_normalizing_host"
@@ -375,16 +864,16 @@ def get_url_specific_safe_dirname(url: str) -> str:
     and a hash of the path to ensure uniqueness for different pages from the same host.
     """
     try:
-        parsed_url = urlparse(url)
+        parsed_url = parse_url(url)
         host_part = normalize_hostname(url) 
 
         path_query = parsed_url.path
         if parsed_url.query:
             path_query += "?" + parsed_url.query
         
-        path_hash = hashlib.md5(path_query.encode('utf-8')).hexdigest()[:8]
+        path_hash = _short_hash(path_query)
         
         return f"{host_part}_{path_hash}"
     except Exception as e:
         logging.error(f"Error creating URL specific dirname for {url}: {e}")
-        return hashlib.md5(url.encode('utf-8')).hexdigest()
+        return _short_hash(url, digest_size=16)
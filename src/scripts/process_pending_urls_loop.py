@@ -26,18 +26,22 @@ def process_pending_urls_loop(
     logging.info(f"Found {len(pending_urls_data)} 'pending' URLs to process.")
     
     progress_bar = tqdm(pending_urls_data, desc="Step 3: Processing Pending URLs", unit="url", disable=debug_mode)
-    for log_id, client_id, url_to_scrape in progress_bar:
-        progress_bar.set_postfix_str(f"{url_to_scrape[:50]}...")
-        # process_single_pending_url contains the logic for scraping, saving, and DB updates for one URL
-        process_single_pending_url(
-            log_id=log_id,
-            client_id=client_id,
-            url_to_scrape=url_to_scrape,
-            run_dir=run_dir,
-            scrape_session=scrape_session,
-            scrape_mode=scrape_mode,
-            debug_mode=debug_mode
-        )
+    try:
+        for log_id, client_id, url_to_scrape in progress_bar:
+            progress_bar.set_postfix_str(f"{url_to_scrape[:50]}...")
+            # process_single_pending_url contains the logic for scraping, saving, and DB updates for one URL
+            process_single_pending_url(
+                log_id=log_id,
+                client_id=client_id,
+                url_to_scrape=url_to_scrape,
+                run_dir=run_dir,
+                scrape_session=scrape_session,
+                scrape_mode=scrape_mode,
+                debug_mode=debug_mode
+            )
+    finally:
+        # The session buffers DB writes; flush them so processed URLs don't stay 'pending'
+        scrape_session.flush_db()
     logging.info(f"Finished processing batch of {len(pending_urls_data)} 'pending' URLs.")
 
 if __name__ == "__main__":